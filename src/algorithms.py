@@ -1,53 +1,142 @@
 import heapq
+import threading
 import time
+from array import array
+from collections import deque
+from batch import solve_batch
+from bitboard import Bitboard
+from components import Components
+from counters import Counters, CountingGraph, CountingQueue
+from distfield import DistanceField
+from graph import CSRGraph, GridGraph
+from hpa import HPAStar
+from jps import DIRECTIONS, JumpTable, jump
+from landmarks import Landmarks
+from lpastar import LPAStar
+from measure import measure, summarize
+from pqueue import choose_backend, make_queue
+from profiling import Profiler
+from solvecache import SolveCache, SolveResult
+from tracefile import TraceFile, write_trace
+from tracing import Replay, Trace, with_callback
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the vectorized solvers need it
+    np = None
+
+INF = float("inf")
+# Unreached marker in integer distance arrays, above any real path cost
+INT_INF = 2 ** 62
+
+
+def as_graph(n, edges, counters=None):
+    """Accept either a prebuilt graph or a (u, v, w) edge list.
+
+    Anything exposing neighbors(u) is used as-is, so callers that solve many
+    queries on one maze should build a CSRGraph once and pass it everywhere.
+    With counters, the graph is wrapped to count the edges examined.
+    """
+    graph = edges if hasattr(edges, "neighbors") else CSRGraph.from_edges(n, edges)
+    if counters is not None:
+        return CountingGraph(graph, counters)
+    return graph
+
+
+def distance_array(graph, n):
+    """Return (dist, unreached) for a search over graph.
+
+    Integer-weighted graphs get a compact int64 array with INT_INF as the
+    unreached marker; anything else gets a list of float("inf").
+    """
+    if hasattr(graph, "weight_range") and graph.weight_range()[2]:
+        return array("q", [INT_INF]) * n, INT_INF
+    return [INF] * n, INF
+
+
+def priority_queue(graph, n, backend=None, spread=1, integer_keys=True, counters=None):
+    """Create the priority queue for a search over graph.
+
+    With backend=None the queue is picked from the graph's weight range:
+    Dial's buckets for small integer weights, a radix heap for larger
+    integer weights and an indexed 4-ary heap otherwise. With counters,
+    the queue is wrapped to count its operations.
+    """
+    if hasattr(graph, "weight_range"):
+        lo, hi, integral = graph.weight_range()
+    else:
+        lo, hi, integral = 0, INF, False
+    if backend is None:
+        backend = choose_backend(lo, hi, integral and integer_keys, spread)
+    if backend == "dial":
+        queue = make_queue(backend, n, int(hi * spread))
+    else:
+        queue = make_queue(backend, n)
+    if counters is not None:
+        return CountingQueue(queue, counters)
+    return queue
+
+
+def reconstruct_path(parent, dst):
+    path = []
+    cur = dst
+    while cur is not None:
+        path.append(cur)
+        cur = parent[cur]
+    path.reverse()
+    return path
+
 
 class SPFA_Algorithms:
-    @staticmethod
-    def dijkstras(n, edges, src, dst, visualizer_callback=None, delay=0.05):
-        adj = {i: [] for i in range(n)}
+    """Shortest path solvers.
 
-        # edges: (u,v,w)
-        for u, v, w in edges:
-            adj[u].append((v, w))
+    Every solver takes the node count n and either an edge list of (u, v, w)
+    tuples or a prebuilt graph such as CSRGraph, and returns (path, visited).
+    Passing a counters.Counters as counters records the work done. trace
+    receives each expansion and push as it happens: a tracing.Trace records
+    them, a tracing.CellStates shows them. The old snapshot-style
+    visualizer_callback(visited, path) still works through
+    tracing.CallbackAdapter, but costs O(V) per expansion.
+    """
+    @staticmethod
+    def dijkstras(n, edges, src, dst, visualizer_callback=None, delay=0.05, queue=None, counters=None,
+                  trace=None):
+        trace = with_callback(trace, visualizer_callback, delay)
+        graph = as_graph(n, edges, counters)
 
-        dist = {i: float("inf") for i in range(n)}
-        parent = {i: None for i in range(n)}
+        dist, unreached = distance_array(graph, n)
+        parent = [None] * n
         visited = set()
 
         dist[src] = 0
-        pq = [(0, src)]
+        pq = priority_queue(graph, n, queue, counters=counters)
+        pq.push(src, 0)
 
         while pq:
-            cur_dist, node = heapq.heappop(pq)
+            cur_dist, node = pq.pop()
 
             if node == dst:
                 break  # we found the shortest path to the goal
 
-            if cur_dist > dist[node]:
-                continue
-
             visited.add(node)
+            if trace is not None:
+                trace.expand(node)
             
-            # Visualize current exploration
-            if visualizer_callback:
-                visualizer_callback(list(visited), [])
-                time.sleep(delay)
-
-            for neigh, w in adj[node]:
+            for neigh, w in graph.neighbors(node):
                 new_dist = cur_dist + w
                 if new_dist < dist[neigh]:
                     dist[neigh] = new_dist
                     parent[neigh] = node
-                    heapq.heappush(pq, (new_dist, neigh))
+                    pq.push(neigh, new_dist)
+                    if counters is not None:
+                        counters.improved += 1
+                    if trace is not None:
+                        trace.push(neigh)
 
-        # reconstruct path
-        path = []
-        cur = dst
-        while cur is not None:
-            path.append(cur)
-            cur = parent[cur]
+        if dist[dst] == unreached:
+            return [], visited
 
-        path.reverse()
+        path = reconstruct_path(parent, dst)
         
         # Final visualization with path
         if visualizer_callback:
@@ -56,48 +145,122 @@ class SPFA_Algorithms:
         return path, visited  # return both path and visited nodes
     
     @staticmethod
-    def bellman_ford(n, edges, src, dst, visualizer_callback=None, delay=0.05):
-    
-        dist = {i: float("inf") for i in range(n)}
-        parent = {i: None for i in range(n)}
+    def bidirectional_dijkstra(n, edges, src, dst, visualizer_callback=None, delay=0.05, queue=None,
+                               counters=None, trace=None):
+        """Dijkstra grown from both ends at once.
+
+        The backward search runs on the reversed graph. Every relaxation
+        updates the best known src-dst distance through the relaxed node,
+        and the search stops once the two queue heads sum to at least that
+        distance, since no unexplored path can then be shorter.
+        """
+        trace = with_callback(trace, visualizer_callback, delay)
+        graph = as_graph(n, edges, counters)
+        graphs = (graph, graph.reversed())
+
+        dist_f, unreached = distance_array(graph, n)
+        dist = (dist_f, distance_array(graph, n)[0])
+        parent = ([None] * n, [None] * n)
+        visited = set()
+
+        dist[0][src] = 0
+        dist[1][dst] = 0
+        pqs = (priority_queue(graph, n, queue, counters=counters),
+               priority_queue(graph, n, queue, counters=counters))
+        pqs[0].push(src, 0)
+        pqs[1].push(dst, 0)
+        best = 0 if src == dst else INF
+        meet = src if src == dst else None
+
+        while pqs[0] and pqs[1]:
+            head_f, head_b = pqs[0].min_key(), pqs[1].min_key()
+            if head_f + head_b >= best:
+                break  # meeting condition: nothing left can beat best
+
+            # Expand the side whose next node is closer
+            side = 0 if head_f <= head_b else 1
+            cur_dist, node = pqs[side].pop()
+            my_dist = dist[side]
+
+            visited.add(node)
+            if trace is not None:
+                trace.expand(node)
+
+            other_dist = dist[1 - side]
+            for neigh, w in graphs[side].neighbors(node):
+                new_dist = cur_dist + w
+                if new_dist < my_dist[neigh]:
+                    my_dist[neigh] = new_dist
+                    parent[side][neigh] = node
+                    pqs[side].push(neigh, new_dist)
+                    if counters is not None:
+                        counters.improved += 1
+                    if trace is not None:
+                        trace.push(neigh)
+                    if other_dist[neigh] != unreached and new_dist + other_dist[neigh] < best:
+                        best = new_dist + other_dist[neigh]
+                        meet = neigh
+
+        if meet is None:
+            return [], visited
+
+        # Join the two half paths at the meeting node
+        path = reconstruct_path(parent[0], meet)
+        cur = parent[1][meet]
+        while cur is not None:
+            path.append(cur)
+            cur = parent[1][cur]
+
+        # Final visualization with path
+        if visualizer_callback:
+            visualizer_callback(list(visited), path)
+
+        return path, visited
+
+    @staticmethod
+    def bellman_ford(n, edges, src, dst, visualizer_callback=None, delay=0.05, counters=None, trace=None):
+        trace = with_callback(trace, visualizer_callback, delay)
+        graph = as_graph(n, edges, counters)
+
+        dist, unreached = distance_array(graph, n)
+        parent = [None] * n
         dist[src] = 0
         visited = set([src])
 
         # Relax edges n-1 times
         for iteration in range(n - 1):
+            if counters is not None:
+                counters.rounds += 1
             updated = False
-            for u, v, w in edges:
-                if dist[u] != float("inf") and dist[u] + w < dist[v]:
-                    dist[v] = dist[u] + w
-                    parent[v] = u
-                    visited.add(v)
-                    updated = True
-                    
-                    # Visualize current exploration
-                    if visualizer_callback:
-                        visualizer_callback(list(visited), [])
-                        time.sleep(delay)
+            for u in range(n):
+                du = dist[u]
+                if du == unreached:
+                    continue
+                for v, w in graph.neighbors(u):
+                    if du + w < dist[v]:
+                        dist[v] = du + w
+                        parent[v] = u
+                        visited.add(v)
+                        updated = True
+                        if counters is not None:
+                            counters.improved += 1
+                        if trace is not None:
+                            trace.expand(v)
             
             if not updated:
                 break  # No more updates, can exit early
 
         # Check for negative weight cycles
-        for u, v, w in edges:
-            if dist[u] != float("inf") and dist[u] + w < dist[v]:
+        for u, v, w in graph.edges():
+            if dist[u] != unreached and dist[u] + w < dist[v]:
                 print("Warning: Negative weight cycle detected!")
                 return [], set()
 
         # Check if destination is reachable
-        if dist[dst] == float("inf"):
+        if dist[dst] == unreached:
             return [], visited
             
-        # Reconstruct path
-        path = []
-        cur = dst
-        while cur is not None:
-            path.append(cur)
-            cur = parent[cur]
-        path.reverse()
+        path = reconstruct_path(parent, dst)
         
         # Final visualization with path
         if visualizer_callback:
@@ -106,52 +269,218 @@ class SPFA_Algorithms:
         return path, visited
     
     @staticmethod
-    def a_star(n, edges, src, dst, heuristic, visualizer_callback=None, delay=0.05):
+    def bellman_ford_vectorized(n, edges, src, dst, visualizer_callback=None, delay=0.05, counters=None,
+                                trace=None):
+        """Bellman-Ford with each relaxation round done as NumPy array operations.
+
+        A round gathers dist[u] + w over the out-edges of the nodes that
+        changed in the previous round, then scatter-mins the candidates into
+        dist[v]. Rounds are synchronous, so after k rounds dist is exact for
+        paths of at most k edges; a node still improving in round n means a
+        negative cycle. Same (path, visited) contract as bellman_ford.
+        """
+        trace = with_callback(trace, visualizer_callback, delay)
+        if np is None:
+            raise RuntimeError("bellman_ford_vectorized requires NumPy")
+
+        graph = as_graph(n, edges)
+        if not hasattr(graph, "numpy_arrays"):
+            graph = CSRGraph.from_edges(n, list(graph.edges()))
+        offsets, targets, weights = graph.numpy_arrays()
+
+        dist = np.full(n, np.inf)
+        parent = np.full(n, -1, dtype=np.int64)
+        reached = np.zeros(n, dtype=bool)
+        dist[src] = 0
+        reached[src] = True
+        active = np.array([src], dtype=np.int64)
+
+        for iteration in range(n):
+            # Edge indices of every out-edge of the active nodes (CSR ranges)
+            starts = offsets[active]
+            counts = offsets[active + 1] - starts
+            total = int(counts.sum())
+            if total == 0:
+                break
+            run_starts = np.cumsum(counts) - counts
+            idx = np.arange(total) + np.repeat(starts - run_starts, counts)
+
+            u = np.repeat(active, counts)
+            v = targets[idx]
+            cand = dist[u] + (1.0 if weights is None else weights[idx])
+
+            better = cand < dist[v]
+            if counters is not None:
+                counters.rounds += 1
+                counters.relaxations += total
+                counters.frontier(len(active))
+            if not better.any():
+                break
+            u, v, cand = u[better], v[better], cand[better]
+
+            # Scatter-min: keep the smallest candidate per target node
+            order = np.lexsort((cand, v))
+            v_sorted = v[order]
+            first = np.ones(len(order), dtype=bool)
+            first[1:] = v_sorted[1:] != v_sorted[:-1]
+            best = order[first]
+
+            active = v[best]
+            if counters is not None:
+                counters.improved += len(active)
+            if trace is not None:
+                trace.expand_all(active.tolist())
+            dist[active] = cand[best]
+            parent[active] = u[best]
+            reached[active] = True
+        else:
+            if n > 0:
+                print("Warning: Negative weight cycle detected!")
+                return [], set()
+
+        visited = set(np.flatnonzero(reached).tolist())
+
+        # Check if destination is reachable
+        if dist[dst] == np.inf:
+            return [], visited
+
+        parent_list = [None if p < 0 else p for p in parent.tolist()]
+        path = reconstruct_path(parent_list, dst)
+
+        # Final visualization with path
+        if visualizer_callback:
+            visualizer_callback(list(visited), path)
+
+        return path, visited
+
+    @staticmethod
+    def spfa(n, edges, src, dst, visualizer_callback=None, delay=0.05, slf=False, lll=False, counters=None,
+             trace=None):
+        """Shortest Path Faster Algorithm (queue-based Bellman-Ford).
+
+        Only nodes whose distance just dropped are queued, and an in-queue
+        bitmap keeps each node in the queue at most once. slf enables
+        Small-Label-First (a node that beats the queue head is pushed to the
+        front) and lll enables Large-Label-Last (a head above the queue's
+        mean label is rotated to the back). A negative cycle is reported
+        when a shortest path would need n or more edges.
+        """
+        trace = with_callback(trace, visualizer_callback, delay)
+        graph = as_graph(n, edges, counters)
+
+        dist, unreached = distance_array(graph, n)
+        parent = [None] * n
+        hops = [0] * n  # edges on the current best path to each node
+        in_queue = bytearray(n)
+        visited = set([src])
+
+        dist[src] = 0
+        q = deque([src])
+        in_queue[src] = 1
+        queued_sum = 0  # sum of dist over queued nodes, for LLL
+        if counters is not None:
+            counters.pushes += 1
+
+        while q:
+            if counters is not None:
+                counters.pops += 1
+                counters.frontier(len(q))
+            node = q.popleft()
+            if lll:
+                # Rotate heads with above-average labels to the back (bounded to one pass)
+                for _ in range(len(q)):
+                    if dist[node] * (len(q) + 1) <= queued_sum:
+                        break
+                    q.append(node)
+                    node = q.popleft()
+                queued_sum -= dist[node]
+            in_queue[node] = 0
+            if trace is not None:
+                trace.expand(node)
+
+            d = dist[node]
+            for neigh, w in graph.neighbors(node):
+                new_dist = d + w
+                if new_dist < dist[neigh]:
+                    if in_queue[neigh] and lll:
+                        queued_sum += new_dist - dist[neigh]
+                    dist[neigh] = new_dist
+                    parent[neigh] = node
+                    hops[neigh] = hops[node] + 1
+                    visited.add(neigh)
+                    if counters is not None:
+                        counters.improved += 1
+
+                    if hops[neigh] >= n:
+                        print("Warning: Negative weight cycle detected!")
+                        return [], set()
+
+                    if not in_queue[neigh]:
+                        in_queue[neigh] = 1
+                        if counters is not None:
+                            counters.pushes += 1
+                        if trace is not None:
+                            trace.push(neigh)
+                        if lll:
+                            queued_sum += new_dist
+                        if slf and q and new_dist < dist[q[0]]:
+                            q.appendleft(neigh)
+                        else:
+                            q.append(neigh)
+
+        if dist[dst] == unreached:
+            return [], visited
 
-        adj = {i: [] for i in range(n)}
-        for u, v, w in edges:
-            adj[u].append((v, w))
+        path = reconstruct_path(parent, dst)
 
-        g_score = {i: float("inf") for i in range(n)}
-        f_score = {i: float("inf") for i in range(n)}
-        parent = {i: None for i in range(n)}
+        # Final visualization with path
+        if visualizer_callback:
+            visualizer_callback(list(visited), path)
+
+        return path, visited
+
+    @staticmethod
+    def a_star(n, edges, src, dst, heuristic, visualizer_callback=None, delay=0.05, queue=None, counters=None,
+               trace=None):
+        trace = with_callback(trace, visualizer_callback, delay)
+        graph = as_graph(n, edges, counters)
+
+        g_score, unreached = distance_array(graph, n)
+        parent = [None] * n
         visited = set()
 
         g_score[src] = 0
-        f_score[src] = heuristic(src)
 
-        pq = [(f_score[src], src)]
+        # f can rise by up to twice the edge weight per step with a consistent heuristic
+        h_src = heuristic(src)
+        pq = priority_queue(graph, n, queue, spread=2, integer_keys=isinstance(h_src, int), counters=counters)
+        pq.push(src, h_src)
 
         while pq:
-            _, current = heapq.heappop(pq)
+            _, current = pq.pop()
 
             if current == dst:
                 break
 
             visited.add(current)
+            if trace is not None:
+                trace.expand(current)
             
-            # Visualize current exploration
-            if visualizer_callback:
-                visualizer_callback(list(visited), [])
-                time.sleep(delay)
-
-            for neighbor, w in adj[current]:
+            for neighbor, w in graph.neighbors(current):
                 tentative_g = g_score[current] + w
                 if tentative_g < g_score[neighbor]:
                     g_score[neighbor] = tentative_g
-                    f_score[neighbor] = tentative_g + heuristic(neighbor)
                     parent[neighbor] = current
-                    heapq.heappush(pq, (f_score[neighbor], neighbor))
+                    pq.push(neighbor, tentative_g + heuristic(neighbor))
+                    if counters is not None:
+                        counters.improved += 1
+                    if trace is not None:
+                        trace.push(neighbor)
 
-        if g_score[dst] == float("inf"):
+        if g_score[dst] == unreached:
             return [], visited
 
-        path = []
-        cur = dst
-        while cur is not None:
-            path.append(cur)
-            cur = parent[cur]
-        path.reverse()
+        path = reconstruct_path(parent, dst)
         
         # Final visualization with path
         if visualizer_callback:
@@ -160,91 +489,301 @@ class SPFA_Algorithms:
         return path, visited
 
     @staticmethod
-    def bfs(n, edges, src, dst, visualizer_callback=None, delay=0.05):
-        # Build adjacency
-        adj = {i: [] for i in range(n)}
-        for u, v, w in edges:
-            adj[u].append((v, w))
+    def jump_point_search(grid, src, dst, jump_table=None, visualizer_callback=None, delay=0.05, counters=None,
+                          trace=None):
+        """A* over jump points on a 4-connected uniform-cost grid.
+
+        grid is a GridGraph (a maze list is converted). Only jump points are
+        pushed and expanded, and the straight segments between them are
+        filled back in so the returned path lists every cell. Passing a
+        jps.JumpTable replaces the scans with table lookups (JPS+).
+        """
+        trace = with_callback(trace, visualizer_callback, delay)
+        if not isinstance(grid, GridGraph):
+            grid = GridGraph.from_maze(grid)
+        if grid.cells[src] or grid.cells[dst]:
+            return [], set()  # the jump scans only check the cells they step onto
+        cols = grid.cols
+        if jump_table is not None:
+            jump_fn = jump_table.jump
+        else:
+            jump_fn = lambda r, c, dr, dc, goal: jump(grid, r, c, dr, dc, goal)
+
+        gr, gc = divmod(dst, cols)
+        g_score = {src: 0}
+        parent = {src: None}
+        visited = set()
+        pq = [(0, src)]
+        if counters is not None:
+            counters.pushes += 1
+
+        while pq:
+            if counters is not None:
+                counters.pops += 1
+            _, current = heapq.heappop(pq)
+
+            if current == dst:
+                break
+
+            if current in visited:
+                if counters is not None:
+                    counters.stale_pops += 1
+                continue  # stale queue entry
+
+            visited.add(current)
+            if trace is not None:
+                trace.expand(current)
+
+            r, c = divmod(current, cols)
+            prev = parent[current]
+            if prev is None:
+                directions = DIRECTIONS
+            else:
+                # Never scan back towards the jump point we came from
+                pr, pc = divmod(prev, cols)
+                back = ((pr > r) - (pr < r), (pc > c) - (pc < c))
+                directions = [d for d in DIRECTIONS if d != back]
+
+            g = g_score[current]
+            if counters is not None:
+                counters.relaxations += len(directions)  # one jump scan each
+            for dr, dc in directions:
+                nxt = jump_fn(r, c, dr, dc, dst)
+                if nxt is None:
+                    continue
+                nr, nc = divmod(nxt, cols)
+                tentative_g = g + abs(nr - r) + abs(nc - c)
+                if tentative_g < g_score.get(nxt, INF):
+                    g_score[nxt] = tentative_g
+                    parent[nxt] = current
+                    heapq.heappush(pq, (tentative_g + abs(nr - gr) + abs(nc - gc), nxt))
+                    if counters is not None:
+                        counters.improved += 1
+                        counters.pushes += 1
+                        counters.frontier(len(pq))
+                    if trace is not None:
+                        trace.push(nxt)
+
+        if dst not in g_score:
+            return [], visited
+
+        # Fill in the straight runs between consecutive jump points
+        jump_points = reconstruct_path(parent, dst)
+        path = [jump_points[0]]
+        for a, b in zip(jump_points, jump_points[1:]):
+            if a // cols == b // cols:
+                step = 1 if b > a else -1
+            else:
+                step = cols if b > a else -cols
+            path.extend(range(a + step, b + step, step))
+
+        # Final visualization with path
+        if visualizer_callback:
+            visualizer_callback(list(visited), path)
+
+        return path, visited
+
+    @staticmethod
+    def bfs(n, edges, src, dst, visualizer_callback=None, delay=0.05, counters=None, trace=None):
+        trace = with_callback(trace, visualizer_callback, delay)
+        graph = as_graph(n, edges, counters)
 
-        from collections import deque
         q = deque([src])
-        parent = {i: None for i in range(n)}
+        parent = [None] * n
         visited = set([src])
+        if counters is not None:
+            counters.pushes += 1
+            counters.frontier(1)
 
         while q:
+            if counters is not None:
+                counters.pops += 1
             node = q.popleft()
             if node == dst:
                 break
+            if trace is not None:
+                trace.expand(node)
 
-            # visualize
-            if visualizer_callback:
-                visualizer_callback(list(visited), [])
-                time.sleep(delay)
-
-            for neigh, _ in adj[node]:
+            for neigh, _ in graph.neighbors(node):
                 if neigh not in visited:
                     visited.add(neigh)
                     parent[neigh] = node
                     q.append(neigh)
+                    if counters is not None:
+                        counters.pushes += 1
+                        counters.improved += 1
+                        counters.frontier(len(q))
+                    if trace is not None:
+                        trace.push(neigh)
 
         if dst not in visited:
             return [], visited
 
-        # reconstruct
-        path = []
-        cur = dst
+        path = reconstruct_path(parent, dst)
+
+        if visualizer_callback:
+            visualizer_callback(list(visited), path)
+
+        return path, visited
+
+    @staticmethod
+    def bidirectional_bfs(n, edges, src, dst, visualizer_callback=None, delay=0.05, counters=None, trace=None):
+        """BFS grown one layer at a time from whichever end has the smaller frontier.
+
+        When a layer discovers nodes already reached from the other end, the
+        rest of that layer is still scanned and the meeting node with the
+        smallest combined depth is kept, which makes the path shortest.
+        """
+        trace = with_callback(trace, visualizer_callback, delay)
+        graph = as_graph(n, edges, counters)
+        graphs = (graph, graph.reversed())
+
+        depth = ([-1] * n, [-1] * n)
+        parent = ([None] * n, [None] * n)
+        depth[0][src] = 0
+        depth[1][dst] = 0
+        frontiers = ([src], [dst])
+        visited = set([src, dst])
+        meet = src if src == dst else None
+        best = 0 if src == dst else INF
+        if counters is not None:
+            counters.pushes += len(visited)
+
+        while meet is None and frontiers[0] and frontiers[1]:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            my_depth, other_depth = depth[side], depth[1 - side]
+            next_frontier = []
+            if counters is not None:
+                counters.rounds += 1
+                counters.pops += len(frontiers[side])
+                counters.frontier(len(frontiers[0]) + len(frontiers[1]))
+
+            for node in frontiers[side]:
+                if trace is not None:
+                    trace.expand(node)
+                d = my_depth[node] + 1
+                for neigh, _ in graphs[side].neighbors(node):
+                    if my_depth[neigh] >= 0:
+                        continue
+                    my_depth[neigh] = d
+                    parent[side][neigh] = node
+                    visited.add(neigh)
+                    next_frontier.append(neigh)
+                    if counters is not None:
+                        counters.pushes += 1
+                        counters.improved += 1
+                    if trace is not None:
+                        trace.push(neigh)
+                    if other_depth[neigh] >= 0 and d + other_depth[neigh] < best:
+                        best = d + other_depth[neigh]
+                        meet = neigh
+
+            frontiers = (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+
+        if meet is None:
+            return [], visited
+
+        # Join the two half paths at the meeting node
+        path = reconstruct_path(parent[0], meet)
+        cur = parent[1][meet]
         while cur is not None:
             path.append(cur)
-            cur = parent[cur]
-        path.reverse()
+            cur = parent[1][cur]
 
         if visualizer_callback:
             visualizer_callback(list(visited), path)
 
         return path, visited
-    @staticmethod 
-    def dfs(n, edges, src, dst, visualizer_callback=None, delay=0.05):
-        # Build adjacency list
-        adj = {i: [] for i in range(n)}
-        for u, v, w in edges:
-            if w == float('inf'):
-                continue  # ignore walls
-            adj[u].append(v)
 
-        visited = set()
-        parent = {i: None for i in range(n)}
+    @staticmethod
+    def bitboard_bfs(grid, src, dst, bitboard=None, visualizer_callback=None, delay=0.05, counters=None,
+                     trace=None):
+        """Unweighted BFS that expands whole layers with big-int shifts.
 
-        def _dfs(node):
-            visited.add(node)
+        grid is a GridGraph (a maze list is converted); pass a prebuilt
+        Bitboard to reuse it across queries. Walls and terrain costs are
+        read from the grid, but every step counts as 1 like bfs. Counters
+        see one round per layer and the layer sizes as the frontier.
+        """
+        trace = with_callback(trace, visualizer_callback, delay)
+        if bitboard is None:
+            if not isinstance(grid, GridGraph):
+                grid = GridGraph.from_maze(grid)
+            bitboard = Bitboard(grid)
 
-            if visualizer_callback:
-                visualizer_callback(list(visited), [])
-                time.sleep(delay)
+        on_layer = None
+        if counters is not None or trace is not None:
+            previous = [0]
 
-            if node == dst:
-                return True  # found destination
+            def on_layer(seen):
+                layer = seen & ~previous[0]
+                if counters is not None:
+                    size = layer.bit_count()
+                    counters.rounds += 1
+                    counters.pushes += size
+                    counters.improved += size - (not previous[0])  # the first layer holds src too
+                    counters.frontier(size)
+                previous[0] = seen
+                if trace is not None:
+                    trace.expand_all(bitboard.nodes(layer))
+
+        path, seen = bitboard.search(src, dst, on_layer)
+        visited = set(bitboard.nodes(seen))
+
+        if visualizer_callback and path:
+            visualizer_callback(list(visited), path)
+
+        return path, visited
 
-            for neigh in adj[node]:
+    @staticmethod 
+    def dfs(n, edges, src, dst, visualizer_callback=None, delay=0.05, counters=None, trace=None):
+        trace = with_callback(trace, visualizer_callback, delay)
+        graph = as_graph(n, edges, counters)
+
+        visited = {src}
+        parent = [None] * n
+        if trace is not None:
+            trace.expand(src)
+
+        # Explicit stack of (node, remaining neighbours) so deep mazes can't hit the recursion limit
+        found = src == dst
+        stack = [(src, iter(graph.neighbors(src)))]
+        if counters is not None:
+            counters.pushes += 1
+            counters.frontier(1)
+        while stack and not found:
+            node, neighbors = stack[-1]
+            for neigh, w in neighbors:
+                if w == INF:
+                    continue  # ignore walls
                 if neigh not in visited:
                     parent[neigh] = node
-                    if _dfs(neigh):
-                        return True
+                    visited.add(neigh)
+                    if counters is not None:
+                        counters.improved += 1
+                    if trace is not None:
+                        trace.expand(neigh)
 
-            return False  # backtrack
+                    if neigh == dst:
+                        found = True  # found destination
+                    else:
+                        stack.append((neigh, iter(graph.neighbors(neigh))))
+                        if counters is not None:
+                            counters.pushes += 1
+                            counters.frontier(len(stack))
+                    break
+            else:
+                stack.pop()  # backtrack
+                if counters is not None:
+                    counters.pops += 1
 
-        # run dfs
-        found = _dfs(src)
+        if counters is not None:
+            counters.max_depth = max(counters.max_depth, counters.peak_frontier)
 
         if not found:
             return [], visited
 
-        # reconstruct path
-        path = []
-        cur = dst
-        while cur is not None:
-            path.append(cur)
-            cur = parent[cur]
-        path.reverse()
+        path = reconstruct_path(parent, dst)
 
         if visualizer_callback:
             visualizer_callback(list(visited), path)
@@ -253,144 +792,595 @@ class SPFA_Algorithms:
 
 class PathFinder:
     """Handles pathfinding algorithms"""
-    def __init__(self, visualizer, maze_state):
+    # Graph backends: "csr" materializes the adjacency once per maze version,
+    # "grid" computes neighbours on the fly from a one-byte-per-cell buffer
+    GRAPH_BACKENDS = {"csr": CSRGraph, "grid": GridGraph}
+    # Every name _run_algorithm accepts
+    ALGORITHMS = ("Dijkstra", "A*", "ALT", "JPS", "Bellman-Ford", "SPFA", "DFS", "BFS",
+                  "Bi-Dijkstra", "Bi-BFS", "Bit-BFS", "LPA*", "HPA*")
+    # Settings that change a solve's result or its timing; part of every solve cache key
+    SETTINGS = ("backend", "vectorized_bellman_ford", "spfa_slf", "spfa_lll", "use_jps_plus",
+                "alt_landmarks", "hpa_cluster_size", "timing_warmup", "timing_repeats", "timing_budget",
+                "measure_memory", "count_operations")
+
+    def __init__(self, visualizer, maze_state, backend="csr"):
+        if backend not in self.GRAPH_BACKENDS:
+            raise ValueError(f"Unknown graph backend: {backend}")
         self.viz = visualizer
         self.maze_state = maze_state
+        self.backend = backend
         self.is_computing = False
+        # Held while compute_path or live_replan use the planner and maze_state.cells
+        self.lock = threading.Lock()
+        # Run "Bellman-Ford" as batched NumPy relaxation rounds when NumPy is installed
+        self.vectorized_bellman_ford = np is not None
+        # Queue disciplines used by the "SPFA" algorithm
+        self.spfa_slf = True
+        self.spfa_lll = False
+        # Precompute JPS+ jump tables for "JPS" (rebuilt once per maze version)
+        self.use_jps_plus = False
+        # Data derived from the maze (graphs, tables), as {name: ((maze version, key), value)}
+        self._derived = {}
+        # Number of ALT landmarks for "ALT" (tables rebuilt once per maze version)
+        self.alt_landmarks = 8
+        # Finished solves by (fingerprint, rows, cols, src, dst, algorithm, settings)
+        self.use_solve_cache = True
+        self.solve_cache = SolveCache()
+        # Incremental LPA* planner, repaired from MazeState.cell_edits between solves
+        self.planner = None
+        # HPA* cluster abstraction for "HPA*"; edits drop only the clusters they touch
+        self.hpa = None
+        self.hpa_cluster_size = 16
+        # Connected components of open cells, to reject unreachable goals before searching
+        self.reject_unreachable = True
+        self.components = None
+        self._live_stamp = None
+        # Timing: untimed warm-up runs, then up to timing_repeats timed runs within
+        # timing_budget seconds, plus one tracemalloc run for the memory peak
+        self.timing_warmup = 1
+        self.timing_repeats = 5
+        self.timing_budget = 1.0
+        self.measure_memory = True
+        # One extra instrumented run per timing, stored as the record's "counters"
+        self.count_operations = False
+        # Per-phase spans of compute_path (off until profiler.enabled is set)
+        self.profiler = Profiler()
+        # Animation of the last solve's trace, valid while the maze and endpoints stay put
+        self.replay = None
+        self.replay_label = None  # algorithm that produced the replayed trace
+        self._replay_stamp = None
+    
+    def settings(self):
+        """Current values of SETTINGS, as a tuple"""
+        return tuple(getattr(self, name) for name in self.SETTINGS)
+
+    def _cached(self, name, build, key=None):
+        """Return derived maze data, rebuilding it only when the maze version or key changes"""
+        stamp = (self.maze_state.version, key)
+        entry = self._derived.get(name)
+        if entry is None or entry[0] != stamp:
+            entry = (stamp, build())
+            self._derived[name] = entry
+        return entry[1]
+    
+    def _peek_cached(self, name, key=None):
+        """Return derived maze data if it is still current, without building it"""
+        entry = self._derived.get(name)
+        if entry is not None and entry[0] == (self.maze_state.version, key):
+            return entry[1]
+        return None
+    
+    def _costs(self):
+        """Terrain cost layer, or None when every cell costs 1"""
+        return self.maze_state.costs if self.maze_state.is_weighted() else None
+    
+    def get_graph(self):
+        """Return the shared graph for the current maze"""
+        backend = self.GRAPH_BACKENDS[self.backend]
+        return self._cached(("graph", self.backend),
+                            lambda: backend.from_maze(self.maze_state.maze, self._costs()))
+    
+    def get_grid(self):
+        """Return the implicit grid graph for the current maze"""
+        if self.backend == "grid":
+            return self.get_graph()
+        return self._cached(("graph", "grid"),
+                            lambda: GridGraph.from_maze(self.maze_state.maze, self._costs()))
+    
+    def set_grid(self, grid):
+        """Use grid (e.g. one over shared memory) as the current maze's grid graph"""
+        self._derived[("graph", "grid")] = ((self.maze_state.version, None), grid)
+    
+    def get_bitboard(self):
+        """Return the open-cell bitboard for the current maze"""
+        return self._cached("bitboard", lambda: Bitboard(self.get_grid()))
+    
+    def get_jump_table(self):
+        """Return the JPS+ jump table for the current maze"""
+        return self._cached("jump_table", lambda: JumpTable(self.get_grid()))
+    
+    def get_landmarks(self):
+        """Return the ALT landmark tables for the current maze"""
+        return self._cached("landmarks", lambda: Landmarks(self.get_graph(), self.alt_landmarks),
+                            key=self.alt_landmarks)
+    
+    def get_distance_field(self, goal):
+        """Return the distance field rooted at goal for the current maze"""
+        return self._cached("distance_field", lambda: DistanceField(self.get_graph(), goal), key=goal)
+    
+    def follow_distance_field(self):
+        """Show the path from the current start by descending a cached distance field.
+
+        Only uses a field already built for the current maze and goal (the
+        compute thread builds it at the end of each successful compute_path),
+        so it never searches on the calling thread. Returns True if the path
+        was updated.
+        """
+        state = self.maze_state
+        if self.is_computing or state.start is None or state.end is None:
+            return False
+        field = self._peek_cached("distance_field", key=self.viz.id_from_coord(*state.end))
+        if field is None:
+            return False
+        path_ids = field.path_from(self.viz.id_from_coord(*state.start))
+        state.cells.show((), path_ids)
+        return True
+    
+    def _sync_incremental(self, current, build):
+        """Bring an incremental structure (LPA*, HPA*) up to date with the maze.
+
+        Single-cell edits since current.version are replayed through its
+        update_cell(); if current is None or the edit log does not cover
+        the gap (clear, presets), build() makes a fresh one instead.
+        """
+        state = self.maze_state
+        if current is not None:
+            edits = [(r, c) for v, r, c in state.cell_edits if v > current.version]
+            if current.version + len(edits) == state.version:
+                for r, c in edits:
+                    u = r * state.cols + c
+                    current.update_cell(u, state.maze[r][c], state.costs[u])
+                current.version = state.version
+                return current
+        current = build()
+        current.version = state.version
+        return current
+    
+    def get_planner(self):
+        """Return the LPA* planner for the current start and goal, synced to the maze.
+
+        A new start or goal starts a fresh planner.
+        """
+        state = self.maze_state
+        start = self.viz.id_from_coord(*state.start)
+        goal = self.viz.id_from_coord(*state.end)
+        planner = self.planner
+        if planner is not None and (planner.start, planner.goal) != (start, goal):
+            planner = None
+        self.planner = self._sync_incremental(
+            planner, lambda: LPAStar.from_maze(state.maze, state.costs, start, goal))
+        return self.planner
+    
+    def get_hpa(self):
+        """Return the HPA* abstraction of the current maze, synced to the maze"""
+        state = self.maze_state
+        hpa = self.hpa
+        if hpa is not None and hpa.size != self.hpa_cluster_size:
+            hpa = None
+        self.hpa = self._sync_incremental(
+            hpa, lambda: HPAStar.from_maze(state.maze, state.costs, self.hpa_cluster_size))
+        return self.hpa
+    
+    def get_components(self):
+        """Return the connected-component index of the current maze"""
+        self.components = self._sync_incremental(
+            self.components, lambda: Components.from_maze(self.maze_state.maze))
+        return self.components
+    
+    def solve_batch(self, pairs, return_paths=False):
+        """Solve many (src, dst) node-id pairs on the current maze, without the UI.
+
+        Shares the cached graph and component index with compute_path and
+        returns a batch.BatchResult (lengths, optional paths, throughput).
+        """
+        components = self.get_components() if self.reject_unreachable else None
+        return solve_batch(self.get_graph(), pairs, components, return_paths)
+    
+    def live_replan(self):
+        """Repair the LPA* plan after edits and show it ("live solve" mode).
+
+        Does no search while another computation runs or when neither the
+        maze nor the endpoints changed since the last call. Returns True if
+        the plan was repaired.
+        """
+        state = self.maze_state
+        if self.is_computing or state.start is None or state.end is None:
+            return False
+        if not self.lock.acquire(blocking=False):
+            return False  # compute_path has the planner and cells
+        try:
+            stamp = (state.version, state.start, state.end)
+            if stamp == self._live_stamp:
+                # Plan is current, but results may have been cleared (e.g. by set_start)
+                if not state.cells.path:
+                    state.cells.show(self.planner.expanded, self.planner.path())
+                return False
+            self._live_stamp = stamp
+            state.cells.clear()
+            t0 = time.perf_counter()
+            path_ids, visited_ids = self._run_algorithm("LPA*", None, None, None, None, delay=0,
+                                                        trace=state.cells)
+            elapsed = time.perf_counter() - t0
+            state.cells.finish(path_ids)
+            state.timings["LPA*"] = summarize([elapsed], len(visited_ids))
+            return True
+        finally:
+            self.lock.release()
+    
+    def start_replay(self, trace, delay, label=None):
+        """Animate a recorded trace, one event per delay seconds (delay <= 0 shows the end at once)"""
+        state = self.maze_state
+        self.replay_label = label
+        replay = Replay(trace, state.rows * state.cols, delay)
+        if delay <= 0:
+            replay.seek(len(trace))
+        self._replay_stamp = (state.version, state.start, state.end)
+        self.replay = replay
+        self._show_replay()
+    
+    def save_trace(self, filename):
+        """Write the replayed trace, with the maze it ran on, as a trace file (see tracefile.py)"""
+        replay = self._live_replay()
+        if replay is None:
+            raise ValueError("No trace to save")
+        state, cell_id = self.maze_state, self.viz.id_from_coord
+        meta = {"algorithm": self.replay_label, "timing": state.timings.get(self.replay_label)}
+        write_trace(filename, replay.trace, state.rows, state.cols, start=cell_id(*state.start),
+                    end=cell_id(*state.end), maze=state.maze, costs=state.costs, meta=meta)
+
+    def load_trace(self, filename, delay):
+        """Replay a trace file made on a maze of this size; its maze replaces the current one"""
+        trace = TraceFile(filename)
+        state = self.maze_state
+        if (trace.rows, trace.cols) != (state.rows, state.cols):
+            trace.close()
+            raise ValueError(f"Trace is for a {trace.rows}x{trace.cols} maze")
+        stored = trace.maze()
+        if stored is not None:
+            state.load(*stored)
+        state.start = self.viz.coord_from_id(trace.start)
+        state.end = self.viz.coord_from_id(trace.end)
+        self.viz.maze, self.viz.start, self.viz.goal = state.maze, state.start, state.end
+        label = trace.meta.get("algorithm")
+        if label and trace.meta.get("timing"):
+            state.timings[label] = trace.meta["timing"]
+        self.start_replay(trace, delay, label)
+
+    def _live_replay(self):
+        """The replay, or None once the maze or endpoints changed under it"""
+        state = self.maze_state
+        if self.replay is not None and (state.version, state.start, state.end) != self._replay_stamp:
+            self.replay = None
+        return self.replay
+    
+    def advance_replay(self, dt):
+        """Play the replay forward by dt seconds; returns True if the grid changed"""
+        replay = self._live_replay()
+        if replay is None:
+            return False
+        was_done = replay.done
+        changed = replay.advance(dt)
+        if changed or replay.done != was_done:
+            self._show_replay(changed)
+            return True
+        return False
+    
+    def seek_replay(self, position):
+        """Jump the replay to event position, backwards or forwards"""
+        replay = self._live_replay()
+        if replay is None:
+            return False
+        was_done = replay.done
+        changed = replay.seek(position)
+        if changed or replay.done != was_done:
+            self._show_replay(changed)
+        return True
+    
+    def _show_replay(self, changed=None):
+        """Copy the replay's cell states to the display buffer (only the changed ids, if given)"""
+        replay, cells = self.replay, self.maze_state.cells
+        if changed is None:
+            cells.load(replay.state)
+        else:
+            for u in changed:
+                cells.set(u, replay.state[u])
+            # The path covers its cells only while the replay is at the end
+            for u in cells.path:
+                cells.set(u, replay.state[u])
+            cells.path = []
+        if replay.done:
+            cells.finish(replay.path())
     
     def visualize_step(self, visited_ids, path_ids):
-        """Callback function to update visualization during algorithm execution"""
-        # Convert IDs to coordinates
-        self.maze_state.intermediate_steps = [self.viz.coord_from_id(vid) for vid in visited_ids]
-        self.maze_state.shortest_path = [self.viz.coord_from_id(pid) for pid in path_ids]
+        """Old-style visualizer callback: show a snapshot of visited ids and the path.
+
+        Solvers given it as visualizer_callback call it once per expansion
+        (see tracing.CallbackAdapter); pass maze_state.cells as their trace
+        to update the display incrementally instead.
+        """
+        with self.profiler.span("visualize_step"):
+            self.maze_state.cells.show(visited_ids, path_ids)
     
     def compute_path(self, algo_name, delay=0.05):
         """Compute shortest path using specified algorithm with real-time visualization"""
+        with self.profiler.solve(algo_name):
+            self._compute_path(algo_name, delay)
+    
+    def _compute_path(self, algo_name, delay):
+        # The lock also keeps live_replan off the planner and cells while this runs
+        if not self.lock.acquire(blocking=False):
+            return  # Prevent multiple simultaneous computations
+        self.is_computing = True
+        try:
+            self._solve_query(algo_name, delay)
+        finally:
+            self.is_computing = False
+            self.lock.release()
+    
+    def _solve_query(self, algo_name, delay):
         if self.maze_state.start is None:
             raise ValueError("Start cell not set!")
         if self.maze_state.end is None:
             raise ValueError("End cell not set!")
         
-        if self.is_computing:
-            return  # Prevent multiple simultaneous computations
-        
-        self.is_computing = True
-        
         # Clear previous results
-        self.maze_state.shortest_path = []
-        self.maze_state.intermediate_steps = []
+        self.maze_state.clear_results()
         
         # Update visualizer references
         self.viz.start = self.maze_state.start
         self.viz.goal = self.maze_state.end
         self.viz.maze = self.maze_state.maze
         
-        # Create graph from current maze
-        graph = self.viz.maze_to_graph()
-        graph.start = self.maze_state.start
-        graph.goal = self.maze_state.end
-        
-        # Convert graph to edges
-        edges = []
-        for (r, c) in graph.nodes:
-            u = self.viz.id_from_coord(r, c)
-            for (nr, nc) in graph.neighbors((r, c)):
-                v = self.viz.id_from_coord(nr, nc)
-                edges.append((u, v, 1))
-        
         src_id = self.viz.id_from_coord(*self.maze_state.start)
         dst_id = self.viz.id_from_coord(*self.maze_state.end)
         n = self.maze_state.rows * self.maze_state.cols
         
-        # Run the selected algorithm once without visualization to measure pure computation time
-        try:
-            t0 = time.perf_counter()
-            if algo_name == "Dijkstra":
-                path_ids_no_vis, visited_ids_no_vis = SPFA_Algorithms.dijkstras(
-                    n=n, edges=edges, src=src_id, dst=dst_id,
-                    visualizer_callback=None, delay=0
-                )
-            elif algo_name == "A*":
-                path_ids_no_vis, visited_ids_no_vis = SPFA_Algorithms.a_star(
-                    n=n, edges=edges, src=src_id, dst=dst_id,
-                    heuristic=self._manhattan_heuristic, visualizer_callback=None, delay=0
-                )
-            elif algo_name == "Bellman-Ford":
-                path_ids_no_vis, visited_ids_no_vis = SPFA_Algorithms.bellman_ford(
-                    n=n, edges=edges, src=src_id, dst=dst_id,
-                    visualizer_callback=None, delay=0
-                )
-            elif algo_name == "BFS":
-                path_ids_no_vis, visited_ids_no_vis = SPFA_Algorithms.bfs(
-                    n=n, edges=edges, src=src_id, dst=dst_id,
-                    visualizer_callback=None, delay=0
-                )
-            elif algo_name == "DFS":
-                path_ids_no_vis, visited_ids_no_vis = SPFA_Algorithms.dfs(
-                    n=n, edges=edges, src=src_id, dst=dst_id,
-                    visualizer_callback=None, delay=0
-                )
+        # A goal in another component can't be reached by any algorithm: skip the search
+        with self.profiler.span("reachability"):
+            reachable = not self.reject_unreachable or self.get_components().connected(src_id, dst_id)
+        if not reachable:
+            raise ValueError("No path found!")
+        
+        # Same maze, endpoints, algorithm and settings as an earlier solve: show its result at once
+        key = (self.maze_state.fingerprint, self.maze_state.rows, self.maze_state.cols,
+               src_id, dst_id, algo_name, self.settings())
+        with self.profiler.span("solve cache"):
+            cached = self.solve_cache.get(key) if self.use_solve_cache else None
+        if cached is not None:
+            self.maze_state.timings[algo_name] = cached.timing
+            if cached.trace is not None:
+                self.start_replay(cached.trace, delay, algo_name)
             else:
-                # Unknown/unsupported algorithm (shouldn't happen if all algos implemented)
-                path_ids_no_vis, visited_ids_no_vis = [], set()
-            t1 = time.perf_counter()
-            elapsed = t1 - t0
-            # Save timing into maze state (seconds) with visited count
-            visited_count = len(visited_ids_no_vis) if visited_ids_no_vis is not None else 0
-            self.maze_state.timings[algo_name] = {"time": elapsed, "visited": visited_count}
-        except Exception:
-            # If measurement step fails for any reason, ignore timing
-            pass
-
-        # Run selected algorithm with visualization callback
-        result = self._run_algorithm(algo_name, n, edges, src_id, dst_id, delay)
-        path_ids, visited_ids = result
+                self.visualize_step(cached.visited, cached.path)
+            path_ids = cached.path
+        else:
+            path_ids = self._solve(algo_name, n, src_id, dst_id, delay, key)
         
-        self.is_computing = False
+        # Root a distance field at the goal here, on the compute thread, so later
+        # start moves only descend it (built once per maze version and goal)
+        if path_ids:
+            try:
+                with self.profiler.span("distance field"):
+                    self.get_distance_field(dst_id)
+            except ValueError:
+                pass
         
         if not path_ids:
-            self.maze_state.shortest_path = []
-            self.maze_state.intermediate_steps = []
+            self.maze_state.clear_results()
             raise ValueError("No path found!")
         else:
             print(f"Found path length: {len(path_ids)}")
     
-    def _run_algorithm(self, algo_name, n, edges, src_id, dst_id, delay):
-        """Execute the specified pathfinding algorithm"""
+    def _solve(self, algo_name, n, src_id, dst_id, delay, key):
+        """Time algo_name, record its exploration trace and replay it; returns the path ids.
+
+        The solver runs only untimed (once, recording the trace) and timed;
+        the animation is a replay of the trace and costs no further search.
+        """
+        trace = Trace()
+        # Graph is built once per maze version and shared by every run
+        with self.profiler.span("graph"):
+            edges = self.get_graph()
+        with self.profiler.span("timing"):
+            path_ids, visited_ids, timing = self.time_algorithm(
+                algo_name, n, edges, src_id, dst_id, trace=trace
+            )
+        trace.finish(path_ids)
+        self.maze_state.timings[algo_name] = timing
+        if self.use_solve_cache:
+            self.solve_cache.put(key, SolveResult(path_ids, visited_ids or (), timing, trace))
+        self.start_replay(trace, delay, algo_name)
+        return path_ids
+    
+    def time_algorithm(self, algo_name, n, edges, src_id, dst_id, trace=None):
+        """Time algo_name without visualization; returns (path, visited, timing record).
+
+        The record holds the median ("time"), p95, min and max of the timed
+        runs plus the tracemalloc peak, see measure.summarize. A Trace passed
+        as trace is filled by the untimed warm-up run.
+        """
+        # Per-maze tables are built up front so the timing covers the query alone
+        with self.profiler.span("tables"):
+            if algo_name == "ALT":
+                self.get_landmarks()
+            elif algo_name == "JPS" and self.use_jps_plus:
+                self.get_jump_table()
+            elif algo_name == "Bit-BFS":
+                self.get_bitboard()
+        
+        def run(counters=None, trace=None):
+            return self._run_algorithm(algo_name, n, edges, src_id, dst_id, delay=0, counters=counters,
+                                       trace=trace)
+
+        record = None if trace is None else lambda: run(trace=trace)
+
+        counters = Counters() if self.count_operations else None
+        if algo_name == "LPA*":
+            # The planner keeps its state, so any run after the first is a no-op.
+            # Its only counter is one addition, so that single run is also the counted one.
+            with self.profiler.span("timed runs"):
+                (path_ids, visited_ids), timing = measure(lambda: run(counters, trace), warmup=0, repeats=1,
+                                                          memory=False)
+        else:
+            with self.profiler.span("timed runs"):
+                (path_ids, visited_ids), timing = measure(run, self.timing_warmup, self.timing_repeats,
+                                                          self.timing_budget, self.measure_memory, record)
+            if counters is not None:
+                # Counted separately so the instrumentation never shows up in the times
+                with self.profiler.span("counters"):
+                    run(counters)
+        if counters is not None:
+            timing["counters"] = counters.as_dict()
+        return path_ids, visited_ids, timing
+    
+    def _run_algorithm(self, algo_name, n, edges, src_id, dst_id, delay, visualizer_callback=None, counters=None,
+                       trace=None):
+        """Execute the specified pathfinding algorithm.
+
+        counters and trace, if given, record the work done and the order of exploration.
+        """
+        # A walled start or goal has no path; the graph solvers would still
+        # return [src] when both are the same isolated wall node
+        if src_id is not None and (self._is_wall(src_id) or self._is_wall(dst_id)):
+            return [], set()
         if algo_name == "Dijkstra":
             return SPFA_Algorithms.dijkstras(
                 n=n, edges=edges, src=src_id, dst=dst_id,
-                visualizer_callback=self.visualize_step,
-                delay=delay
+                visualizer_callback=visualizer_callback,
+                delay=delay,
+                counters=counters,
+                trace=trace
             )
         elif algo_name == "A*":
             return SPFA_Algorithms.a_star(
                 n=n, edges=edges, src=src_id, dst=dst_id,
                 heuristic=self._manhattan_heuristic,
-                visualizer_callback=self.visualize_step,
-                delay=delay
+                visualizer_callback=visualizer_callback,
+                delay=delay,
+                counters=counters,
+                trace=trace
+            )
+        elif algo_name == "ALT":
+            alt = self.get_landmarks().heuristic(dst_id)
+            return SPFA_Algorithms.a_star(
+                n=n, edges=edges, src=src_id, dst=dst_id,
+                # Both bounds are admissible; Manhattan covers nodes the landmarks can't reach
+                heuristic=lambda v: max(alt(v), self._manhattan_heuristic(v)),
+                visualizer_callback=visualizer_callback,
+                delay=delay,
+                counters=counters,
+                trace=trace
+            )
+        elif algo_name == "JPS":
+            if self.maze_state.is_weighted():
+                raise ValueError("JPS needs a uniform-cost grid (clear the terrain)")
+            return SPFA_Algorithms.jump_point_search(
+                grid=self.get_grid(), src=src_id, dst=dst_id,
+                jump_table=self.get_jump_table() if self.use_jps_plus else None,
+                visualizer_callback=visualizer_callback,
+                delay=delay,
+                counters=counters,
+                trace=trace
+            )
+        elif algo_name == "Bellman-Ford" and self.vectorized_bellman_ford:
+            return SPFA_Algorithms.bellman_ford_vectorized(
+                n=n, edges=edges, src=src_id, dst=dst_id,
+                visualizer_callback=visualizer_callback,
+                delay=delay,
+                counters=counters,
+                trace=trace
             )
         elif algo_name == "Bellman-Ford":
             return SPFA_Algorithms.bellman_ford(
                 n=n, edges=edges, src=src_id, dst=dst_id,
-                visualizer_callback=self.visualize_step,
-                delay=delay
+                visualizer_callback=visualizer_callback,
+                delay=delay,
+                counters=counters,
+                trace=trace
+            )
+        elif algo_name == "SPFA":
+            return SPFA_Algorithms.spfa(
+                n=n, edges=edges, src=src_id, dst=dst_id,
+                visualizer_callback=visualizer_callback,
+                delay=delay, slf=self.spfa_slf, lll=self.spfa_lll,
+                counters=counters,
+                trace=trace
             )
         elif algo_name == "BFS":
             return SPFA_Algorithms.bfs(
                 n=n, edges=edges, src=src_id, dst=dst_id,
-                visualizer_callback=self.visualize_step,
-                delay=delay
+                visualizer_callback=visualizer_callback,
+                delay=delay,
+                counters=counters,
+                trace=trace
+            )
+        elif algo_name == "Bi-Dijkstra":
+            return SPFA_Algorithms.bidirectional_dijkstra(
+                n=n, edges=edges, src=src_id, dst=dst_id,
+                visualizer_callback=visualizer_callback,
+                delay=delay,
+                counters=counters,
+                trace=trace
+            )
+        elif algo_name == "Bit-BFS":
+            return SPFA_Algorithms.bitboard_bfs(
+                grid=self.get_grid(), src=src_id, dst=dst_id,
+                bitboard=self.get_bitboard(),
+                visualizer_callback=visualizer_callback,
+                delay=delay,
+                counters=counters,
+                trace=trace
+            )
+        elif algo_name == "LPA*":
+            planner = self.get_planner()
+            expansions = planner.compute(counters)
+            if trace is not None:
+                trace.expand_all(planner.expanded)  # the last repair, as in the callback above
+            path_ids = planner.path()
+            if visualizer_callback:
+                # Show the last repair even if this call had nothing left to do
+                visualizer_callback(planner.expanded, path_ids)
+            return path_ids, set(planner.expanded if expansions else ())
+        elif algo_name == "HPA*":
+            path_ids, visited_ids = self.get_hpa().search(src_id, dst_id, counters=counters)
+            if trace is not None:
+                trace.expand_all(sorted(visited_ids))  # the abstraction reports no order
+            if visualizer_callback:
+                visualizer_callback(list(visited_ids), path_ids)
+            return path_ids, visited_ids
+        elif algo_name == "Bi-BFS":
+            return SPFA_Algorithms.bidirectional_bfs(
+                n=n, edges=edges, src=src_id, dst=dst_id,
+                visualizer_callback=visualizer_callback,
+                delay=delay,
+                counters=counters,
+                trace=trace
             )
         elif algo_name == "DFS":
             return SPFA_Algorithms.dfs(
                 n=n, edges=edges, src=src_id, dst=dst_id,
-                visualizer_callback=self.visualize_step,
-                delay=delay
+                visualizer_callback=visualizer_callback,
+                delay=delay,
+                counters=counters,
+                trace=trace
             )
         else:
             raise ValueError(f"Unknown algorithm: {algo_name}")
     
+    def _is_wall(self, node_id):
+        r, c = self.viz.coord_from_id(node_id)
+        return self.maze_state.maze[r][c] != 0
+    
     def _manhattan_heuristic(self, node_id):
         """Calculate Manhattan distance heuristic"""
         r, c = self.viz.coord_from_id(node_id)
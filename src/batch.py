@@ -0,0 +1,119 @@
+"""Batch shortest-path queries on one graph.
+
+solve_batch() groups (src, dst) pairs by source and answers every goal
+of a source with a single search that stops once all of them are
+settled. The dist and parent arrays form one workspace for the whole
+batch, and only the entries a search touched are reset between sources.
+Pairs that a component index proves disconnected are skipped without a
+search.
+"""
+import heapq
+import time
+from array import array
+from collections import deque
+
+# Length reported for pairs with no path
+NO_PATH = -1
+
+
+class BatchResult:
+    """Path lengths (edge-weight sums, NO_PATH if none) in input order, plus optional paths."""
+    def __init__(self, lengths, paths, elapsed, searches, skipped):
+        self.lengths = lengths
+        self.paths = paths
+        self.elapsed = elapsed
+        self.searches = searches  # single-source searches run
+        self.skipped = skipped  # pairs rejected by the component index
+
+    def __len__(self):
+        return len(self.lengths)
+
+    @property
+    def queries_per_second(self):
+        return len(self.lengths) / self.elapsed if self.elapsed > 0 else float("inf")
+
+
+def solve_batch(graph, pairs, components=None, return_paths=False):
+    """Solve all (src, dst) node-id pairs on graph (integer weights).
+
+    components, if given, is a components.Components index of the same
+    maze used to skip disconnected pairs. With return_paths, each result
+    also carries its node-id path ([] if none).
+    """
+    t0 = time.perf_counter()
+    n = graph.n
+    lengths = array("q", [NO_PATH]) * len(pairs)
+    paths = [[] for _ in pairs] if return_paths else None
+    min_w, max_w, _ = graph.weight_range()
+    unit = min_w == max_w == 1
+
+    # Group query indices by source, dropping pairs the index rules out
+    by_source = {}
+    skipped = 0
+    for i, (src, dst) in enumerate(pairs):
+        if components is not None and not components.connected(src, dst):
+            skipped += 1
+            continue
+        by_source.setdefault(src, []).append(i)
+
+    # One workspace for the whole batch; searches reset only what they touched
+    dist = array("q", [NO_PATH]) * n
+    parent = array("i", [-1]) * n
+    touched = []
+    for src, queries in by_source.items():
+        pending = {pairs[i][1] for i in queries}
+        dist[src] = 0
+        touched.append(src)
+        if unit:
+            _bfs(graph, src, pending, dist, parent, touched)
+        else:
+            _dijkstra(graph, src, pending, dist, parent, touched)
+
+        for i in queries:
+            dst = pairs[i][1]
+            lengths[i] = dist[dst]
+            if return_paths and dist[dst] != NO_PATH:
+                path = [dst]
+                while path[-1] != src:
+                    path.append(parent[path[-1]])
+                path.reverse()
+                paths[i] = path
+
+        for u in touched:
+            dist[u] = NO_PATH
+            parent[u] = -1
+        touched.clear()
+
+    return BatchResult(lengths, paths, time.perf_counter() - t0, len(by_source), skipped)
+
+
+def _bfs(graph, src, pending, dist, parent, touched):
+    pending.discard(src)
+    q = deque([src])
+    while q and pending:
+        u = q.popleft()
+        du = dist[u] + 1
+        for v, _ in graph.neighbors(u):
+            if dist[v] == NO_PATH:
+                dist[v] = du
+                parent[v] = u
+                touched.append(v)
+                pending.discard(v)
+                q.append(v)
+
+
+def _dijkstra(graph, src, pending, dist, parent, touched):
+    pq = [(0, src)]
+    while pq and pending:
+        d, u = heapq.heappop(pq)
+        if d > dist[u]:
+            continue  # stale entry
+        pending.discard(u)
+        for v, w in graph.neighbors(u):
+            nd = d + w
+            if dist[v] == NO_PATH or nd < dist[v]:
+                if dist[v] == NO_PATH:
+                    touched.append(v)
+                dist[v] = nd
+                parent[v] = u
+                heapq.heappush(pq, (nd, v))
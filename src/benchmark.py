@@ -0,0 +1,250 @@
+"""Headless benchmark runner: every algorithm across maze sizes and topologies.
+
+Runs without opening a window, e.g.
+
+    python benchmark.py --sizes 10 100 1000 --topologies empty random maze spiral --out results.json
+
+Each (topology, size) maze is generated once. Every algorithm is timed on it
+with PathFinder.time_algorithm, the same measurement the UI bars use:
+warm-up runs, then the median, p95 and min of the timed repeats, plus the
+tracemalloc peak of one extra run. Results are written as JSON or CSV,
+chosen by the --out file extension.
+"""
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+from algorithms import PathFinder, np
+from counters import FIELDS as COUNTER_FIELDS
+from profiling import MODES as PROFILE_MODES
+from maze import MazeState, MazeVisualizer
+from tracefile import EXTENSION, TraceWriter
+
+DEFAULT_SIZES = (10, 32, 100, 316, 1000, 2048, 4096)
+FIELDS = ("topology", "size", "algorithm", "status", "time", "p95", "min", "runs", "visited", "path_length",
+          "peak_bytes")
+
+
+# --- Maze generators: each returns (maze, start, end) for an n x n grid ---
+
+def empty_maze(n, rng):
+    return [[0] * n for _ in range(n)], (0, 0), (n - 1, n - 1)
+
+
+def random_maze(n, rng, density=0.25):
+    maze = [[1 if rng.random() < density else 0 for _ in range(n)] for _ in range(n)]
+    maze[0][0] = maze[n - 1][n - 1] = 0
+    return maze, (0, 0), (n - 1, n - 1)
+
+
+def perfect_maze(n, rng):
+    """Recursive-backtracker maze with rooms on even coordinates (iterative)"""
+    maze = [[1] * n for _ in range(n)]
+    maze[0][0] = 0
+    stack = [(0, 0)]
+    while stack:
+        r, c = stack[-1]
+        options = [(r + dr, c + dc) for dr, dc in ((2, 0), (-2, 0), (0, 2), (0, -2))
+                   if 0 <= r + dr < n and 0 <= c + dc < n and maze[r + dr][c + dc]]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc = rng.choice(options)
+        maze[(r + nr) // 2][(c + nc) // 2] = 0
+        maze[nr][nc] = 0
+        stack.append((nr, nc))
+    last = (n - 1) - (n - 1) % 2
+    return maze, (0, 0), (last, last)
+
+
+def spiral_maze(n, rng):
+    """Nested square walls with one gap each, alternating sides, so the route winds inward"""
+    maze = [[0] * n for _ in range(n)]
+    for i, d in enumerate(range(1, n // 2, 2)):
+        lo, hi = d, n - 1 - d
+        if hi - lo < 2:
+            break
+        for k in range(lo, hi + 1):
+            maze[lo][k] = maze[hi][k] = maze[k][lo] = maze[k][hi] = 1
+        if i % 2:
+            maze[hi][lo + 1] = 0  # gap at the bottom left
+        else:
+            maze[lo][hi - 1] = 0  # gap at the top right
+    center = n // 2
+    maze[center][center] = 0
+    return maze, (0, 0), (center, center)
+
+
+TOPOLOGIES = {"empty": empty_maze, "random": random_maze, "maze": perfect_maze, "spiral": spiral_maze}
+
+
+def make_finder(maze, start, end, backend, warmup=1, repeats=5, budget=1.0, memory=True, counters=False):
+    """A PathFinder on a MazeState, with no window or UI attached"""
+    n = len(maze)
+    state = MazeState(n, n)
+    state.load(maze)  # bumps the version and fingerprint that the finder's caches key on
+    state.start, state.end = start, end
+    viz = MazeVisualizer(rows=n, cols=n, maze=maze, start=start, end=end)
+    finder = PathFinder(viz, state, backend)
+    finder.timing_warmup = warmup
+    finder.timing_repeats = repeats
+    finder.timing_budget = budget
+    finder.measure_memory = memory
+    finder.count_operations = counters
+    finder.use_solve_cache = False
+    return finder
+
+
+def run_case(finder, algo_name, trace_file=None):
+    """Time one algorithm; returns a result dict (status is "ok" or the error).
+
+    With trace_file, the untimed recording run streams its exploration
+    trace to that file (see tracefile.py).
+    """
+    state = finder.maze_state
+    n = state.rows * state.cols
+    src = finder.viz.id_from_coord(*state.start)
+    dst = finder.viz.id_from_coord(*state.end)
+    with finder.profiler.span("graph"):
+        edges = finder.get_graph()
+    row = dict.fromkeys(FIELDS[3:])
+    row.update(algorithm=algo_name, status="ok")
+    writer = None
+    if trace_file:
+        writer = TraceWriter(trace_file, state.rows, state.cols, start=src, end=dst, maze=state.maze,
+                             costs=state.costs, meta={"algorithm": algo_name})
+    try:
+        path, _, timing = finder.time_algorithm(algo_name, n, edges, src, dst, trace=writer)
+        if writer is not None:
+            writer.meta["timing"] = timing
+            writer.finish(path)
+            writer = None
+        for field in ("time", "p95", "min", "runs", "visited", "peak_bytes"):
+            row[field] = timing[field]
+        row["path_length"] = len(path)
+        if "counters" in timing:
+            row["counters"] = timing["counters"]
+    except Exception as e:
+        row["status"] = f"error: {e}"
+    finally:
+        if writer is not None:
+            writer.abort()
+    return row
+
+
+def run(sizes, topologies, algorithms, backend="csr", seed=0, skip_after=None, log=None, profile=None,
+        profile_mode=None, traces=None, **timing):
+    """Benchmark every combination; returns a list of result dicts.
+
+    With skip_after (seconds), an algorithm whose median took longer than that
+    on one size is recorded as "skipped" for the larger sizes of that
+    topology. timing holds make_finder's warmup, repeats, budget, memory and
+    counters settings. With profile (a directory), every case is profiled
+    and its collapsed stacks are written there (see profiling.Profiler).
+    With traces (a directory), every case also saves its exploration trace
+    there as topology-size-algorithm.mztrace.
+    """
+    results = []
+    for topology in topologies:
+        over_budget = set()
+        if traces:
+            os.makedirs(traces, exist_ok=True)
+        for size in sorted(sizes):
+            maze, start, end = TOPOLOGIES[topology](size, random.Random(seed))
+            finder = make_finder(maze, start, end, backend, **timing)
+            if profile:
+                finder.profiler.enabled = True
+                finder.profiler.mode = profile_mode
+                finder.profiler.out_dir = profile
+            for algo_name in algorithms:
+                if algo_name in over_budget:
+                    row = {"algorithm": algo_name, "status": "skipped"}
+                else:
+                    label = f"{topology}-{size}-{algo_name}"
+                    trace_file = os.path.join(traces, label.replace("*", "star") + EXTENSION) if traces else None
+                    with finder.profiler.solve(label):
+                        row = run_case(finder, algo_name, trace_file)
+                    if skip_after is not None and (row["time"] or 0) > skip_after:
+                        over_budget.add(algo_name)
+                row = dict({"topology": topology, "size": size}, **row)
+                results.append(row)
+                if log:
+                    log(row)
+    return results
+
+
+def environment():
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "numpy": np.__version__ if np is not None else None,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def write_results(path, results):
+    if path.endswith(".csv"):
+        # Operation counters, when collected, become one column each
+        counted = any("counters" in row for row in results)
+        fields = FIELDS + COUNTER_FIELDS if counted else FIELDS
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+            writer.writeheader()
+            for row in results:
+                writer.writerow(dict(row, **row.get("counters", {})))
+    else:
+        with open(path, "w") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2)
+
+
+def print_row(row):
+    if row["status"] != "ok":
+        print(f"{row['topology']:>7} {row['size']:>5} {row['algorithm']:<13} {row['status']}")
+        return
+    peak = f"{row['peak_bytes'] / 1e6:9.2f} MB" if row["peak_bytes"] is not None else ""
+    print(f"{row['topology']:>7} {row['size']:>5} {row['algorithm']:<13} "
+          f"{row['time'] * 1000:10.2f} ms (p95 {row['p95'] * 1000:.2f}, n={row['runs']}) "
+          f"{row['visited']:>9} visited {peak}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the path-finding algorithms headlessly")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="grid side lengths")
+    parser.add_argument("--topologies", nargs="+", choices=sorted(TOPOLOGIES), default=sorted(TOPOLOGIES))
+    parser.add_argument("--algorithms", nargs="+", choices=PathFinder.ALGORITHMS, default=PathFinder.ALGORITHMS)
+    parser.add_argument("--backend", choices=sorted(PathFinder.GRAPH_BACKENDS), default="csr")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budget", type=float, default=60.0,
+                        help="skip an algorithm on larger sizes once it takes longer than this (seconds)")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs before measuring")
+    parser.add_argument("--repeats", type=int, default=5, help="timed runs per case (median is reported)")
+    parser.add_argument("--repeat-budget", type=float, default=5.0,
+                        help="stop repeating a case once its timed runs add up to this (seconds)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak-memory pass")
+    parser.add_argument("--counters", action="store_true", help="record operation counters (one extra run per case)")
+    parser.add_argument("--profile", metavar="DIR", help="write collapsed-stack profiles of every case to DIR")
+    parser.add_argument("--profile-mode", choices=[m for m in PROFILE_MODES if m],
+                        help="also run cProfile or the stack sampler (default: phase spans only)")
+    parser.add_argument("--traces", metavar="DIR",
+                        help="save the exploration trace of every case to DIR (main.py FILE replays only "
+                             "--sizes 10 traces, the size of its fixed grid)")
+    parser.add_argument("--out", help="write results to this .json or .csv file")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.topologies, args.algorithms, args.backend, args.seed, args.budget,
+                  log=print_row, warmup=args.warmup, repeats=args.repeats, budget=args.repeat_budget,
+                  memory=not args.no_memory, counters=args.counters, profile=args.profile,
+                  profile_mode=args.profile_mode, traces=args.traces)
+    if args.out:
+        write_results(args.out, results)
+        print(f"Wrote {len(results)} results to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Bit-parallel BFS over a grid stored as one Python big int.
+
+Cell (r, c) is bit r * (cols + 1) + c. The extra padding column per row is
+always 0, so shifting by 1 can never wrap a frontier into the next row and
+a whole BFS layer expands with four shifts and one AND.
+"""
+
+
+class Bitboard:
+    """Open-cell bitmap of a GridGraph."""
+    def __init__(self, grid):
+        self.rows = grid.rows
+        self.cols = grid.cols
+        self.width = grid.cols + 1
+
+        # Build the whole board as one binary string, most significant (last) row first
+        table = bytes.maketrans(b"\x00\x01", b"10")
+        parts = []
+        for r in range(self.rows - 1, -1, -1):
+            row = bytes(grid.cells[r * self.cols:(r + 1) * self.cols]).translate(table)  # cells may be a memoryview
+            parts.append("0" + row[::-1].decode())
+        self.open = int("".join(parts), 2) if parts else 0
+
+    def bit(self, node):
+        r, c = divmod(node, self.cols)
+        return r * self.width + c
+
+    def node(self, bit):
+        r, c = divmod(bit, self.width)
+        return r * self.cols + c
+
+    def expand(self, frontier):
+        """All cells 4-adjacent to the frontier (unmasked)."""
+        w = self.width
+        return (frontier << 1) | (frontier >> 1) | (frontier << w) | (frontier >> w)
+
+    def nodes(self, board):
+        """Node ids of the set bits of board."""
+        s = bin(board)[:1:-1]  # least significant bit first
+        out = []
+        i = s.find("1")
+        while i >= 0:
+            out.append(self.node(i))
+            i = s.find("1", i + 1)
+        return out
+
+    def search(self, src, dst, on_layer=None):
+        """Layer-synchronous BFS from src until dst is reached.
+
+        Returns (path, seen) where path lists node ids (empty if dst is
+        unreachable) and seen is the board of every reached cell. on_layer,
+        if given, is called with the seen board after each layer.
+
+        Each cell's layer index is recorded modulo 3 in three boards.
+        Neighbouring cells are at most one layer apart, so while walking
+        back from layer k the neighbour marked (k - 1) % 3 is exactly the
+        one on layer k - 1.
+        """
+        src_bit = 1 << self.bit(src)
+        dst_bit = 1 << self.bit(dst)
+        if not self.open & src_bit:
+            return [], 0
+
+        frontier = src_bit
+        remaining = self.open & ~src_bit
+        marks = [src_bit, 0, 0]
+        layer = 0
+
+        while not frontier & dst_bit:
+            frontier = self.expand(frontier) & remaining
+            if not frontier:
+                return [], self.open & ~remaining
+            remaining ^= frontier
+            layer += 1
+            marks[layer % 3] |= frontier
+            if on_layer:
+                on_layer(self.open & ~remaining)
+
+        seen = self.open & ~remaining
+
+        # Byte-addressable copies of the marks make each bit test O(1)
+        size = (self.rows * self.width + 7) // 8
+        marks = [m.to_bytes(size, "little") for m in marks]
+        limit = self.rows * self.width
+        w = self.width
+
+        cur = self.bit(dst)
+        path = [dst]
+        for k in range(layer - 1, -1, -1):
+            mark = marks[k % 3]
+            for nb in (cur - w, cur + w, cur - 1, cur + 1):
+                if 0 <= nb < limit and mark[nb >> 3] >> (nb & 7) & 1:
+                    cur = nb
+                    break
+            path.append(self.node(cur))
+
+        path.reverse()
+        return path, seen
@@ -0,0 +1,106 @@
+"""Run several algorithms on one maze in parallel worker processes.
+
+The walls and terrain costs are written once into a shared_memory block.
+Each task carries only the block's name and the query, not the maze
+itself. Every worker builds its GridGraph directly on views of the block,
+so the cells and costs are never copied, and times one algorithm with
+PathFinder.time_algorithm, the same measurement compute_path uses. The
+processes do not share a GIL, so the wall time is close to that of the
+slowest algorithm.
+"""
+import gc
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+
+from algorithms import PathFinder
+from graph import GridGraph
+from maze import MazeVisualizer
+
+# PathFinder settings copied into every worker
+OPTIONS = PathFinder.SETTINGS
+
+
+def share_maze(state):
+    """Copy walls then costs (one byte per cell each) into a new shared memory block"""
+    n = state.rows * state.cols
+    shm = shared_memory.SharedMemory(create=True, size=max(1, 2 * n))
+    shm.buf[:n] = bytes(cell for row in state.maze for cell in row)
+    shm.buf[n:2 * n] = state.costs
+    return shm
+
+
+class _SharedMaze:
+    """The parts of a MazeState a PathFinder reads, as views of a shared memory block"""
+    version = 0
+    cell_edits = ()
+
+    def __init__(self, buf, rows, cols, start, end, weighted):
+        n = rows * cols
+        self.rows, self.cols = rows, cols
+        self.start, self.end = start, end
+        self.walls = buf[:n]
+        self.costs = buf[n:2 * n]
+        self.maze = [self.walls[r * cols:(r + 1) * cols] for r in range(rows)]  # row views, not copies
+        self.weighted = weighted
+
+    def is_weighted(self):
+        return self.weighted
+
+
+def _time_on(buf, rows, cols, start, end, weighted, algo_name, options):
+    """Time algo_name on the maze whose walls and costs are in buf"""
+    state = _SharedMaze(buf, rows, cols, start, end, weighted)
+    viz = MazeVisualizer(rows=rows, cols=cols, maze=state.maze, start=start, end=end)
+    finder = PathFinder(viz, state, options.pop("backend"))
+    for name, value in options.items():
+        setattr(finder, name, value)
+    finder.set_grid(GridGraph(rows, cols, state.walls, state.costs if weighted else None))
+
+    src, dst = viz.id_from_coord(*start), viz.id_from_coord(*end)
+    _, _, timing = finder.time_algorithm(algo_name, rows * cols, finder.get_graph(), src, dst)
+    return timing
+
+
+def _time_shared(shm_name, rows, cols, start, end, weighted, algo_name, options):
+    """Worker: time algo_name on the maze in shared memory; returns a timing dict"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        return _time_on(shm.buf, rows, cols, start, end, weighted, algo_name, options)
+    except Exception as e:
+        error = type(e), e.args  # its traceback holds views of the block: re-raised after close()
+    finally:
+        gc.collect()  # graphs in reference cycles may still hold views, which would block close()
+        shm.close()
+    raise error[0](*error[1])
+
+
+def run_all(finder, names, max_workers=None):
+    """Time every algorithm in names on finder's maze in parallel.
+
+    Returns {name: timing dict or None if that algorithm failed}.
+    """
+    state = finder.maze_state
+    if state.start is None or state.end is None:
+        raise ValueError("Start and end cells must be set!")
+    options = {name: getattr(finder, name) for name in OPTIONS}
+    workers = max_workers or min(len(names), os.cpu_count() or 1)
+    weighted = state.is_weighted()
+
+    shm = share_maze(state)
+    try:
+        # spawn, not fork: the parent runs SDL and a UI thread
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+            futures = {name: pool.submit(_time_shared, shm.name, state.rows, state.cols,
+                                         state.start, state.end, weighted, name, dict(options))
+                       for name in names}
+            results = {}
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception:
+                    results[name] = None
+            return results
+    finally:
+        shm.close()
+        shm.unlink()
@@ -0,0 +1,110 @@
+"""Connected components of the open cells, for O(1) reachability checks.
+
+Walls are the only thing that disconnects a grid (terrain costs are
+always positive), so two open cells are mutually reachable exactly when
+they are in the same component. Components are kept in a union-find
+forest. Opening a cell is a union with its open neighbours. Adding a
+wall can split a component, which union-find cannot undo, so it marks
+the index stale and the next query relabels the grid.
+"""
+import re
+from array import array
+
+_OPEN_RUN = re.compile(b"\\x00+")
+
+
+class Components:
+    """Union-find over the open cells of a grid (1 in cells = wall)."""
+    def __init__(self, rows, cols, cells):
+        self.rows = rows
+        self.cols = cols
+        self.cells = bytearray(cells)  # own copy kept in sync by update_cell
+        self.version = None  # maze version the index reflects, set by the owner
+        self.rebuilds = 0
+        self._rebuild()
+
+    @classmethod
+    def from_maze(cls, maze):
+        rows, cols = len(maze), len(maze[0]) if maze else 0
+        return cls(rows, cols, bytearray(maze[r][c] for r in range(rows) for c in range(cols)))
+
+    def _rebuild(self):
+        cols, cells = self.cols, self.cells
+        n = self.rows * cols
+        self.parent = parent = array("i", range(n))
+        self.size = size = array("i", [1]) * n
+        above = []  # (start, end) runs of open cells in the previous row
+        for r in range(self.rows):
+            # Each horizontal run of open cells points straight at its first cell
+            runs = [m.span() for m in _OPEN_RUN.finditer(cells, r * cols, (r + 1) * cols)]
+            for a, b in runs:
+                parent[a:b] = array("i", [a]) * (b - a)
+                size[a] = b - a
+            # One union per pair of overlapping runs in consecutive rows
+            i = 0
+            for a, b in runs:
+                while i < len(above) and above[i][1] <= a - cols:
+                    i += 1
+                j = i
+                while j < len(above) and above[j][0] < b - cols:
+                    self._union(a, above[j][0])
+                    j += 1
+            above = runs
+        self.stale = False
+        self.rebuilds += 1
+
+    def find(self, u):
+        parent = self.parent
+        while parent[u] != u:
+            parent[u] = parent[parent[u]]  # path halving
+            u = parent[u]
+        return u
+
+    def _union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+
+    def update_cell(self, u, wall, cost):
+        """Record that cell u changed (terrain costs do not affect connectivity)"""
+        if self.cells[u] == wall:
+            return
+        self.cells[u] = wall
+        if wall:
+            self.stale = True  # may split a component
+        elif not self.stale:
+            # u was a wall, so it is still an unlinked singleton
+            cols, cells = self.cols, self.cells
+            r, c = divmod(u, cols)
+            for v, ok in ((u - cols, r > 0), (u + cols, r < self.rows - 1),
+                          (u - 1, c > 0), (u + 1, c < cols - 1)):
+                if ok and not cells[v]:
+                    self._union(u, v)
+
+    def connected(self, u, v):
+        """True if open cells u and v can reach each other"""
+        if self.cells[u] or self.cells[v]:
+            return False
+        if self.stale:
+            self._rebuild()
+        return self.find(u) == self.find(v)
+
+    def labels(self):
+        """Component label (root id) of every cell, -1 for walls, as array('i')"""
+        if self.stale:
+            self._rebuild()
+        cells = self.cells
+        return array("i", [-1 if cells[u] else self.find(u) for u in range(len(cells))])
+
+    def split_pairs(self, pairs):
+        """Split (src, dst) pairs into (connected, disconnected) lists"""
+        if self.stale:
+            self._rebuild()
+        ok, cut = [], []
+        for src, dst in pairs:
+            (ok if self.connected(src, dst) else cut).append((src, dst))
+        return ok, cut
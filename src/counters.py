@@ -0,0 +1,80 @@
+"""Operation counters for the solvers in algorithms.py.
+
+Solvers take counters=None. Edge scans and queue operations, the most
+frequent events, are counted by wrapping the graph and the priority queue
+in the classes below, so a solver run without counters executes exactly
+the code it did before. The remaining counts sit at per-node or
+per-improvement points behind a single `counters is not None` test.
+"""
+
+# Counter names, in display order
+FIELDS = ("pushes", "pops", "stale_pops", "decrease_keys", "relaxations", "improved",
+          "peak_frontier", "rounds", "max_depth")
+
+
+class Counters:
+    """Work done by one solver run.
+
+    relaxations counts edges examined and improved counts those that
+    lowered a distance. For the indexed priority queues a push of a queued
+    node is a decrease_key, so their stale_pops is always 0.
+    """
+    __slots__ = FIELDS
+
+    def __init__(self):
+        for name in FIELDS:
+            setattr(self, name, 0)
+
+    def frontier(self, size):
+        if size > self.peak_frontier:
+            self.peak_frontier = size
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in FIELDS}
+
+
+class CountingGraph:
+    """Graph wrapper that counts the out-edges handed to the solver."""
+    def __init__(self, graph, counters):
+        self.graph = graph
+        self.counters = counters
+        self.n = graph.n
+
+    def neighbors(self, u):
+        out = list(self.graph.neighbors(u))
+        self.counters.relaxations += len(out)
+        return out
+
+    def reversed(self):
+        return CountingGraph(self.graph.reversed(), self.counters)
+
+    def __getattr__(self, name):
+        # weight_range, edges, numpy_arrays, ... come from the wrapped graph
+        return getattr(self.graph, name)
+
+
+class CountingQueue:
+    """Priority queue wrapper (pqueue interface) counting pushes, pops and peak size."""
+    def __init__(self, queue, counters):
+        self.queue = queue
+        self.counters = counters
+
+    def __len__(self):
+        return len(self.queue)
+
+    def push(self, item, key):
+        queue, counters = self.queue, self.counters
+        size = len(queue)
+        queue.push(item, key)
+        counters.pushes += 1
+        if len(queue) == size:
+            counters.decrease_keys += 1
+        else:
+            counters.frontier(size + 1)
+
+    def min_key(self):
+        return self.queue.min_key()
+
+    def pop(self):
+        self.counters.pops += 1
+        return self.queue.pop()
@@ -0,0 +1,83 @@
+"""Goal-rooted distance fields.
+
+A DistanceField holds the shortest distance from every cell to one goal,
+found by a single search over the reversed graph. While the maze and goal
+stay the same, the shortest path from any start is read off the field by
+gradient descent: step to any neighbour whose distance plus the edge
+weight equals the current distance. No new search is needed.
+"""
+import heapq
+from array import array
+from collections import deque
+
+# Distance of cells that cannot reach the goal
+UNREACHED = -1
+
+
+class DistanceField:
+    """Distances to goal over graph, as a flat int array (UNREACHED if cut off)."""
+    def __init__(self, graph, goal):
+        self.graph = graph
+        self.goal = goal
+        n = graph.n
+        self.dist = array("q", [UNREACHED]) * n
+        self.reached = 0
+
+        reverse = graph.reversed()
+        min_w, max_w, integer = graph.weight_range()
+        if not integer:
+            raise ValueError("Distance fields need integer edge weights")
+        if min_w == max_w == 1:
+            self._bfs(reverse)
+        else:
+            self._dijkstra(reverse)
+
+    def _bfs(self, reverse):
+        dist = self.dist
+        dist[self.goal] = 0
+        q = deque([self.goal])
+        while q:
+            u = q.popleft()
+            du = dist[u] + 1
+            for v, _ in reverse.neighbors(u):
+                if dist[v] == UNREACHED:
+                    dist[v] = du
+                    q.append(v)
+        self.reached = len(dist) - dist.count(UNREACHED)
+
+    def _dijkstra(self, reverse):
+        dist = self.dist
+        done = bytearray(len(dist))
+        dist[self.goal] = 0
+        pq = [(0, self.goal)]
+        while pq:
+            d, u = heapq.heappop(pq)
+            if done[u]:
+                continue
+            done[u] = 1
+            for v, w in reverse.neighbors(u):
+                nd = d + w
+                if dist[v] == UNREACHED or nd < dist[v]:
+                    dist[v] = nd
+                    heapq.heappush(pq, (nd, v))
+        self.reached = done.count(1)
+
+    def distance(self, src):
+        """Shortest distance from src to the goal, or UNREACHED"""
+        return self.dist[src]
+
+    def path_from(self, src):
+        """Shortest path src -> goal as node ids, or [] if the goal is unreachable"""
+        dist = self.dist
+        if dist[src] == UNREACHED:
+            return []
+        path = [src]
+        u = src
+        while u != self.goal:
+            du = dist[u]
+            for v, w in self.graph.neighbors(u):
+                if dist[v] != UNREACHED and dist[v] + w == du:
+                    u = v
+                    break
+            path.append(u)
+        return path
@@ -1,3 +1,12 @@
+from array import array
+from itertools import repeat
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the vectorized solvers need it
+    np = None
+
+
 class Node:
     def __init__(self, id, x=0, y=0):
         self.id = id
@@ -34,3 +43,258 @@ class Graph:
 
     def as_adjacency_list(self):
         return {nid: list(node.neighbors) for nid, node in self.nodes.items()}
+
+
+class CSRGraph:
+    """Compressed sparse row adjacency.
+
+    The out-edges of node u are targets[offsets[u]:offsets[u + 1]], with the
+    matching costs at the same positions in weights (an int64 array when
+    every cost is an integer, float64 otherwise). weights is None when every
+    edge costs 1, which is the case for plain mazes.
+    """
+    def __init__(self, n, offsets, targets, weights=None):
+        self.n = n
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._numpy = None
+        self._reversed = None
+        self._weight_range = None
+
+    @classmethod
+    def from_edges(cls, n, edges):
+        """Build from a list of (u, v, w) tuples."""
+        counts = [0] * (n + 1)
+        for u, _, _ in edges:
+            counts[u + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+
+        m = counts[n]
+        targets = array("i", bytes(4 * m))
+        weights = [0] * m
+        fill = counts[:n]
+        for u, v, w in edges:
+            pos = fill[u]
+            targets[pos] = v
+            weights[pos] = w
+            fill[u] = pos + 1
+
+        if all(w == 1 for w in weights):
+            weights = None
+        elif all(isinstance(w, int) for w in weights):
+            weights = array("q", weights)  # integer costs stay integers
+        else:
+            weights = array("d", weights)
+        return cls(n, array("i", counts), targets, weights)
+
+    @classmethod
+    def from_maze(cls, maze, costs=None):
+        """Build the 4-connected graph of a maze (0 = path, 1 = wall).
+
+        Node ids are r * cols + c, so wall cells exist as isolated nodes.
+        costs is an optional flat per-cell cost layer; an edge costs what
+        its target cell costs to enter. Without it every edge costs 1.
+        """
+        rows = len(maze)
+        cols = len(maze[0]) if rows else 0
+        offsets = array("i", [0])
+        targets = array("i")
+
+        for r in range(rows):
+            row = maze[r]
+            up = maze[r - 1] if r > 0 else None
+            down = maze[r + 1] if r < rows - 1 else None
+            base = r * cols
+            for c in range(cols):
+                if row[c] == 0:
+                    u = base + c
+                    # Same neighbour order as maze_to_graph: up, down, left, right
+                    if up is not None and up[c] == 0:
+                        targets.append(u - cols)
+                    if down is not None and down[c] == 0:
+                        targets.append(u + cols)
+                    if c > 0 and row[c - 1] == 0:
+                        targets.append(u - 1)
+                    if c < cols - 1 and row[c + 1] == 0:
+                        targets.append(u + 1)
+                offsets.append(len(targets))
+
+        if costs is None or all(costs[v] == 1 for v in targets):
+            graph = cls(rows * cols, offsets, targets)
+            graph._reversed = graph  # unit-cost maze edges are symmetric
+            return graph
+        return cls(rows * cols, offsets, targets, array("q", [costs[v] for v in targets]))
+
+    def edge_count(self):
+        return len(self.targets)
+
+    def weight_range(self):
+        """Return (min weight, max weight, all weights integral)."""
+        if self.weights is None:
+            return 1, 1, True
+        if not self.weights:
+            return 0, 0, True
+        if self._weight_range is None:
+            self._weight_range = (min(self.weights), max(self.weights),
+                                  self.weights.typecode == "q")
+        return self._weight_range
+
+    def neighbors(self, u):
+        """Iterate (v, w) pairs for the out-edges of u."""
+        lo = self.offsets[u]
+        hi = self.offsets[u + 1]
+        if self.weights is None:
+            return zip(self.targets[lo:hi], repeat(1))
+        return zip(self.targets[lo:hi], self.weights[lo:hi])
+
+    def edges(self):
+        """Iterate every edge as a (u, v, w) tuple."""
+        for u in range(self.n):
+            for v, w in self.neighbors(u):
+                yield u, v, w
+
+    def reversed(self):
+        """Return the graph with every edge flipped, cached."""
+        if self._reversed is None:
+            self._reversed = CSRGraph.from_edges(self.n, [(v, u, w) for u, v, w in self.edges()])
+            self._reversed._reversed = self
+        return self._reversed
+
+    def numpy_arrays(self):
+        """Return (offsets, targets, weights) as NumPy arrays, cached.
+
+        The arrays share memory with the CSR buffers. weights is None for
+        unit-cost graphs.
+        """
+        if self._numpy is None:
+            weights = None if self.weights is None else np.frombuffer(self.weights, dtype=self.weights.typecode)
+            self._numpy = (
+                np.frombuffer(self.offsets, dtype=np.int32),
+                np.frombuffer(self.targets, dtype=np.int32),
+                weights,
+            )
+        return self._numpy
+
+
+class GridGraph:
+    """Implicit 4-connected grid graph over a flat maze buffer.
+
+    Neighbours are derived on the fly from id +/- 1 and id +/- cols plus a
+    wall check, so the only storage is one byte per cell (two with a cost
+    layer). It exposes the same neighbors/edges interface as CSRGraph and
+    can be passed to any SPFA_Algorithms solver in its place.
+    """
+    def __init__(self, rows, cols, cells, costs=None, reverse=False):
+        self.rows = rows
+        self.cols = cols
+        self.n = rows * cols
+        self.cells = cells  # bytearray, row-major, 0 = path, 1 = wall
+        self.costs = costs  # bytearray of per-cell entry costs, or None for unit cost
+        self.reverse = reverse  # reversed view: an edge costs its source cell instead
+        self._numpy = None
+        self._reversed = None
+        self._weight_range = None
+
+    @classmethod
+    def from_maze(cls, maze, costs=None):
+        rows = len(maze)
+        cols = len(maze[0]) if rows else 0
+        cells = bytearray(rows * cols)
+        for r, row in enumerate(maze):
+            cells[r * cols:(r + 1) * cols] = bytes(row)
+        if costs is not None and costs.count(1) == len(costs):
+            costs = None
+        return cls(rows, cols, cells, costs)
+
+    def edge_count(self):
+        return sum(1 for _ in self.edges())
+
+    def weight_range(self):
+        """Return (min weight, max weight, all weights integral)."""
+        if self.costs is None:
+            return 1, 1, True  # every grid step costs 1
+        if self._weight_range is None:
+            open_costs = [w for w, wall in zip(self.costs, self.cells) if not wall]
+            if open_costs:
+                self._weight_range = (min(open_costs), max(open_costs), True)
+            else:
+                self._weight_range = (0, 0, True)
+        return self._weight_range
+
+    def neighbors(self, u):
+        """Return (v, w) pairs for the open cells next to u."""
+        cells = self.cells
+        if cells[u]:
+            return []  # walls are isolated nodes, as in CSRGraph
+
+        cols = self.cols
+        out = []
+        # Same neighbour order as maze_to_graph: up, down, left, right
+        if u >= cols and not cells[u - cols]:
+            out.append(u - cols)
+        if u + cols < self.n and not cells[u + cols]:
+            out.append(u + cols)
+        c = u % cols
+        if c > 0 and not cells[u - 1]:
+            out.append(u - 1)
+        if c < cols - 1 and not cells[u + 1]:
+            out.append(u + 1)
+
+        costs = self.costs
+        if costs is None:
+            return [(v, 1) for v in out]
+        if self.reverse:
+            w = costs[u]
+            return [(v, w) for v in out]
+        return [(v, costs[v]) for v in out]
+
+    def edges(self):
+        """Iterate every edge as a (u, v, w) tuple."""
+        for u in range(self.n):
+            for v, w in self.neighbors(u):
+                yield u, v, w
+
+    def reversed(self):
+        if self.costs is None:
+            return self  # unit-cost grid edges are symmetric
+        if self._reversed is None:
+            self._reversed = GridGraph(self.rows, self.cols, self.cells, self.costs, not self.reverse)
+            self._reversed._reversed = self
+        return self._reversed
+
+    def numpy_arrays(self):
+        """Return CSR (offsets, targets, weights) NumPy arrays, cached.
+
+        Built with whole-grid mask operations rather than by walking cells.
+        weights is None when the grid has no cost layer.
+        """
+        if self._numpy is None:
+            rows, cols = self.rows, self.cols
+            open_ = np.frombuffer(self.cells, dtype=np.uint8).reshape(rows, cols) == 0
+            ids = np.arange(self.n, dtype=np.int32).reshape(rows, cols)
+
+            # One (rows, cols) slot per direction, in up, down, left, right order
+            nbr = np.full((rows, cols, 4), -1, dtype=np.int32)
+            nbr[1:, :, 0] = np.where(open_[1:] & open_[:-1], ids[:-1], -1)
+            nbr[:-1, :, 1] = np.where(open_[:-1] & open_[1:], ids[1:], -1)
+            nbr[:, 1:, 2] = np.where(open_[:, 1:] & open_[:, :-1], ids[:, :-1], -1)
+            nbr[:, :-1, 3] = np.where(open_[:, :-1] & open_[:, 1:], ids[:, 1:], -1)
+
+            nbr = nbr.reshape(self.n, 4)
+            valid = nbr >= 0
+            degree = valid.sum(axis=1)
+            offsets = np.zeros(self.n + 1, dtype=np.int32)
+            np.cumsum(degree, out=offsets[1:])
+            targets = nbr[valid]
+
+            weights = None
+            if self.costs is not None:
+                costs = np.frombuffer(self.costs, dtype=np.uint8).astype(np.int64)
+                if self.reverse:
+                    weights = np.repeat(costs, degree)
+                else:
+                    weights = costs[targets]
+            self._numpy = (offsets, targets, weights)
+        return self._numpy
@@ -0,0 +1,302 @@
+"""Hierarchical path-finding (HPA*, Botea, Mueller & Schaeffer).
+
+The grid is split into size x size clusters. Along each border between
+two clusters, every maximal run of cell pairs open on both sides becomes
+an entrance with one transition (runs shorter than LONG_ENTRANCE) or two
+transitions at its ends. The cells at either end of a transition are
+abstract nodes. Inter-edges cross the border and intra-edges hold the
+in-cluster shortest distance between the nodes of one cluster.
+
+A query links start and goal into their clusters, runs A* on the abstract
+graph, and then refines each abstract step with a search bounded to one
+cluster. Paths are near-optimal, not always optimal.
+
+Cluster abstractions are built lazily, the first time a search touches
+them. An edit drops only the abstraction of the edited cell's cluster,
+plus the neighbouring cluster when the cell lies on a shared border.
+"""
+import heapq
+from collections import deque
+
+# Entrances at least this long get a transition at each end instead of one in the middle
+LONG_ENTRANCE = 6
+
+
+class HPAStar:
+    """Lazily built two-level abstraction of a grid with per-cell entry costs."""
+    def __init__(self, rows, cols, cells, costs=None, size=16):
+        self.rows = rows
+        self.cols = cols
+        self.size = size
+        self.cells = bytearray(cells)  # 1 = wall, own copy kept in sync by update_cell
+        self.costs = bytearray(costs) if costs is not None else bytearray([1]) * (rows * cols)
+        self.weighted = self.costs.count(1) != len(self.costs)  # False: local searches can use BFS
+        self.cluster_rows = (rows + size - 1) // size
+        self.cluster_cols = (cols + size - 1) // size
+        self.version = None  # maze version the abstraction reflects, set by the owner
+        self.borders = {}  # (kind, ci, cj) -> [(u, v), ...] transitions across that border
+        self.clusters = {}  # cluster id -> {node: [(v, w), ...]} abstract adjacency
+        self.built = 0  # cluster abstractions built so far (for statistics)
+
+    @classmethod
+    def from_maze(cls, maze, costs=None, size=16):
+        rows, cols = len(maze), len(maze[0]) if maze else 0
+        cells = bytearray(maze[r][c] for r in range(rows) for c in range(cols))
+        return cls(rows, cols, cells, costs, size)
+
+    # --- Cluster geometry ---
+
+    def cluster_of(self, u):
+        r, c = divmod(u, self.cols)
+        return (r // self.size) * self.cluster_cols + c // self.size
+
+    def _bounds(self, k):
+        ci, cj = divmod(k, self.cluster_cols)
+        r0, c0 = ci * self.size, cj * self.size
+        return r0, min(r0 + self.size, self.rows), c0, min(c0 + self.size, self.cols)
+
+    # --- Abstraction ---
+
+    def _border(self, key):
+        """Transitions (u, v) across a border; u is on the top/left cluster's side"""
+        found = self.borders.get(key)
+        if found is not None:
+            return found
+        kind, ci, cj = key
+        cols, cells, size = self.cols, self.cells, self.size
+        if kind == "h":  # between (ci, cj) and (ci, cj + 1)
+            c = (cj + 1) * size - 1
+            line = [r * cols + c for r in range(ci * size, min((ci + 1) * size, self.rows))]
+            step = 1
+        else:  # "v": between (ci, cj) and (ci + 1, cj)
+            r = (ci + 1) * size - 1
+            line = [r * cols + c for c in range(cj * size, min((cj + 1) * size, cols))]
+            step = cols
+        found = []
+        run = []
+        for u in line + [None]:
+            if u is not None and not cells[u] and not cells[u + step]:
+                run.append(u)
+                continue
+            if len(run) >= LONG_ENTRANCE:
+                found.extend(((run[0], run[0] + step), (run[-1], run[-1] + step)))
+            elif run:
+                mid = run[len(run) // 2]
+                found.append((mid, mid + step))
+            run = []
+        self.borders[key] = found
+        return found
+
+    def _cluster(self, k):
+        """Abstract adjacency of cluster k, building it on first use"""
+        adj = self.clusters.get(k)
+        if adj is not None:
+            return adj
+        ci, cj = divmod(k, self.cluster_cols)
+        costs = self.costs
+        adj = {}
+
+        def link(u, v):
+            adj.setdefault(u, []).append((v, costs[v]))
+
+        if cj + 1 < self.cluster_cols:
+            for u, v in self._border(("h", ci, cj)):
+                link(u, v)
+        if cj > 0:
+            for v, u in self._border(("h", ci, cj - 1)):
+                link(u, v)
+        if ci + 1 < self.cluster_rows:
+            for u, v in self._border(("v", ci, cj)):
+                link(u, v)
+        if ci > 0:
+            for v, u in self._border(("v", ci - 1, cj)):
+                link(u, v)
+
+        nodes = list(adj)
+        for u in nodes:
+            dist, _ = self.local_search(u, k)
+            for v in nodes:
+                if v != u and v in dist:
+                    adj[u].append((v, dist[v]))
+        self.clusters[k] = adj
+        self.built += 1
+        return adj
+
+    def update_cell(self, u, wall, cost):
+        """Record that cell u changed and drop the abstractions it affects"""
+        if self.cells[u] == wall and self.costs[u] == cost:
+            return
+        self.cells[u] = wall
+        self.costs[u] = cost
+        if cost != 1:
+            self.weighted = True
+        r, c = divmod(u, self.cols)
+        ci, cj = r // self.size, c // self.size
+        k = ci * self.cluster_cols + cj
+        self.clusters.pop(k, None)
+        # A cell on a cluster edge also changes the border it shares with the neighbour.
+        # Entry costs are stored on inter-edges, so the neighbour is dropped too.
+        size = self.size
+        for on_edge, key, other in ((c % size == size - 1, ("h", ci, cj), k + 1),
+                                    (c % size == 0, ("h", ci, cj - 1), k - 1),
+                                    (r % size == size - 1, ("v", ci, cj), k + self.cluster_cols),
+                                    (r % size == 0, ("v", ci - 1, cj), k - self.cluster_cols)):
+            if on_edge:
+                self.borders.pop(key, None)
+                self.clusters.pop(other, None)
+
+    # --- Searches ---
+
+    def local_search(self, src, k, dst=None, reverse=False, counters=None):
+        """Dijkstra from src confined to cluster k; returns (dist, parent) dicts.
+
+        With reverse=True distances are *to* src (each step is charged the
+        cost of the cell it leaves). Stops early once dst is settled.
+        counters (a counters.Counters), if given, records the work.
+        """
+        r0, r1, c0, c1 = self._bounds(k)
+        cols, cells, costs = self.cols, self.cells, self.costs
+        dist = {src: 0}
+        parent = {src: None}
+        if counters is not None:
+            counters.pushes += 1
+            counters.frontier(1)
+        if not self.weighted:
+            # Unit costs: breadth-first order is already distance order
+            q = deque([src])
+            while q:
+                u = q.popleft()
+                if counters is not None:
+                    counters.pops += 1
+                if u == dst:
+                    break
+                r, c = divmod(u, cols)
+                nd = dist[u] + 1
+                for v, ok in ((u - cols, r > r0), (u + cols, r < r1 - 1), (u - 1, c > c0), (u + 1, c < c1 - 1)):
+                    if ok and not cells[v]:
+                        if counters is not None:
+                            counters.relaxations += 1
+                        if v not in dist:
+                            dist[v] = nd
+                            parent[v] = u
+                            q.append(v)
+                            if counters is not None:
+                                counters.pushes += 1
+                                counters.improved += 1
+                                counters.frontier(len(q))
+            return dist, parent
+        done = set()
+        pq = [(0, src)]
+        while pq:
+            d, u = heapq.heappop(pq)
+            if counters is not None:
+                counters.pops += 1
+            if u in done:
+                if counters is not None:
+                    counters.stale_pops += 1
+                continue
+            done.add(u)
+            if u == dst:
+                break
+            r, c = divmod(u, cols)
+            for v, ok in ((u - cols, r > r0), (u + cols, r < r1 - 1), (u - 1, c > c0), (u + 1, c < c1 - 1)):
+                if ok and not cells[v]:
+                    nd = d + (costs[u] if reverse else costs[v])
+                    if counters is not None:
+                        counters.relaxations += 1
+                    if nd < dist.get(v, nd + 1):
+                        dist[v] = nd
+                        parent[v] = u
+                        heapq.heappush(pq, (nd, v))
+                        if counters is not None:
+                            counters.pushes += 1
+                            counters.improved += 1
+                            counters.frontier(len(pq))
+        return dist, parent
+
+    def search(self, src, dst, counters=None):
+        """Near-optimal path src -> dst as node ids plus the set of cells expanded.
+
+        counters, if given, records the abstract A* and the in-cluster
+        searches of this query; building cluster abstractions is not counted.
+        """
+        if self.cells[src] or self.cells[dst]:
+            return [], set()
+        ks, kd = self.cluster_of(src), self.cluster_of(dst)
+        cols = self.cols
+        gr, gc = divmod(dst, cols)
+
+        # Link the endpoints into the abstract graph of their clusters
+        src_dist, _ = self.local_search(src, ks, counters=counters)
+        start_edges = [(v, src_dist[v]) for v in self._cluster(ks) if v in src_dist and v != src]
+        if dst in src_dist and ks == kd:
+            start_edges.append((dst, src_dist[dst]))
+        dst_dist, _ = self.local_search(dst, kd, reverse=True, counters=counters)
+
+        # A* over abstract nodes; every cell costs at least 1, so Manhattan is consistent
+        g = {src: 0}
+        parent = {src: None}
+        done = set()
+        pq = [(0, src)]
+        if counters is not None:
+            counters.pushes += 1
+            counters.frontier(1)
+        while pq:
+            _, u = heapq.heappop(pq)
+            if counters is not None:
+                counters.pops += 1
+            if u in done:
+                if counters is not None:
+                    counters.stale_pops += 1
+                continue
+            done.add(u)
+            if u == dst:
+                break
+            if u == src:
+                # src may itself be an abstract node with inter-edges
+                edges = start_edges + self._cluster(ks).get(src, [])
+            else:
+                edges = self._cluster(self.cluster_of(u)).get(u, [])
+                if u in dst_dist and self.cluster_of(u) == kd:
+                    edges = edges + [(dst, dst_dist[u])]
+            if counters is not None:
+                counters.relaxations += len(edges)
+            for v, w in edges:
+                nd = g[u] + w
+                if nd < g.get(v, nd + 1):
+                    g[v] = nd
+                    parent[v] = u
+                    r, c = divmod(v, cols)
+                    heapq.heappush(pq, (nd + abs(r - gr) + abs(c - gc), v))
+                    if counters is not None:
+                        counters.pushes += 1
+                        counters.improved += 1
+                        counters.frontier(len(pq))
+
+        if dst not in done:
+            return [], done
+
+        abstract = []
+        u = dst
+        while u is not None:
+            abstract.append(u)
+            u = parent[u]
+        abstract.reverse()
+
+        # Refine: inter-edges are single steps, everything else stays in one cluster
+        path = [src]
+        expanded = set(done)
+        for a, b in zip(abstract, abstract[1:]):
+            ka = self.cluster_of(a)
+            if ka != self.cluster_of(b):
+                path.append(b)
+                continue
+            dist, prev = self.local_search(a, ka, dst=b, counters=counters)
+            expanded.update(dist)
+            segment = []
+            v = b
+            while v != a:
+                segment.append(v)
+                v = prev[v]
+            path.extend(reversed(segment))
+        return path, expanded
@@ -0,0 +1,101 @@
+"""Jump Point Search primitives for 4-connected, uniform-cost grids.
+
+Moving straight, a scan only stops at the goal or at a jump point: a cell
+with a forced neighbour (an open side cell whose counterpart one step back
+is blocked). A vertical scan also stops where a horizontal scan from the
+cell would find a jump point, which is what keeps 4-connected JPS optimal.
+"""
+from array import array
+
+# Search directions as (dr, dc); JumpTable stores one distance array per entry
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))  # up, down, left, right
+
+
+def _open(grid, r, c):
+    return 0 <= r < grid.rows and 0 <= c < grid.cols and not grid.cells[r * grid.cols + c]
+
+
+def is_forced(grid, r, c, dr, dc):
+    """True if entering (r, c) while moving (dr, dc) exposes a forced neighbour."""
+    if dc:
+        return ((_open(grid, r - 1, c) and not _open(grid, r - 1, c - dc)) or
+                (_open(grid, r + 1, c) and not _open(grid, r + 1, c - dc)))
+    return ((_open(grid, r, c - 1) and not _open(grid, r - dr, c - 1)) or
+            (_open(grid, r, c + 1) and not _open(grid, r - dr, c + 1)))
+
+
+def jump(grid, r, c, dr, dc, goal):
+    """Scan from (r, c) in direction (dr, dc) and return the next jump point id, or None."""
+    cols = grid.cols
+    while True:
+        r += dr
+        c += dc
+        if not _open(grid, r, c):
+            return None
+        u = r * cols + c
+        if u == goal or is_forced(grid, r, c, dr, dc):
+            return u
+        if dr and (jump(grid, r, c, 0, 1, goal) is not None or
+                   jump(grid, r, c, 0, -1, goal) is not None):
+            return u
+
+
+class JumpTable:
+    """JPS+ precomputed jump distances.
+
+    For each cell and direction, dist[d][u] > 0 is the number of steps to the
+    next jump point, and dist[d][u] <= 0 is minus the number of open steps
+    before a wall with no jump point in between. The goal is not known when
+    the table is built, so jump() checks it against the scanned segment.
+    """
+    def __init__(self, grid):
+        self.grid = grid
+        rows, cols = grid.rows, grid.cols
+        n = rows * cols
+        self.dist = [array("i", bytes(4 * n)) for _ in DIRECTIONS]
+        up, down, left, right = self.dist
+
+        # Horizontal tables only depend on forced neighbours in the row
+        for r in range(rows):
+            for dc, table, cs in ((1, right, range(cols - 1, -1, -1)), (-1, left, range(cols))):
+                for c in cs:
+                    nc = c + dc
+                    if not _open(grid, r, c) or not _open(grid, r, nc):
+                        continue  # 0: no step possible
+                    v = r * cols + nc
+                    if is_forced(grid, r, nc, 0, dc):
+                        table[r * cols + c] = 1
+                    else:
+                        prev = table[v]
+                        table[r * cols + c] = prev + 1 if prev > 0 else prev - 1
+
+        # Vertical scans also stop wherever a horizontal scan would succeed
+        for c in range(cols):
+            for dr, table, rs in ((1, down, range(rows - 1, -1, -1)), (-1, up, range(rows))):
+                for r in rs:
+                    nr = r + dr
+                    if not _open(grid, r, c) or not _open(grid, nr, c):
+                        continue
+                    v = nr * cols + c
+                    if is_forced(grid, nr, c, dr, 0) or right[v] > 0 or left[v] > 0:
+                        table[r * cols + c] = 1
+                    else:
+                        prev = table[v]
+                        table[r * cols + c] = prev + 1 if prev > 0 else prev - 1
+
+    def jump(self, r, c, dr, dc, goal):
+        """Table-driven equivalent of jps.jump()."""
+        cols = self.grid.cols
+        steps = self.dist[DIRECTIONS.index((dr, dc))][r * cols + c]
+        reach = steps if steps > 0 else -steps
+        gr, gc = divmod(goal, cols)
+
+        # The goal, or for vertical moves the goal's row, may lie on the segment
+        if dc and gr == r and 0 < (gc - c) * dc <= reach:
+            return goal
+        if dr and 0 < (gr - r) * dr <= reach:
+            return gr * cols + c
+
+        if steps > 0:
+            return (r + dr * steps) * cols + (c + dc * steps)
+        return None
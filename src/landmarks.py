@@ -0,0 +1,84 @@
+"""ALT (A*, Landmarks, Triangle inequality) preprocessing.
+
+For a landmark L the triangle inequality gives two lower bounds on the
+distance from v to t:
+
+    d(v, t) >= d(L, t) - d(L, v)
+    d(v, t) >= d(v, L) - d(t, L)
+
+The maximum over all landmarks is a consistent heuristic that follows
+walls, unlike the Manhattan distance. Landmarks are picked by
+farthest-point selection, and each one stores its distance tables as
+array('i') (or 'q' when the distances may not fit in 32 bits).
+"""
+from array import array
+from distfield import DistanceField, UNREACHED
+
+
+def _compact(dist):
+    """Copy an array('q') into the narrowest int array that holds it"""
+    if max(dist, default=0) < 2**31:
+        return array("i", dist)
+    return dist
+
+
+class Landmarks:
+    """k landmarks with distance tables to and from every node."""
+    def __init__(self, graph, k=8, seed_node=None):
+        self.graph = graph
+        reverse = graph.reversed()
+        # Unit-cost grids are undirected, so one table serves both directions
+        self.symmetric = reverse is graph
+        self.nodes = []
+        self.dist_from = []  # dist_from[i][v] = d(L_i, v)
+        self.dist_to = []  # dist_to[i][v] = d(v, L_i)
+
+        if seed_node is None:
+            seed_node = next((u for u in range(graph.n) if any(True for _ in graph.neighbors(u))), None)
+        if seed_node is None:
+            return  # no edges at all
+
+        # Farthest-point selection: start from the node farthest from seed_node,
+        # then repeatedly add the node whose round trip to its nearest landmark
+        # is longest. Nodes cut off from the seed (score -1) are never picked.
+        score = DistanceField(reverse, seed_node).dist  # d(seed, v)
+        for _ in range(k):
+            best = max(range(len(score)), key=score.__getitem__)
+            if score[best] <= 0:
+                break
+            self._add(best, reverse)
+            d_from, d_to = self.dist_from[-1], self.dist_to[-1]
+            trip = array("q", [f + b if f >= 0 and b >= 0 else UNREACHED for f, b in zip(d_from, d_to)])
+            if len(self.nodes) == 1:
+                score = trip
+            else:
+                score = array("q", [min(s, t) if t >= 0 else s for s, t in zip(score, trip)])
+
+    def _add(self, landmark, reverse):
+        self.nodes.append(landmark)
+        # DistanceField measures distances *to* its root over the graph it is given
+        d_to = _compact(DistanceField(self.graph, landmark).dist)
+        d_from = d_to if self.symmetric else _compact(DistanceField(reverse, landmark).dist)
+        self.dist_to.append(d_to)
+        self.dist_from.append(d_from)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def heuristic(self, target):
+        """Return h(v), the ALT lower bound on d(v, target)"""
+        # Only landmarks with finite distances to and from the target give bounds
+        terms = [(f, b, f[target], b[target]) for f, b in zip(self.dist_from, self.dist_to)
+                 if f[target] >= 0 and b[target] >= 0]
+
+        def h(v):
+            best = 0
+            for f, b, ft, bt in terms:
+                fv = f[v]
+                if fv >= 0 and ft - fv > best:
+                    best = ft - fv
+                bv = b[v]
+                if bv >= 0 and bv - bt > best:
+                    best = bv - bt
+            return best
+        return h
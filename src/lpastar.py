@@ -0,0 +1,144 @@
+"""Lifelong Planning A* (Koenig & Likhachev) on a 4-connected grid.
+
+The planner keeps g (current distance estimate) and rhs (one-step
+lookahead from the neighbours' g) for every cell across maze edits. After
+a cell changes only that cell and its neighbours are re-evaluated, and
+compute() expands just the cells whose distance actually changed, instead
+of solving from scratch. Entering a cell costs its terrain cost, so the
+Manhattan distance stays a consistent heuristic.
+"""
+import heapq
+
+INF = float("inf")
+
+
+class LPAStar:
+    """Incremental planner for fixed start and goal node ids."""
+    def __init__(self, rows, cols, cells, costs, start, goal):
+        self.rows = rows
+        self.cols = cols
+        n = rows * cols
+        self.cells = bytearray(cells)  # 1 = wall, own copy kept in sync by update_cell
+        self.costs = bytearray(costs) if costs is not None else bytearray([1]) * n
+        self.start = start
+        self.goal = goal
+        self.version = None  # maze version the planner reflects, set by the owner
+        self.g = [INF] * n
+        self.rhs = [INF] * n
+        self.open_key = [None] * n  # key of each queued cell, None if not queued
+        self.heap = []
+        self.expanded = []  # cells expanded by the last compute() that did work
+        self.gr, self.gc = divmod(goal, cols)
+        self.rhs[start] = 0
+        self._push(start)
+
+    @classmethod
+    def from_maze(cls, maze, costs, start, goal):
+        rows, cols = len(maze), len(maze[0]) if maze else 0
+        cells = bytearray(maze[r][c] for r in range(rows) for c in range(cols))
+        return cls(rows, cols, cells, costs, start, goal)
+
+    def _adjacent(self, u):
+        """In-bounds 4-neighbours of u, open or not"""
+        r, c = divmod(u, self.cols)
+        out = []
+        if r > 0:
+            out.append(u - self.cols)
+        if r < self.rows - 1:
+            out.append(u + self.cols)
+        if c > 0:
+            out.append(u - 1)
+        if c < self.cols - 1:
+            out.append(u + 1)
+        return out
+
+    def _key(self, u):
+        k = min(self.g[u], self.rhs[u])
+        r, c = divmod(u, self.cols)
+        return (k + abs(r - self.gr) + abs(c - self.gc), k)
+
+    def _push(self, u, counters=None):
+        key = self._key(u)
+        self.open_key[u] = key
+        heapq.heappush(self.heap, (key, u))
+        if counters is not None:
+            counters.pushes += 1
+            counters.frontier(len(self.heap))
+
+    def _update_vertex(self, u, counters=None):
+        g, rhs, cells = self.g, self.rhs, self.cells
+        if u != self.start:
+            if cells[u]:
+                rhs[u] = INF
+            else:
+                best = INF
+                for p in self._adjacent(u):
+                    if not cells[p] and g[p] < best:
+                        best = g[p]
+                rhs[u] = best + self.costs[u]
+        if g[u] != rhs[u]:
+            self._push(u, counters)
+        else:
+            self.open_key[u] = None
+
+    def update_cell(self, u, wall, cost):
+        """Record that cell u changed to the given wall flag and terrain cost"""
+        if self.cells[u] == wall and self.costs[u] == cost:
+            return
+        self.cells[u] = wall
+        self.costs[u] = cost
+        self._update_vertex(u)
+        for v in self._adjacent(u):
+            self._update_vertex(v)
+
+    def compute(self, counters=None):
+        """Repair g until the goal is consistent; returns the number of expansions.
+
+        counters (a counters.Counters), if given, records the work of this
+        repair; pushes made earlier, by __init__ or update_cell, are not included.
+        """
+        g, rhs, heap, open_key = self.g, self.rhs, self.heap, self.open_key
+        goal = self.goal
+        expanded = []
+        while heap:
+            key, u = heap[0]
+            if open_key[u] != key:
+                heapq.heappop(heap)  # stale entry
+                if counters is not None:
+                    counters.pops += 1
+                    counters.stale_pops += 1
+                continue
+            if not (key < self._key(goal) or rhs[goal] != g[goal]):
+                break
+            heapq.heappop(heap)
+            open_key[u] = None
+            expanded.append(u)
+            adjacent = self._adjacent(u)
+            if counters is not None:
+                counters.pops += 1
+                counters.relaxations += len(adjacent)
+            if g[u] > rhs[u]:
+                g[u] = rhs[u]
+                if counters is not None:
+                    counters.improved += 1
+            else:
+                g[u] = INF
+                self._update_vertex(u, counters)
+            for v in adjacent:
+                self._update_vertex(v, counters)
+        if expanded:
+            self.expanded = expanded
+        return len(expanded)
+
+    def path(self):
+        """Shortest path start -> goal as node ids, or [] if the goal is unreachable"""
+        g, cells = self.g, self.cells
+        if g[self.goal] == INF or cells[self.start]:
+            return []  # a walled start keeps g = 0, so a walled start == goal looked reachable
+        u = self.goal
+        path = [u]
+        while u != self.start:
+            u = min((p for p in self._adjacent(u) if not cells[p]), key=g.__getitem__)
+            path.append(u)
+        path.reverse()
+        return path
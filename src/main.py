@@ -1,7 +1,12 @@
+import os
+import sys
 import pygame
 import threading
-from maze import MazeVisualizer, MazeState, UIState
+from maze import GridRenderer, MazeVisualizer, MazeState, UIState
 from algorithms import PathFinder
+from compare import run_all
+from counters import FIELDS as COUNTER_FIELDS
+from tracefile import EXTENSION
 
 # CONFIG
 ROWS = 10
@@ -60,6 +65,8 @@ class SPFAVisualizer:
             start=None, end=None
         )
         
+        self.grid_renderer = GridRenderer(self.viz, self.maze_state)
+        
         # Initialize pathfinder
         self.pathfinder = PathFinder(self.viz, self.maze_state)
         
@@ -68,6 +75,8 @@ class SPFAVisualizer:
         
         self.running = True
         self.computing_thread = None
+        # What the last full frame showed outside the grid, see ui_stamp
+        self._ui_stamp = None
     
     def handle_grid_click(self, mx, my):
         """Handle clicks on the maze grid"""
@@ -89,8 +98,11 @@ class SPFAVisualizer:
                 self.maze_state.toggle_wall(row, col)
             elif self.ui_state.edit_mode == "start":
                 self.maze_state.set_start(row, col)
+                self.pathfinder.follow_distance_field()
             elif self.ui_state.edit_mode == "end":
                 self.maze_state.set_end(row, col)
+            elif self.ui_state.edit_mode == "terrain":
+                self.maze_state.set_cost(row, col, self.ui_state.terrain_cost)
     
     def compute_path_async(self):
         """Run pathfinding in a separate thread"""
@@ -100,17 +112,113 @@ class SPFAVisualizer:
             self.ui_state.show_error(f"Error: {str(e)}")
         except Exception as e:
             self.ui_state.show_error(f"Error: {str(e)}")
+        finally:
+            self.pathfinder.is_computing = False
+    
+    def scrub_rect(self):
+        """Timeline of the solve replay, just below the grid"""
+        return pygame.Rect(self.grid_origin[0], self.grid_origin[1] + self.grid_height + 8, self.grid_width, 8)
+
+    def scrub_to(self, mx):
+        replay = self.pathfinder.replay
+        if replay is not None:
+            rect = self.scrub_rect()
+            replay.playing = False
+            self.pathfinder.seek_replay(round((mx - rect.left) / rect.width * len(replay)))
+
+    def handle_replay_key(self, event):
+        replay = self.pathfinder.replay
+        step = max(1, len(replay) // 10) if event.mod & pygame.KMOD_SHIFT else 1
+        if event.key == pygame.K_SPACE:
+            if replay.done:
+                # Play again from the start
+                self.pathfinder.seek_replay(0)
+                replay.playing = True
+            else:
+                replay.playing = not replay.playing
+        elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+            replay.playing = False
+            self.pathfinder.seek_replay(replay.position + (step if event.key == pygame.K_RIGHT else -step))
+        elif event.key == pygame.K_HOME:
+            self.pathfinder.seek_replay(0)
+        elif event.key == pygame.K_END:
+            self.pathfinder.seek_replay(len(replay))
+
+    def save_replay(self):
+        """Write the replayed trace to traces/ for archiving or replay elsewhere"""
+        try:
+            os.makedirs("traces", exist_ok=True)
+            label = self.pathfinder.replay_label or "trace"
+            safe = "".join(ch if ch.isalnum() else "_" for ch in label)
+            count = len(os.listdir("traces")) + 1
+            filename = os.path.join("traces", f"{count:04d}-{safe}{EXTENSION}")
+            self.pathfinder.save_trace(filename)
+            self.ui_state.show_error(f"Saved {filename}")
+        except (OSError, ValueError) as e:
+            self.ui_state.show_error(f"Error: {str(e)}")
+
+    def load_replay(self, filename):
+        try:
+            self.pathfinder.load_trace(filename, self.animation_speed)
+        except (OSError, ValueError) as e:
+            self.ui_state.show_error(f"Error: {str(e)}")
+
+    def cycle_profiling(self):
+        profiler = self.pathfinder.profiler
+        steps = [(False, None), (True, None), (True, "cprofile"), (True, "sample")]
+        i = steps.index((profiler.enabled, profiler.mode if profiler.enabled else None))
+        profiler.enabled, profiler.mode = steps[(i + 1) % len(steps)]
+
+    def compare_all_async(self):
+        """Time every algorithm in parallel worker processes and fill in all the bars"""
+        pathfinder = self.pathfinder
+        try:
+            src = self.viz.id_from_coord(*self.maze_state.start)
+            dst = self.viz.id_from_coord(*self.maze_state.end)
+            if pathfinder.reject_unreachable and not pathfinder.get_components().connected(src, dst):
+                raise ValueError("No path found!")
+            names = [name for _, name in self.ui_state.algo_buttons]
+            # Results belong to the maze as it was when the run started
+            timings = self.maze_state.timings
+            results = run_all(pathfinder, names)
+            for name, timing in results.items():
+                if timing is not None:
+                    timings[name] = timing
+            failed = [name for name, timing in results.items() if timing is None]
+            if failed:
+                self.ui_state.show_error(f"Skipped: {', '.join(failed)}")
+        except Exception as e:
+            self.ui_state.show_error(f"Error: {str(e)}")
+        finally:
+            pathfinder.is_computing = False
     
     def handle_button_clicks(self, mx, my):
         """Handle clicks on UI buttons"""
+        if self.scrub_rect().collidepoint(mx, my):
+            self.scrub_to(mx)
+            return True
+
         # Find Path button
         if self.ui_state.find_button.collidepoint(mx, my):
             if not self.pathfinder.is_computing:
-                # Start computation in a separate thread
+                # Start computation in a separate thread; computing from now on, not from
+                # whenever the thread gets going, so live solve keeps off the shared state
+                self.pathfinder.is_computing = True
                 self.computing_thread = threading.Thread(target=self.compute_path_async)
                 self.computing_thread.start()
             return True
         
+        # Compare All button
+        if self.ui_state.compare_button.collidepoint(mx, my):
+            if not self.pathfinder.is_computing:
+                if self.maze_state.start is None or self.maze_state.end is None:
+                    self.ui_state.show_error("Error: Start and end cells must be set!")
+                else:
+                    self.pathfinder.is_computing = True
+                    self.computing_thread = threading.Thread(target=self.compare_all_async)
+                    self.computing_thread.start()
+            return True
+        
         # Don't allow other actions while computing
         if self.pathfinder.is_computing:
             return True
@@ -147,18 +255,52 @@ class SPFAVisualizer:
         for rect, speed_val, _ in self.ui_state.speed_buttons:
             if rect.collidepoint(mx, my):
                 self.animation_speed = speed_val
+                if self.pathfinder.replay is not None:
+                    self.pathfinder.replay.step_time = speed_val
                 return True
         
         return False
     
     def handle_events(self):
+        """Process pending input; returns True if there was any"""
         mouse_held = pygame.mouse.get_pressed()
         mx, my = pygame.mouse.get_pos()
 
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
 
+            # Number keys pick the terrain brush cost
+            if event.type == pygame.KEYDOWN and pygame.K_1 <= event.key <= pygame.K_9:
+                self.ui_state.terrain_cost = self.ui_state.TERRAIN_LEVELS[event.key - pygame.K_1]
+
+            # L toggles live solve (LPA* re-plans after every edit)
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_l:
+                self.ui_state.live_solve = not self.ui_state.live_solve
+
+            # C swaps the timing bars for the operation counters panel
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_c:
+                self.ui_state.show_counters = not self.ui_state.show_counters
+                # Counting costs one extra run per timing, so only while the panel is shown
+                self.pathfinder.count_operations = self.ui_state.show_counters
+
+            # P cycles profiling: off -> spans -> spans + cProfile -> spans + sampling -> off
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_p:
+                self.cycle_profiling()
+
+            # W writes the replayed trace to a file
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_w:
+                self.save_replay()
+
+            # Replay controls: Space plays/pauses, arrows step (Shift: 10%), Home/End jump
+            if event.type == pygame.KEYDOWN and self.pathfinder.replay is not None:
+                self.handle_replay_key(event)
+
+            # Dragging along the scrub bar seeks the replay
+            if event.type == pygame.MOUSEMOTION and mouse_held[0] and self.scrub_rect().collidepoint(mx, my):
+                self.scrub_to(mx)
+
             # --- ERASE ON CLICK (no dragging) ---
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 gx = mx - self.grid_origin[0]
@@ -170,11 +312,10 @@ class SPFAVisualizer:
 
                     if self.ui_state.edit_mode == "wall":
                         # erase
-                        if self.maze_state.maze[row][col] != 0:
-                            self.maze_state.maze[row][col] = 0
-                            self.maze_state.shortest_path = []
-                            self.maze_state.intermediate_steps = []
-                            self.maze_state.timings = {}
+                        self.maze_state.set_wall(row, col, 0)
+                    elif self.ui_state.edit_mode == "terrain":
+                        # erase back to plain ground
+                        self.maze_state.set_cost(row, col, 1)
 
                 # button UI clicks
                 self.handle_button_clicks(mx, my)
@@ -189,11 +330,9 @@ class SPFAVisualizer:
                     col = gx // CELL_SIZE
 
                     if self.ui_state.edit_mode == "wall":
-                        if self.maze_state.maze[row][col] != 1:
-                            self.maze_state.maze[row][col] = 1
-                            self.maze_state.shortest_path = []
-                            self.maze_state.intermediate_steps = []
-                            self.maze_state.timings = {}
+                        self.maze_state.set_wall(row, col, 1)
+                    elif self.ui_state.edit_mode == "terrain":
+                        self.maze_state.set_cost(row, col, self.ui_state.terrain_cost)
 
             # --- START / END placement still handled normally ---
             if mouse_held[0] and not self.pathfinder.is_computing:
@@ -205,10 +344,17 @@ class SPFAVisualizer:
                     col = gx // CELL_SIZE
 
                     if self.ui_state.edit_mode == "start":
-                        self.maze_state.set_start(row, col)
+                        if self.maze_state.start != (row, col):
+                            self.maze_state.set_start(row, col)
+                            # Same maze and goal: reuse the goal's distance field
+                            self.pathfinder.follow_distance_field()
                     elif self.ui_state.edit_mode == "end":
                         self.maze_state.set_end(row, col)
 
+        # Keep the LPA* path current while editing
+        if self.ui_state.live_solve:
+            self.pathfinder.live_replan()
+        return bool(events)
 
     
     def draw_ui(self):
@@ -224,12 +370,9 @@ class SPFAVisualizer:
         title_rect = title_surf.get_rect(center=(self.screen_width // 2, 30))
         self.screen.blit(title_surf, title_rect)
         
-        # Update visualizer state before drawing
-        self.viz.start = self.maze_state.start
-        self.viz.goal = self.maze_state.end
-        self.viz.end = self.maze_state.end
-        self.viz.maze = self.maze_state.maze
-        self.viz.draw_grid(self.screen, path=self.maze_state.shortest_path, intermediate_steps=self.maze_state.intermediate_steps)
+        # Grid from the renderer's cached surfaces (it syncs the visualizer with maze_state)
+        self.grid_renderer.draw(self.screen, border=True)
+        self.draw_scrub_bar()
 
         # --- Comparative bars for all algorithms (below the grid) ---
         # Keep only the comparative bars for all algorithms; the single selected
@@ -246,9 +389,12 @@ class SPFAVisualizer:
             rec = self.maze_state.timings.get(name)
             alg_entries.append((name, rec))
 
-        if alg_entries:
-            # Determine available timings, ignore None values to compute min/max
-            measured = [e[1]["time"] for e in alg_entries if e[1] is not None]
+        if self.ui_state.show_counters:
+            self.draw_counters_panel(alg_entries, time_y + padding_v + 22)
+        elif alg_entries:
+            # Determine available timings, ignore None values to compute min/max.
+            # The scale covers the p95 whiskers as well as the median bars.
+            measured = [max(e[1]["time"], e[1].get("p95") or 0) for e in alg_entries if e[1] is not None]
             measured_ms = [t * 1000 for t in measured]
 
             # Sort algorithms: measured by time ascending, then unmeasured
@@ -260,7 +406,7 @@ class SPFAVisualizer:
 
             # Setup layout under the center bar
             bar_top = time_y + padding_v + 22
-            bar_height = 18
+            bar_height = 14
             full_bar_width = min(self.grid_width - 40, 600)  # clamp width
             bar_left = grid_mid_x - full_bar_width // 2
 
@@ -274,12 +420,12 @@ class SPFAVisualizer:
                 max_ms = min_ms = range_ms = 0
 
             for i, (name, rec) in enumerate(alg_entries):
-                y = bar_top + i * (bar_height + 8)
+                y = bar_top + i * (bar_height + 5)
 
                 is_sel = name == self.ui_state.selected_algo
                 if is_sel:
                     # Draw a subtle highlight behind selected algorithm's track
-                    sel_rect = pygame.Rect(bar_left - 6, y - 6, full_bar_width + 12, bar_height + 12)
+                    sel_rect = pygame.Rect(bar_left - 6, y - 2, full_bar_width + 12, bar_height + 4)
                     pygame.draw.rect(self.screen, (30, 50, 42), sel_rect, border_radius=8)
 
                 # Draw label
@@ -298,7 +444,7 @@ class SPFAVisualizer:
                     na_text = self.error_font.render("N/A", True, (120, 130, 140))
                     self.screen.blit(na_text, (bar_left + full_bar_width + 8, y))
                 else:
-                    ms = rec.get("time", 0) * 1000
+                    ms = rec.get("time", 0) * 1000  # median
                     # Normalize: map ms to width relative to max_ms
                     if max_ms <= 0:
                         frac = 0
@@ -320,7 +466,17 @@ class SPFAVisualizer:
 
                     pygame.draw.rect(self.screen, col, fill_rect, border_radius=6)
 
-                    # Draw right-time label
+                    # Whisker from the fastest run to the p95 run around the median bar
+                    if rec.get("runs", 1) > 1 and max_ms > 0:
+                        lo_x = bar_left + int(full_bar_width * min(1.0, rec["min"] * 1000 / max_ms))
+                        hi_x = bar_left + int(full_bar_width * min(1.0, rec["p95"] * 1000 / max_ms))
+                        mid_y = y + bar_height // 2
+                        whisker_col = (235, 235, 245)
+                        pygame.draw.line(self.screen, whisker_col, (lo_x, mid_y), (hi_x, mid_y), 1)
+                        pygame.draw.line(self.screen, whisker_col, (lo_x, y + 3), (lo_x, y + bar_height - 4), 1)
+                        pygame.draw.line(self.screen, whisker_col, (hi_x, y + 3), (hi_x, y + bar_height - 4), 1)
+
+                    # Draw right-time label (median of the timed runs)
                     time_label = f"{ms:.2f} ms" if ms < 1000 else f"{ms/1000:.2f} s"
                     nodes_label = f" {rec.get('visited', 0)} nodes"
                     label_text = self.error_font.render(time_label + nodes_label, True, (180, 210, 200))
@@ -330,6 +486,9 @@ class SPFAVisualizer:
                         label_text = self.error_font.render(time_label + nodes_label, True, (220, 240, 220))
                     self.screen.blit(label_text, (bar_left + full_bar_width + 8, y))
         
+        if self.pathfinder.profiler.enabled and self.pathfinder.profiler.label:
+            self.draw_profile_overlay()
+
         # LEFT PANEL - Edit Controls
         self.draw_left_panel()
         
@@ -347,6 +506,84 @@ class SPFAVisualizer:
             pygame.draw.rect(self.screen, (255, 100, 100), bg_rect, 2, border_radius=8)
             self.screen.blit(error_surf, error_rect)
     
+    def draw_scrub_bar(self):
+        """Replay timeline: filled up to the current event, with the event count beside it.
+
+        Returns the screen area it covers (None without a replay).
+        """
+        replay = self.pathfinder.replay
+        if replay is None:
+            return None
+        rect = self.scrub_rect()
+        # Bar and count, clear of the grid border above and the timing bars below
+        area = pygame.Rect(rect.left, rect.top - 4, rect.width + 170, rect.height + 10)
+        self.screen.fill((45, 45, 55), area)
+        pygame.draw.rect(self.screen, (40, 40, 46), rect, border_radius=4)
+        if len(replay):
+            filled = rect.copy()
+            filled.width = int(rect.width * replay.position / len(replay))
+            pygame.draw.rect(self.screen, (120, 160, 230), filled, border_radius=4)
+        paused = "  (paused)" if not replay.playing and not replay.done else ""
+        text = self.error_font.render(f"{replay.position}/{len(replay)}{paused}", True, (170, 180, 200))
+        self.screen.blit(text, (rect.right + 10, rect.centery - text.get_height() // 2))
+        return area
+
+    def profiling_label(self):
+        profiler = self.pathfinder.profiler
+        if not profiler.enabled:
+            return "Off"
+        return {None: "Spans", "cprofile": "cProfile", "sample": "Sampling"}[profiler.mode]
+
+    def draw_profile_overlay(self):
+        """Per-phase times of the last profiled solve, over the grid's top-right corner"""
+        profiler = self.pathfinder.profiler
+        lines = [(f"{profiler.label} solve", profiler.total)] + list(profiler.phases.items())
+        width, line_h = 220, 18
+        box = pygame.Rect(0, 0, width, 12 + line_h * len(lines))
+        box.topright = (self.grid_origin[0] + self.grid_width - 8, self.grid_origin[1] + 8)
+        overlay = pygame.Surface(box.size, pygame.SRCALPHA)
+        overlay.fill((20, 22, 30, 215))
+        self.screen.blit(overlay, box.topleft)
+        pygame.draw.rect(self.screen, (90, 110, 150), box, 1, border_radius=4)
+        for i, (name, seconds) in enumerate(lines):
+            y = box.top + 6 + i * line_h
+            color = (220, 230, 250) if i == 0 else (180, 200, 210)
+            ms = seconds * 1000
+            value = f"{ms:.2f} ms" if ms < 1000 else f"{ms / 1000:.2f} s"
+            name_text = self.error_font.render(name, True, color)
+            value_text = self.error_font.render(value, True, color)
+            self.screen.blit(name_text, (box.left + 8, y))
+            self.screen.blit(value_text, value_text.get_rect(topright=(box.right - 8, y)))
+
+    def draw_counters_panel(self, alg_entries, top):
+        """Table of operation counters per algorithm, in place of the timing bars"""
+        headers = ("pushes", "pops", "stale", "dec-key", "relax", "better", "peak", "rounds", "depth")
+        col_w = 60
+        left = self.grid_origin[0] + self.grid_width // 2 - (len(headers) * col_w) // 2
+        for j, header in enumerate(headers):
+            text = self.error_font.render(header, True, (160, 170, 190))
+            self.screen.blit(text, text.get_rect(topright=(left + (j + 1) * col_w, top - 18)))
+
+        for i, (name, rec) in enumerate(alg_entries):
+            y = top + i * 19
+            counts = rec.get("counters") if rec else None
+            if name == self.ui_state.selected_algo:
+                sel_rect = pygame.Rect(left - 126, y - 2, len(headers) * col_w + 132, 18)
+                pygame.draw.rect(self.screen, (30, 50, 42), sel_rect, border_radius=6)
+            name_text = self.error_font.render(name, True, (220, 220, 240) if counts else (140, 140, 150))
+            self.screen.blit(name_text, (left - 120, y + 1))
+            if not counts or not any(counts.values()):
+                # Not solved since counting was switched on, or not instrumented (HPA*)
+                text = self.error_font.render("N/A", True, (120, 130, 140))
+                self.screen.blit(text, text.get_rect(topright=(left + col_w, y + 1)))
+                continue
+            for j, field in enumerate(COUNTER_FIELDS):
+                value = counts[field]
+                label = f"{value / 1000:.1f}k" if value >= 100000 else str(value)
+                color = (180, 210, 200) if value else (100, 110, 120)
+                text = self.error_font.render(label, True, color)
+                self.screen.blit(text, text.get_rect(topright=(left + (j + 1) * col_w, y + 1)))
+
     def draw_left_panel(self):
         """Draw left control panel"""
         panel_x = self.left_panel_x
@@ -444,6 +681,10 @@ class SPFAVisualizer:
         
         status_lines = [
             f"Current Mode - {self.ui_state.edit_mode.title()}",
+            f"Terrain Cost (keys 1-9) - {self.ui_state.terrain_cost}",
+            f"Live Solve (L) - {'On' if self.ui_state.live_solve else 'Off'}",
+            f"Counters (C) - {'On' if self.ui_state.show_counters else 'Off'}",
+            f"Profiling (P) - {self.profiling_label()}",
             f"Start Position - {self.maze_state.start if self.maze_state.start else 'Not set'}",
             f"End Position - {self.maze_state.end if self.maze_state.end else 'Not set'}",
         ]
@@ -451,7 +692,7 @@ class SPFAVisualizer:
         for i, line in enumerate(status_lines):
             color = (200, 200, 220) if line and not line.startswith("  ") else (160, 160, 180)
             text = self.error_font.render(line, True, color)
-            self.screen.blit(text, (panel_x + 20, status_y + i * 22))
+            self.screen.blit(text, (panel_x + 20, status_y + i * 19))
     
     def draw_right_panel(self):
         """Draw right algorithm panel"""
@@ -503,8 +744,17 @@ class SPFAVisualizer:
         find_rect = find_text.get_rect(center=self.ui_state.find_button.center)
         self.screen.blit(find_text, find_rect)
 
+        # Compare All button
+        compare_color = (60, 70, 90) if is_computing else (90, 110, 160)
+        compare_border = (80, 90, 110) if is_computing else (130, 150, 210)
+        pygame.draw.rect(self.screen, compare_color, self.ui_state.compare_button, border_radius=8)
+        pygame.draw.rect(self.screen, compare_border, self.ui_state.compare_button, 2, border_radius=8)
+        compare_text = self.error_font.render("Compare All", True, (255, 255, 255))
+        compare_rect = compare_text.get_rect(center=self.ui_state.compare_button.center)
+        self.screen.blit(compare_text, compare_rect)
+
         # Selected algorithm info
-        info_y = self.ui_state.find_button.bottom + 40
+        info_y = self.ui_state.compare_button.bottom + 10
         info_lines = [
             "Selected Algorithm:",
             f"  {self.ui_state.selected_algo}",
@@ -513,16 +763,41 @@ class SPFAVisualizer:
         for i, line in enumerate(info_lines):
             color = (200, 200, 220) if not line.startswith("  ") else (160, 220, 160)
             text = self.error_font.render(line, True, color)
-            self.screen.blit(text, (panel_x + 20, info_y + i * 22))
+            self.screen.blit(text, (panel_x + 20, info_y + i * 18))
+
+    def ui_stamp(self):
+        """Everything drawn outside the grid that can change without an input event"""
+        timings = self.maze_state.timings
+        profiler = self.pathfinder.profiler
+        return (self.pathfinder.is_computing, self.ui_state.error_timer > 0, self.ui_state.error_message,
+                tuple((name, id(rec)) for name, rec in timings.items()),
+                profiler.label, profiler.total, self.pathfinder.replay is None)
 
     def run(self):
-        """Main application loop"""
+        """Main application loop.
+
+        A frame after input, or after anything outside the grid changed,
+        redraws the whole window. Other frames (e.g. a playing replay)
+        repaint only the changed grid cells and the scrub bar, and update
+        just those rects on screen.
+        """
+        dt = 0
         while self.running:
-            self.handle_events()
+            had_input = self.handle_events()
             self.ui_state.update_error_timer()
-            self.draw_ui()
-            pygame.display.flip()
-            self.clock.tick(60)
+            self.pathfinder.advance_replay(dt)
+            stamp = self.ui_stamp()
+            if had_input or stamp != self._ui_stamp:
+                self.draw_ui()
+                pygame.display.flip()
+            else:
+                rects = self.grid_renderer.draw(self.screen)
+                scrub = self.draw_scrub_bar()
+                if scrub is not None:
+                    rects.append(scrub)
+                pygame.display.update(rects)
+            self._ui_stamp = stamp
+            dt = self.clock.tick(60) / 1000
         
         # Wait for computation thread to finish before closing
         if self.computing_thread and self.computing_thread.is_alive():
@@ -534,6 +809,9 @@ class SPFAVisualizer:
 
 def main():
     app = SPFAVisualizer()
+    # A trace file given on the command line is replayed on its stored maze
+    if len(sys.argv) > 1:
+        app.load_replay(sys.argv[1])
     app.run()
 
 
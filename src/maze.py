@@ -1,4 +1,8 @@
+import math
+from collections import OrderedDict
 from graph import Graph
+from tracing import EXPANDED, FRONTIER, PATH, UNSEEN, CellStates
+from zobrist import Zobrist
 import pygame
 
 class MazeVisualizer:
@@ -17,6 +21,8 @@ class MazeVisualizer:
         self.GRID_LINE = (100, 100, 120)
         self.PATH_COLOR = (100, 150, 255)
         self.INTERMEDIATE_COLOR = (255, 255, 100)  # Yellow for intermediate steps
+        self.FRONTIER_COLOR = (255, 200, 140)  # Light orange for queued, unexpanded cells
+        self.TERRAIN_COLOR = (150, 110, 60)  # Brown, blended in by terrain cost
 
         # Maze (0 = path, 1 = wall). If not provided, initialize empty.
         if maze is None:
@@ -26,6 +32,10 @@ class MazeVisualizer:
 
         self.start = start
         self.end = end if end is not None else (self.rows - 1, self.cols - 1)
+        self.costs = None  # flat per-cell terrain costs, or None for uniform cost
+        # Label font and surfaces, made on first draw (pygame.font may not be ready yet)
+        self._font = None
+        self._labels = {}
 
     def id_from_coord(self, r, c):
         return r * self.cols + c
@@ -33,10 +43,18 @@ class MazeVisualizer:
     def coord_from_id(self, id_):
         return (id_ // self.cols, id_ % self.cols)
 
-    def draw_grid(self, surface, path=None, intermediate_steps=None):
+    def draw_grid(self, surface, cells=None):
+        """Draw the maze with the search state in cells (a tracing.CellStates)"""
         ox, oy = self.grid_origin
+        state = cells.state if cells is not None else bytes(self.rows * self.cols)
 
-        # Draw grid border
+        self.draw_border(surface)
+        for r in range(self.rows):
+            for c in range(self.cols):
+                self.draw_cell(surface, r, c, state[r * self.cols + c], (ox, oy))
+
+    def draw_border(self, surface):
+        ox, oy = self.grid_origin
         border_rect = pygame.Rect(
             ox - 3, oy - 3,
             self.cols * self.cell_size + 6,
@@ -44,40 +62,58 @@ class MazeVisualizer:
         )
         pygame.draw.rect(surface, (80, 80, 100), border_rect, 3, border_radius=5)
 
-        for r in range(self.rows):
-            for c in range(self.cols):
-                # Determine cell color with priority: path > intermediate > start/end > walls/empty
-                if path and (r, c) in path:
-                    color = self.PATH_COLOR
-                elif intermediate_steps and (r, c) in intermediate_steps:
-                    color = self.INTERMEDIATE_COLOR
-                elif (r, c) == self.start:
-                    color = self.START_COLOR
-                elif (r, c) == self.end:
-                    color = self.END_COLOR
-                else:
-                    color = self.BLACK if self.maze[r][c] == 1 else self.WHITE
-
-                rect = pygame.Rect(
-                    ox + c * self.cell_size,
-                    oy + r * self.cell_size,
-                    self.cell_size,
-                    self.cell_size
-                )
-
-                pygame.draw.rect(surface, color, rect)
-                pygame.draw.rect(surface, self.GRID_LINE, rect, 1)
-                
-                # Add labels for start and end (default font)
-                font = pygame.font.SysFont(None, 20)
-                if (r, c) == self.start:
-                    text = font.render("S", True, (255, 255, 255))
-                    text_rect = text.get_rect(center=rect.center)
-                    surface.blit(text, text_rect)
-                elif (r, c) == self.end:
-                    text = font.render("E", True, (255, 255, 255))
-                    text_rect = text.get_rect(center=rect.center)
-                    surface.blit(text, text_rect)
+    def cell_color(self, r, c, shown=UNSEEN):
+        """Color of a cell with priority: path > intermediate > frontier > start/end > walls/empty"""
+        if shown == PATH:
+            return self.PATH_COLOR
+        if shown == EXPANDED:
+            return self.INTERMEDIATE_COLOR
+        if shown == FRONTIER:
+            return self.FRONTIER_COLOR
+        if (r, c) == self.start:
+            return self.START_COLOR
+        if (r, c) == self.end:
+            return self.END_COLOR
+        if self.maze[r][c] == 1:
+            return self.BLACK
+        if self.costs is not None and self.costs[r * self.cols + c] > 1:
+            return self.terrain_color(self.costs[r * self.cols + c])
+        return self.WHITE
+
+    def draw_cell(self, surface, r, c, shown, origin):
+        """Paint one cell at origin + its offset; returns its rect"""
+        rect = pygame.Rect(
+            origin[0] + c * self.cell_size,
+            origin[1] + r * self.cell_size,
+            self.cell_size,
+            self.cell_size
+        )
+        pygame.draw.rect(surface, self.cell_color(r, c, shown), rect)
+        pygame.draw.rect(surface, self.GRID_LINE, rect, 1)
+
+        # Add labels for start and end (default font)
+        if (r, c) == self.start:
+            label = self.label("S")
+        elif (r, c) == self.end:
+            label = self.label("E")
+        else:
+            return rect
+        surface.blit(label, label.get_rect(center=rect.center))
+        return rect
+
+    def label(self, text):
+        """Rendered cell label, created on first use and then reused"""
+        surf = self._labels.get(text)
+        if surf is None:
+            if self._font is None:
+                self._font = pygame.font.SysFont(None, 20)
+            surf = self._labels[text] = self._font.render(text, True, (255, 255, 255))
+        return surf
+
+    def terrain_color(self, cost):
+        """Blend from white towards brown as the cost rises (log scale up to 255)"""
+        t = min(1.0, math.log(cost) / math.log(255))
+        return tuple(int(w + (b - w) * t) for w, b in zip(self.WHITE, self.TERRAIN_COLOR))
 
     def maze_to_graph(self):
         """Convert maze to graph where white cells are nodes connected orthogonally."""
@@ -108,56 +144,211 @@ class MazeVisualizer:
         return g
 
 
+class GridRenderer:
+    """Draws a MazeVisualizer's grid from cached surfaces, repainting only changed cells.
+
+    background holds walls, terrain, start/end and grid lines. Single-cell
+    edits (MazeState.cell_edits) and endpoint moves patch just those cells,
+    and any other maze change rebuilds it. grid is the background plus the
+    search state from MazeState.cells, and each draw repaints only the
+    cells in its dirty set. draw() returns the screen rects that changed,
+    for pygame.display.update.
+    """
+    def __init__(self, viz, maze_state):
+        self.viz = viz
+        self.maze_state = maze_state
+        size = (viz.cols * viz.cell_size, viz.rows * viz.cell_size)
+        self.background = pygame.Surface(size)
+        self.grid = pygame.Surface(size)
+        self._version = None  # maze version the background shows
+        self._ends = None  # (start, end) the background shows
+
+    def draw(self, surface, border=False):
+        """Blit the grid to surface; returns the screen rects whose content changed"""
+        viz, state = self.viz, self.maze_state
+        viz.maze, viz.costs = state.maze, state.costs
+        viz.start, viz.end = state.start, state.end
+        full, dirty = state.cells.take_dirty()
+        ends = (state.start, state.end)
+        cols = viz.cols
+
+        edits = []
+        if self._version is not None and state.version != self._version:
+            edits = [(r, c) for v, r, c in state.cell_edits if v > self._version]
+        if self._version is None or len(edits) != state.version - self._version:
+            # Whole-maze change (or too many edits to patch)
+            for r in range(viz.rows):
+                for c in range(cols):
+                    viz.draw_cell(self.background, r, c, UNSEEN, (0, 0))
+            full = True
+        else:
+            if ends != self._ends:
+                edits += [cell for cell in self._ends + ends if cell is not None]
+            for r, c in edits:
+                viz.draw_cell(self.background, r, c, UNSEEN, (0, 0))
+                dirty.add(r * cols + c)
+        self._version, self._ends = state.version, ends
+
+        cells = state.cells.state
+        if full:
+            self.grid.blit(self.background, (0, 0))
+            dirty = [u for u, shown in enumerate(cells) if shown]
+        rects = []
+        for u in dirty:
+            r, c = divmod(u, cols)
+            if cells[u]:
+                rect = viz.draw_cell(self.grid, r, c, cells[u], (0, 0))
+            else:
+                rect = pygame.Rect(c * viz.cell_size, r * viz.cell_size, viz.cell_size, viz.cell_size)
+                self.grid.blit(self.background, rect, rect)
+            rects.append(rect.move(viz.grid_origin))
+
+        if border:
+            viz.draw_border(surface)  # under the cells, as draw_grid does
+        surface.blit(self.grid, viz.grid_origin)
+        if full:
+            return [self.grid.get_rect(topleft=viz.grid_origin)]
+        return rects
+
+
 class MazeState:
     """Manages the maze grid and start/end positions"""
     def __init__(self, rows, cols):
         self.rows = rows
         self.cols = cols
         self.maze = [[0 for _ in range(cols)] for _ in range(rows)]
+        # Terrain: cost (1-255) of stepping onto each cell, row-major
+        self.costs = bytearray([1]) * (rows * cols)
         self.start = None
         self.end = None
-        self.shortest_path = []
-        self.intermediate_steps = []  # Nodes explored during pathfinding
-        # Timing results for different algorithms (seconds) as dicts: {name: {"time": float, "visited": int}}
-        self.timings = {}
+        # Display state of every cell (explored, frontier, path), fed incrementally
+        self.cells = CellStates(rows * cols)
+        # Timing tables per (fingerprint, start, end), most recently used last.
+        # Each table is {name: {"time": float, "visited": int}}, see timings.
+        self._timings = OrderedDict()
+        # Bumped on every change to the maze grid so derived data (graphs) can be cached
+        self.version = 0
+        # Recent single-cell edits as (version, row, col), for incremental planners.
+        # Whole-maze changes (clear, presets) bump the version without an entry.
+        self.cell_edits = []
+        # Zobrist hash of walls and terrain, kept current on every cell edit
+        self.zobrist = Zobrist(rows * cols)
+        self.fingerprint = 0
+    
+    # Longest cell edit history kept; planners further behind start over
+    MAX_CELL_EDITS = 4096
+    # Number of (maze, start, end) timing tables remembered
+    MAX_TIMING_TABLES = 256
+    
+    @property
+    def timings(self):
+        """Timing results (seconds) for the current maze, start and end.
+
+        Results are kept per maze fingerprint instead of being discarded on
+        edits, so undoing an edit or reloading a preset brings them back.
+        """
+        key = (self.fingerprint, self.start, self.end)
+        table = self._timings.get(key)
+        if table is None:
+            table = self._timings[key] = {}
+            if len(self._timings) > self.MAX_TIMING_TABLES:
+                self._timings.popitem(last=False)
+        else:
+            self._timings.move_to_end(key)
+        return table
+    
+    @property
+    def shortest_path(self):
+        """Coordinates of the shown path"""
+        return [divmod(u, self.cols) for u in self.cells.path]
+
+    @property
+    def intermediate_steps(self):
+        """Coordinates of the explored cells (a full scan; the renderer reads cells)"""
+        return [divmod(u, self.cols) for u in self.cells.cells(EXPANDED)]
+
+    @property
+    def frontier(self):
+        """Coordinates of cells queued but not yet expanded"""
+        return [divmod(u, self.cols) for u in self.cells.cells(FRONTIER)]
+
+    def clear_results(self):
+        """Forget the shown search results (explored cells, frontier and path)"""
+        self.cells.clear()
+
+    def _log_edit(self, row, col, flip):
+        """Bump the version for a change to one cell; flip is its fingerprint delta"""
+        self.fingerprint ^= flip
+        self.version += 1
+        self.cell_edits.append((self.version, row, col))
+        if len(self.cell_edits) > self.MAX_CELL_EDITS:
+            del self.cell_edits[:len(self.cell_edits) - self.MAX_CELL_EDITS]
+    
+    def set_wall(self, row, col, value):
+        """Set a cell to wall (1) or path (0), clearing results if it changed"""
+        if 0 <= row < self.rows and 0 <= col < self.cols and self.maze[row][col] != value:
+            self.maze[row][col] = value
+            self._log_edit(row, col, self.zobrist.wall(row * self.cols + col))
+            self.clear_results()
+    
+    def set_cost(self, row, col, cost):
+        """Set the terrain cost of a cell, clearing results if it changed"""
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            i = row * self.cols + col
+            if self.costs[i] != cost:
+                flip = self.zobrist.cost(i, self.costs[i]) ^ self.zobrist.cost(i, cost)
+                self.costs[i] = cost
+                self._log_edit(row, col, flip)
+                self.clear_results()
+    
+    def is_weighted(self):
+        """True if any cell costs more than 1 to enter"""
+        return self.costs.count(1) != len(self.costs)
     
     def toggle_wall(self, row, col):
         """Toggle wall at given position"""
         if 0 <= row < self.rows and 0 <= col < self.cols:
             self.maze[row][col] = 1 - self.maze[row][col]
-            self.shortest_path = []
-            self.intermediate_steps = []
-            # When walls change, previous timings are no longer valid
-            self.timings = {}
+            self._log_edit(row, col, self.zobrist.wall(row * self.cols + col))
+            self.clear_results()
     
     def set_start(self, row, col):
         """Set start position and ensure it's not a wall"""
         if 0 <= row < self.rows and 0 <= col < self.cols:
             self.start = (row, col)
-            self.maze[row][col] = 0
-            self.shortest_path = []
-            self.intermediate_steps = []
-            # Changing start changes path validity, clear timings
-            self.timings = {}
+            if self.maze[row][col] != 0:
+                self.maze[row][col] = 0
+                self._log_edit(row, col, self.zobrist.wall(row * self.cols + col))
+            self.clear_results()
     
     def set_end(self, row, col):
         """Set end position and ensure it's not a wall"""
         if 0 <= row < self.rows and 0 <= col < self.cols:
             self.end = (row, col)
-            self.maze[row][col] = 0
-            self.shortest_path = []
-            self.intermediate_steps = []
-            # Changing end changes path validity, clear timings
-            self.timings = {}
+            if self.maze[row][col] != 0:
+                self.maze[row][col] = 0
+                self._log_edit(row, col, self.zobrist.wall(row * self.cols + col))
+            self.clear_results()
     
     def clear(self):
         """Reset maze to empty state"""
         self.maze = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+        self.costs = bytearray([1]) * (self.rows * self.cols)
+        self.version += 1
+        self.cell_edits = []
+        self.fingerprint = 0
         self.start = None
         self.end = None
-        self.shortest_path = []
-        self.intermediate_steps = []
-        self.timings = {}
+        self.clear_results()
+
+    def load(self, maze, costs=None):
+        """Replace walls and terrain at once (e.g. the maze stored in a trace file); no costs means uniform"""
+        self.maze = maze
+        self.costs = costs if costs is not None else bytearray([1]) * (self.rows * self.cols)
+        self.version += 1
+        self.cell_edits = []
+        self.fingerprint = self.zobrist.of_maze(self.maze, self.costs)
+        self.clear_results()
 
     def set_preset(self, preset_id):
         """Set the maze to one of three hard-coded presets.
@@ -216,15 +407,15 @@ class MazeState:
         ]
 
         if preset_id == 1:
-            self.maze = PRESET_1
+            self.maze = [row[:] for row in PRESET_1]
             self.start = (0, 0)
             self.end = (self.rows - 1, self.cols - 1)
         elif preset_id == 2:
-            self.maze = PRESET_2
+            self.maze = [row[:] for row in PRESET_2]
             self.start = (0, 0)
             self.end = (self.rows - 1, self.cols - 1)
         elif preset_id == 3:
-            self.maze = PRESET_3
+            self.maze = [row[:] for row in PRESET_3]
             self.start = (0, 0)
             self.end = ((self.rows - 1) // 2, (self.cols - 1) // 2)
         
@@ -232,10 +423,13 @@ class MazeState:
         else:
             raise ValueError("Unknown preset id")
 
+        self.costs = bytearray([1]) * (self.rows * self.cols)
+        self.version += 1
+        self.cell_edits = []
+        self.fingerprint = self.zobrist.of_maze(self.maze, self.costs)
+
         # Clear previous results so visualizer can compute anew
-        self.shortest_path = []
-        self.intermediate_steps = []
-        self.timings = {}
+        self.clear_results()
 
 
 class UIState:
@@ -243,6 +437,9 @@ class UIState:
     def __init__(self, left_panel_x=40, right_panel_x=1120, screen_height=1000):
         self.selected_algo = "Dijkstra"
         self.edit_mode = "wall"
+        self.terrain_cost = 5  # cost painted in terrain mode, chosen with keys 1-9
+        self.live_solve = False  # re-plan with LPA* after every edit, toggled with L
+        self.show_counters = False  # operation counters instead of timing bars, toggled with C
         self.error_message = ""
         self.error_timer = 0
         
@@ -261,9 +458,11 @@ class UIState:
              "start", "Set Start"),
             (pygame.Rect(left_x, mode_start_y + 120, button_width, button_height), 
              "end", "Set End"),
+            (pygame.Rect(left_x, mode_start_y + 180, button_width, button_height), 
+             "terrain", "Paint Terrain"),
         ]
         
-        self.clear_button = pygame.Rect(left_x, mode_start_y + 180, button_width, button_height)
+        self.clear_button = pygame.Rect(left_x, mode_start_y + 240, button_width, button_height)
 
         # Preset mazes (place these after the Clear button to avoid overlaps)
         preset_start_y = self.clear_button.bottom + 16
@@ -297,16 +496,22 @@ class UIState:
         
         
         algo_start_y = 150
+        algo_spacing = 40
+        algo_button_height = 34
+        algo_names = ["Dijkstra", "A*", "ALT", "JPS", "Bellman-Ford", "SPFA", "DFS", "BFS", "Bi-Dijkstra", "Bi-BFS",
+                      "Bit-BFS", "LPA*", "HPA*"]
         self.algo_buttons = [
-            (pygame.Rect(right_x, algo_start_y, button_width, button_height), "Dijkstra"),
-            (pygame.Rect(right_x, algo_start_y + 60, button_width, button_height), "A*"),
-            (pygame.Rect(right_x, algo_start_y + 120, button_width, button_height), "Bellman-Ford"),
-            (pygame.Rect(right_x, algo_start_y + 180, button_width, button_height), "DFS"),
-            (pygame.Rect(right_x, algo_start_y + 240, button_width, button_height), "BFS"),
+            (pygame.Rect(right_x, algo_start_y + i * algo_spacing, button_width, algo_button_height), name)
+            for i, name in enumerate(algo_names)
         ]
         
-        self.find_button = pygame.Rect(right_x, algo_start_y + 320, button_width, 55)
+        self.find_button = pygame.Rect(right_x, self.algo_buttons[-1][0].bottom + 24, button_width, 46)
+        # Times every algorithm at once in worker processes
+        self.compare_button = pygame.Rect(right_x, self.find_button.bottom + 8, button_width, 34)
     
+    # Terrain costs selectable with the number keys 1-9
+    TERRAIN_LEVELS = (1, 2, 5, 10, 20, 50, 100, 200, 255)
+
     def show_error(self, message):
         """Display error message for 3 seconds"""
         self.error_message = message
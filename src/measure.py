@@ -0,0 +1,79 @@
+"""Repeated timing runs summarized as robust statistics.
+
+A single perf_counter sample of a sub-millisecond search is mostly noise
+(allocation, cache state, the UI thread). measure() runs a callable a few
+times untimed to warm up, then times up to `repeats` runs. It stops early
+once `budget` seconds have been spent, so slow algorithms on big mazes are
+not run many times over. Peak memory comes from one extra run under
+tracemalloc, kept separate because tracing slows the timed runs down.
+"""
+import time
+import tracemalloc
+
+
+def percentile(sorted_samples, q):
+    """Linearly interpolated q-th percentile (0-100) of an ascending list"""
+    if not sorted_samples:
+        return None
+    pos = (len(sorted_samples) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_samples) - 1)
+    return sorted_samples[lo] + (sorted_samples[hi] - sorted_samples[lo]) * (pos - lo)
+
+
+def summarize(samples, visited, peak_bytes=None):
+    """Timing record for a list of samples (seconds).
+
+    "time" is the median, so code that reads only "time" gets the robust value.
+    """
+    ordered = sorted(samples)
+    median = percentile(ordered, 50)
+    return {
+        "time": median,
+        "median": median,
+        "p95": percentile(ordered, 95),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "runs": len(ordered),
+        "visited": visited,
+        "peak_bytes": peak_bytes,
+    }
+
+
+def measure(run, warmup=1, repeats=5, budget=1.0, memory=True, record=None):
+    """Time run() and return (last result, timing record).
+
+    run returns (path, visited). Warm-up runs are skipped once they alone
+    exceed the budget. record, if given, is an instrumented variant of run
+    that replaces the first warm-up run (an extra untimed run if warmup is
+    0), so instrumentation never touches the timed runs.
+    """
+    t_start = time.perf_counter()
+    if record is not None:
+        record()
+        warmup -= 1
+    for _ in range(warmup):
+        if time.perf_counter() - t_start > budget:
+            break
+        run()
+
+    samples = []
+    t_start = time.perf_counter()
+    while True:
+        t0 = time.perf_counter()
+        result = run()
+        samples.append(time.perf_counter() - t0)
+        if len(samples) >= repeats or time.perf_counter() - t_start > budget:
+            break
+
+    peak = None
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        try:
+            run()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    visited = result[1]
+    return result, summarize(samples, len(visited) if visited is not None else 0, peak)
@@ -0,0 +1,218 @@
+"""Indexed priority queues for the Dijkstra-style solvers.
+
+All backends hold node ids 0..n-1, at most once each, with the same
+interface:
+
+    push(item, key)  insert item, or lower its key if it is already queued
+    pop()            remove and return (key, item) with the smallest key
+    min_key()        smallest queued key, without removing it
+    len(q)           number of queued items
+
+Because push is a real decrease-key, no stale entries build up.
+BucketQueue and RadixHeap additionally need monotone integer keys (no
+key pushed below the last popped one), which holds for Dijkstra and for
+A* with a consistent heuristic.
+"""
+
+# Largest key spread (max edge weight, doubled for A*) served by Dial's buckets
+DIAL_MAX_SPREAD = 256
+
+
+class BucketQueue:
+    """Dial's bucket queue: a ring of max_spread + 1 buckets indexed by key."""
+    def __init__(self, n, max_spread):
+        self.size = max_spread + 1
+        self.buckets = [set() for _ in range(self.size)]
+        self.keys = [None] * n
+        self.cur = None  # smallest key that may still be queued
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def push(self, item, key):
+        old = self.keys[item]
+        if old is not None:
+            if key >= old:
+                return
+            self.buckets[old % self.size].discard(item)
+        else:
+            self.count += 1
+        if self.cur is None or key < self.cur:
+            self.cur = key
+        self.keys[item] = key
+        self.buckets[key % self.size].add(item)
+
+    def min_key(self):
+        while not self.buckets[self.cur % self.size]:
+            self.cur += 1
+        return self.cur
+
+    def pop(self):
+        key = self.min_key()
+        item = self.buckets[key % self.size].pop()
+        self.keys[item] = None
+        self.count -= 1
+        return key, item
+
+
+class RadixHeap:
+    """Monotone radix heap for non-negative integer keys.
+
+    Bucket i holds items whose key first differs from the last popped key
+    at bit i - 1, so bucket 0 holds exactly the keys equal to it. Popping
+    from an empty bucket 0 redistributes the lowest non-empty bucket.
+    """
+    def __init__(self, n):
+        self.buckets = [{} for _ in range(65)]  # {item: key}
+        self.where = [-1] * n  # bucket index of each queued item
+        self.last = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def push(self, item, key):
+        b = self.where[item]
+        if b >= 0:
+            if key >= self.buckets[b][item]:
+                return
+            del self.buckets[b][item]
+        else:
+            self.count += 1
+        if key < self.last:
+            self._rebase(key)  # min_key() moved last past the last popped key
+        b = (key ^ self.last).bit_length()
+        self.buckets[b][item] = key
+        self.where[item] = b
+
+    def _rebase(self, last):
+        """Re-bucket every queued item around a lower last key"""
+        queued = {}
+        for bucket in self.buckets:
+            queued.update(bucket)
+            bucket.clear()
+        self.last = last
+        for item, key in queued.items():
+            b = (key ^ last).bit_length()
+            self.buckets[b][item] = key
+            self.where[item] = b
+
+    def min_key(self):
+        buckets = self.buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            moved = buckets[i]
+            buckets[i] = {}
+            self.last = last = min(moved.values())
+            where = self.where
+            for item, key in moved.items():
+                b = (key ^ last).bit_length()
+                buckets[b][item] = key
+                where[item] = b
+        return self.last
+
+    def pop(self):
+        key = self.min_key()
+        item, _ = self.buckets[0].popitem()
+        self.where[item] = -1
+        self.count -= 1
+        return key, item
+
+
+class IndexedDaryHeap:
+    """4-ary min-heap with a position index for O(log n) decrease-key."""
+    D = 4
+
+    def __init__(self, n):
+        self.heap = []  # items
+        self.keys = []  # keys, parallel to heap
+        self.pos = [-1] * n
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, item, key):
+        i = self.pos[item]
+        if i < 0:
+            i = len(self.heap)
+            self.heap.append(item)
+            self.keys.append(key)
+        elif key >= self.keys[i]:
+            return
+        self._sift_up(i, item, key)
+
+    def min_key(self):
+        return self.keys[0]
+
+    def pop(self):
+        heap, keys = self.heap, self.keys
+        item, key = heap[0], keys[0]
+        self.pos[item] = -1
+        last_item, last_key = heap.pop(), keys.pop()
+        if heap:
+            self._sift_down(0, last_item, last_key)
+        return key, item
+
+    def _sift_up(self, i, item, key):
+        heap, keys, pos = self.heap, self.keys, self.pos
+        while i > 0:
+            p = (i - 1) // self.D
+            if keys[p] <= key:
+                break
+            heap[i] = heap[p]
+            keys[i] = keys[p]
+            pos[heap[i]] = i
+            i = p
+        heap[i] = item
+        keys[i] = key
+        pos[item] = i
+
+    def _sift_down(self, i, item, key):
+        heap, keys, pos = self.heap, self.keys, self.pos
+        size = len(heap)
+        while True:
+            first = self.D * i + 1
+            if first >= size:
+                break
+            best = first
+            best_key = keys[first]
+            for j in range(first + 1, min(first + self.D, size)):
+                if keys[j] < best_key:
+                    best = j
+                    best_key = keys[j]
+            if best_key >= key:
+                break
+            heap[i] = heap[best]
+            keys[i] = best_key
+            pos[heap[i]] = i
+            i = best
+        heap[i] = item
+        keys[i] = key
+        pos[item] = i
+
+
+QUEUE_BACKENDS = {"dial": BucketQueue, "radix": RadixHeap, "dary": IndexedDaryHeap}
+
+
+def choose_backend(min_weight, max_weight, integer_keys, spread=1):
+    """Pick a backend from the edge weight range.
+
+    spread is how many times the max weight one relaxation can raise a key
+    by (1 for Dijkstra, 2 for A* with a consistent heuristic).
+    """
+    if integer_keys and min_weight >= 0:
+        if max_weight * spread <= DIAL_MAX_SPREAD:
+            return "dial"
+        return "radix"
+    return "dary"
+
+
+def make_queue(backend, n, max_spread=DIAL_MAX_SPREAD):
+    if backend not in QUEUE_BACKENDS:
+        raise ValueError(f"Unknown queue backend: {backend}")
+    if backend == "dial":
+        return BucketQueue(n, max_spread)
+    return QUEUE_BACKENDS[backend](n)
@@ -0,0 +1,142 @@
+"""Opt-in profiling of solves, written as collapsed stacks for flamegraph tools.
+
+A Profiler wraps each phase of a solve in a named span. Spans nest, and
+their wall time is accumulated per stack ("solve;graph", ...). With mode
+"cprofile" the solve also runs under cProfile. With mode "sample" a
+background thread records the solving thread's Python stack every
+`interval` seconds. Each profiled solve writes collapsed-stack files to
+out_dir. That is one "frame;frame;frame weight" line per stack, the
+input format of flamegraph.pl, speedscope and inferno. Span weights are
+microseconds and sample weights are sample counts. cProfile results are
+saved as a .prof file next to it, for pstats or snakeviz.
+
+A disabled profiler costs about one function call per span.
+"""
+import cProfile
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+MODES = (None, "cprofile", "sample")
+
+
+class _Sampler(threading.Thread):
+    """Samples one thread's stack at a fixed interval."""
+    def __init__(self, thread_id, interval):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.halt = threading.Event()
+
+    def run(self):
+        while not self.halt.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+
+class Profiler:
+    """Named spans around solve phases, with optional cProfile or stack sampling."""
+    def __init__(self, mode=None, out_dir="profiles", interval=0.001):
+        if mode not in MODES:
+            raise ValueError(f"Unknown profiling mode: {mode}")
+        self.enabled = False
+        self.mode = mode
+        self.out_dir = out_dir
+        self.interval = interval  # seconds between stack samples
+        self.phases = {}  # top-level phase -> seconds, for the last solve
+        self.label = None  # label of the last solve
+        self.total = 0  # seconds of the last solve
+        self.files = []  # files written so far
+        self._stack = []
+        self._spans = Counter()  # collapsed span stack -> seconds, for the current solve
+        self._count = 0
+
+    @contextmanager
+    def span(self, name):
+        """Time the enclosed block as phase name, nested under any open span"""
+        if not self.enabled:
+            yield
+            return
+        self._stack.append(name)
+        key = ";".join(self._stack)
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            self._stack.pop()
+            self._spans[key] += elapsed
+            if len(self._stack) == 1:
+                self.phases[name] = self.phases.get(name, 0) + elapsed
+
+    @contextmanager
+    def solve(self, label):
+        """Profile one whole solve and write its files when it ends"""
+        if not self.enabled:
+            yield
+            return
+        self.phases = {}
+        self._spans.clear()
+        profile = sampler = None
+        if self.mode == "cprofile":
+            profile = cProfile.Profile()
+            profile.enable()
+        elif self.mode == "sample":
+            switch = sys.getswitchinterval()
+            # Let the sampler in as often as it wants to sample
+            sys.setswitchinterval(min(switch, self.interval))
+            sampler = _Sampler(threading.get_ident(), self.interval)
+            sampler.start()
+        try:
+            with self.span("solve"):
+                yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            if sampler is not None:
+                sampler.halt.set()
+                sampler.join()
+                sys.setswitchinterval(switch)
+            self.label = label
+            self.total = self._spans["solve"]
+            self._write(label, profile, sampler)
+
+    def collapsed(self):
+        """Span stacks of the last solve as collapsed lines, weighted by self time in microseconds"""
+        # Flamegraph tools add children into their parents, so each stack gets only
+        # the time not covered by its child spans
+        own = Counter(self._spans)
+        for key, seconds in self._spans.items():
+            parent = key.rpartition(";")[0]
+            if parent:
+                own[parent] -= seconds
+        return [f"{key} {round(seconds * 1e6)}" for key, seconds in own.items() if seconds > 0]
+
+    def _write(self, label, profile, sampler):
+        os.makedirs(self.out_dir, exist_ok=True)
+        self._count += 1
+        safe = "".join(ch if ch.isalnum() else "_" for ch in label)
+        base = os.path.join(self.out_dir, f"{self._count:04d}-{safe}")
+
+        outputs = [(base + ".spans.collapsed", self.collapsed())]
+        if sampler is not None:
+            outputs.append((base + ".sampled.collapsed",
+                            [f"{stack} {count}" for stack, count in sampler.stacks.items()]))
+        for path, lines in outputs:
+            with open(path, "w") as f:
+                f.write("\n".join(lines) + "\n")
+            self.files.append(path)
+
+        if profile is not None:
+            profile.dump_stats(base + ".prof")
+            self.files.append(base + ".prof")
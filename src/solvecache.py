@@ -0,0 +1,66 @@
+"""Bounded LRU cache of finished solves.
+
+Entries map (maze fingerprint, rows, cols, src, dst, algorithm) to a
+SolveResult. Paths and visited sets are packed into array('i') so each
+entry's size is known exactly. The least recently used entries are
+evicted once either the entry count or the total byte size is too big.
+"""
+from array import array
+from collections import OrderedDict
+
+
+class SolveResult:
+    """Path and visited node ids of one solve plus its timing record."""
+    __slots__ = ("path", "visited", "trace", "timing")
+
+    def __init__(self, path, visited, timing, trace=None):
+        self.path = array("i", path)
+        self.visited = array("i", visited)
+        self.trace = trace  # tracing.Trace of the solve, if one was recorded
+        self.timing = timing
+
+    def nbytes(self):
+        size = (len(self.path) + len(self.visited)) * 4 + 64
+        if self.trace is not None:
+            size += self.trace.nbytes()
+        return size
+
+
+class SolveCache:
+    """LRU cache bounded by entry count and total bytes."""
+    def __init__(self, max_entries=256, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        result = self.entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key, result):
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= old.nbytes()
+        size = result.nbytes()
+        if size > self.max_bytes:
+            return  # would evict everything else and still not fit
+        self.entries[key] = result
+        self.nbytes += size
+        while len(self.entries) > self.max_entries or self.nbytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes()
+
+    def clear(self):
+        self.entries.clear()
+        self.nbytes = 0
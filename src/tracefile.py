@@ -0,0 +1,241 @@
+"""Compact on-disk exploration traces, written during a solve and replayed from a memory map.
+
+Layout (little-endian):
+
+    header   magic "MZTR", version, flags, rows, cols, start, end, event
+             count, events per chunk, chunk count, index/path/meta offsets
+    maze     rows*cols wall bytes, then rows*cols cost bytes (flag MAZE)
+    chunks   events, chunk_events per chunk (the last may be shorter)
+    index    chunk count + 1 uint64 byte offsets (the last is the end of the chunks)
+    path     uint32 length, then array('I') node ids
+    meta     UTF-8 JSON (algorithm name, timing, ...)
+
+An event is one varint of (zigzag(node - previous node) << 1) | kind.
+Successive events are usually neighbouring cells, so most take one or two
+bytes instead of five. The delta restarts from 0 at every chunk, so each
+chunk is a keyframe: any one can be decoded without the ones before it,
+and the index finds it in O(1).
+
+TraceFile maps the file and decodes chunks on demand, keeping only the
+last few. Replay (tracing.py) streams the events once to build its
+first-event tables and afterwards decodes only the chunks between the old
+and new cursor on each seek, so a trace never has to fit in memory.
+"""
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+from tracing import EXPAND, PUSH
+
+MAGIC = b"MZTR"
+VERSION = 1
+FLAG_MAZE = 1
+CHUNK_EVENTS = 4096
+EXTENSION = ".mztrace"
+
+# magic, version, flags, rows, cols, start id, end id, events, chunk_events, chunks,
+# index offset, path offset, meta offset
+_HEADER = struct.Struct("<4sHHIIiiQIIQQQ")
+
+# Chunk decodes kept by a TraceFile; seeking back and forth within a few chunks stays cheap
+_CACHED_CHUNKS = 4
+
+
+def _little(values):
+    """values (an array) in file byte order; files are little-endian on every machine"""
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _encode(kinds, nodes, out):
+    """Append the varints of one chunk to the bytearray out"""
+    append = out.append
+    prev = 0
+    for kind, u in zip(kinds, nodes):
+        d = u - prev
+        prev = u
+        v = ((d << 2) if d >= 0 else ((-d << 2) - 2)) | kind
+        while v >= 0x80:
+            append((v & 0x7F) | 0x80)
+            v >>= 7
+        append(v)
+
+
+def _decode(buf, count):
+    """Decode count events from buf; returns (kinds bytearray, nodes array('I'))"""
+    kinds = bytearray(count)
+    nodes = array("I", bytes(4 * count))
+    pos = prev = 0
+    for i in range(count):
+        b = buf[pos]
+        pos += 1
+        v = b & 0x7F
+        shift = 7
+        while b & 0x80:
+            b = buf[pos]
+            pos += 1
+            v |= (b & 0x7F) << shift
+            shift += 7
+        kinds[i] = v & 1
+        z = v >> 1
+        prev += -((z + 1) >> 1) if z & 1 else z >> 1
+        nodes[i] = prev
+    return kinds, nodes
+
+
+class TraceWriter:
+    """Streams a trace to disk; has the Trace interface, so a solver can write it directly.
+
+    Only the current chunk is held in memory. finish(path) writes the
+    index, path and meta and closes the file.
+    """
+    def __init__(self, filename, rows, cols, start=-1, end=-1, maze=None, costs=None, meta=None,
+                 chunk_events=CHUNK_EVENTS):
+        self.filename = filename
+        self.rows, self.cols = rows, cols
+        self.start, self.end = start, end
+        self.meta = dict(meta or {})
+        self.chunk_events = chunk_events
+        self.count = 0
+        self.kinds = bytearray()
+        self.nodes = array("I")
+        self._offsets = array("Q")
+        self._out = bytearray()
+        self._file = open(filename, "wb")
+        self._file.write(bytes(_HEADER.size))  # patched by finish()
+        self.flags = 0
+        if maze is not None:
+            self.flags |= FLAG_MAZE
+            self._file.write(bytes(cell for row in maze for cell in row))
+            self._file.write(bytes(costs) if costs is not None else b"\x01" * (rows * cols))
+
+    def __len__(self):
+        return self.count
+
+    def expand(self, u):
+        self.kinds.append(EXPAND)
+        self.nodes.append(u)
+        if len(self.nodes) >= self.chunk_events:
+            self._flush()
+
+    def push(self, u):
+        self.kinds.append(PUSH)
+        self.nodes.append(u)
+        if len(self.nodes) >= self.chunk_events:
+            self._flush()
+
+    def expand_all(self, nodes):
+        for u in nodes:
+            self.expand(u)
+
+    def _flush(self):
+        if not self.nodes:
+            return
+        self._offsets.append(self._file.tell())
+        out = self._out
+        out.clear()
+        _encode(self.kinds, self.nodes, out)
+        self._file.write(out)
+        self.count += len(self.nodes)
+        self.kinds = bytearray()
+        self.nodes = array("I")
+
+    def finish(self, path):
+        self._flush()
+        f = self._file
+        chunks = len(self._offsets)
+        index_at = f.tell()
+        self._offsets.append(index_at)
+        f.write(_little(self._offsets).tobytes())
+        path_at = f.tell()
+        path = array("I", path)
+        f.write(struct.pack("<I", len(path)))
+        f.write(_little(path).tobytes())
+        meta_at = f.tell()
+        f.write(json.dumps(self.meta).encode())
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, self.flags, self.rows, self.cols, self.start, self.end,
+                             self.count, self.chunk_events, chunks, index_at, path_at, meta_at))
+        f.close()
+
+    def abort(self):
+        """Close without finishing (the file is left unreadable)"""
+        self._file.close()
+
+
+def write_trace(filename, trace, rows, cols, **kwargs):
+    """Save a Trace (or another TraceFile); kwargs as for TraceWriter"""
+    writer = TraceWriter(filename, rows, cols, **kwargs)
+    record = (writer.expand, writer.push)
+    for kind, u in trace.events(0, len(trace)):
+        record[kind](u)
+    writer.finish(trace.path)
+
+
+class TraceFile:
+    """Read-only, memory-mapped trace file; a Replay source like tracing.Trace."""
+    def __init__(self, filename):
+        self.filename = filename
+        with open(filename, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < _HEADER.size:
+            raise ValueError(f"{filename}: not a trace file")
+        (magic, version, self.flags, self.rows, self.cols, self.start, self.end, self.count,
+         self.chunk_events, chunks, index_at, path_at, meta_at) = _HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError(f"{filename}: not a trace file")
+        if version != VERSION:
+            raise ValueError(f"{filename}: unsupported trace version {version}")
+        self._offsets = _little(array("Q", self._map[index_at:index_at + 8 * (chunks + 1)]))
+        (length,) = struct.unpack_from("<I", self._map, path_at)
+        self.path = _little(array("I", self._map[path_at + 4:path_at + 4 + 4 * length]))
+        self.meta = json.loads(self._map[meta_at:].decode() or "{}")
+        self._chunks = {}  # chunk number -> (kinds, nodes), most recently used last
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._chunks.clear()
+        self._map.close()
+
+    def maze(self):
+        """(walls as a list of rows, costs bytearray), or None if the file has no maze"""
+        if not self.flags & FLAG_MAZE:
+            return None
+        n = self.rows * self.cols
+        walls = self._map[_HEADER.size:_HEADER.size + n]
+        maze = [list(walls[r * self.cols:(r + 1) * self.cols]) for r in range(self.rows)]
+        return maze, bytearray(self._map[_HEADER.size + n:_HEADER.size + 2 * n])
+
+    def chunk(self, i):
+        """Decoded events of chunk i as (kinds, nodes)"""
+        cached = self._chunks.pop(i, None)
+        if cached is None:
+            count = min(self.chunk_events, self.count - i * self.chunk_events)
+            cached = _decode(self._map[self._offsets[i]:self._offsets[i + 1]], count)
+            if len(self._chunks) >= _CACHED_CHUNKS:
+                del self._chunks[next(iter(self._chunks))]
+        self._chunks[i] = cached
+        return cached
+
+    def events(self, lo, hi):
+        """(kind, node) pairs of events lo..hi-1, decoding only the chunks they lie in"""
+        step = self.chunk_events
+        hi = min(hi, self.count)
+        while lo < hi:
+            i = lo // step
+            kinds, nodes = self.chunk(i)
+            base = i * step
+            end = min(hi - base, len(nodes))
+            yield from zip(kinds[lo - base:end], nodes[lo - base:end])
+            lo = base + end
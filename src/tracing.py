@@ -0,0 +1,290 @@
+"""Exploration traces recorded during a solve, and their replay.
+
+A solver given a Trace logs each node it expands and each node it pushes
+onto its frontier, one byte plus one int per event. The path is stored
+once at the end. The UI animates a solve by replaying its trace instead of
+re-running the solver with sleeps.
+
+A cell's replayed state only ever rises (unseen, frontier, expanded). So
+a Replay keeps the event index at which every cell first reached each
+state and can move its cursor to any event in either direction. It only
+revisits the cells whose events lie between the old and new positions.
+It reads events through events(lo, hi), so a memory-mapped trace file
+(tracefile.TraceFile) replays the same way as an in-memory Trace.
+
+The same expand/push/expand_all/finish calls form the solvers' visualizer
+protocol: each carries one change. CellStates applies them to a per-cell
+display buffer and remembers which cells changed since the last draw, so
+showing a solve costs time proportional to its events. CallbackAdapter
+turns them back into the old visualizer_callback(visited, path)
+snapshots for callers that still use that signature.
+"""
+import threading
+import time
+from array import array
+
+# Event kinds
+EXPAND = 0
+PUSH = 1
+
+# Replayed cell states
+UNSEEN = 0
+FRONTIER = 1
+EXPANDED = 2
+PATH = 3  # display only (CellStates)
+
+_NEVER = 2 ** 31 - 1
+
+
+class Trace:
+    """Ordered expand/push events of one solve plus its final path."""
+    def __init__(self):
+        self.kinds = bytearray()
+        self.nodes = array("i")
+        self.path = array("i")
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def expand(self, u):
+        self.kinds.append(EXPAND)
+        self.nodes.append(u)
+
+    def push(self, u):
+        self.kinds.append(PUSH)
+        self.nodes.append(u)
+
+    def expand_all(self, nodes):
+        """Log many expansions at once (solvers that only report a visited set)"""
+        nodes = array("i", nodes)
+        self.kinds.extend(bytes(len(nodes)))
+        self.nodes.extend(nodes)
+
+    def finish(self, path):
+        self.path = array("i", path)
+
+    def events(self, lo, hi):
+        """(kind, node) pairs of events lo..hi-1"""
+        return zip(self.kinds[lo:hi], self.nodes[lo:hi])
+
+    def nbytes(self):
+        return len(self.kinds) + 4 * (len(self.nodes) + len(self.path))
+
+
+class Replay:
+    """Cursor over a trace; position p shows the first p events (the path once p == len(trace))."""
+    def __init__(self, trace, n, step_time=0.05):
+        self.trace = trace
+        self.step_time = step_time  # seconds per event when playing
+        self.position = 0
+        self.playing = True
+        self._carry = 0.0  # fractional events owed by advance()
+        self.state = bytearray(n)
+        # Event index at which each cell was first pushed / expanded
+        self.first_push = array("i", [_NEVER]) * n
+        self.first_expand = array("i", [_NEVER]) * n
+        first = (self.first_expand, self.first_push)
+        for i, (kind, u) in enumerate(trace.events(0, len(trace))):
+            if first[kind][u] == _NEVER:
+                first[kind][u] = i
+
+    def __len__(self):
+        return len(self.trace)
+
+    @property
+    def done(self):
+        return self.position >= len(self.trace)
+
+    def seek(self, position):
+        """Move to position (clamped); returns the node ids whose state changed"""
+        position = max(0, min(position, len(self.trace)))
+        old = self.position
+        if position == old:
+            return []
+        lo, hi = min(old, position), max(old, position)
+        state, first_push, first_expand = self.state, self.first_push, self.first_expand
+        changed = []
+        for u in {u for _, u in self.trace.events(lo, hi)}:
+            # Events before index position are applied
+            if first_expand[u] < position:
+                new = EXPANDED
+            elif first_push[u] < position:
+                new = FRONTIER
+            else:
+                new = UNSEEN
+            if state[u] != new:
+                state[u] = new
+                changed.append(u)
+        self.position = position
+        return changed
+
+    def advance(self, dt):
+        """Play forward by dt seconds; returns the changed node ids"""
+        if not self.playing or self.done:
+            return []
+        if self.step_time <= 0:
+            return self.seek(len(self.trace))
+        self._carry += dt / self.step_time
+        steps = int(self._carry)
+        self._carry -= steps
+        return self.seek(self.position + steps)
+
+    def path(self):
+        return self.trace.path if self.done else array("i")
+
+
+class CellStates:
+    """Display state of every cell, fed one event at a time; the renderer reads it.
+
+    dirty holds the ids changed since the last take_dirty(). After
+    clear() or load(), full is set instead, because every cell may have
+    changed. The compute thread feeds events while the UI thread takes
+    the dirty set, so both sides go through lock.
+    """
+    def __init__(self, n):
+        self.state = bytearray(n)
+        self.path = []
+        self.dirty = set()
+        self.full = True
+        self.lock = threading.Lock()
+
+    def _set(self, u, new):
+        if self.state[u] != new:
+            self.state[u] = new
+            self.dirty.add(u)
+
+    def set(self, u, new):
+        with self.lock:
+            self._set(u, new)
+
+    def expand(self, u):
+        with self.lock:
+            self._set(u, EXPANDED)
+
+    def push(self, u):
+        with self.lock:
+            if self.state[u] == UNSEEN:
+                self._set(u, FRONTIER)
+
+    def expand_all(self, nodes):
+        with self.lock:
+            for u in nodes:
+                self._set(u, EXPANDED)
+
+    def _finish(self, path):
+        self.path = list(path)
+        for u in self.path:
+            self._set(u, PATH)
+
+    def finish(self, path):
+        with self.lock:
+            self._finish(path)
+
+    def _clear(self):
+        if self.path or self.state.count(UNSEEN) != len(self.state):
+            self.state[:] = bytes(len(self.state))
+            self.path = []
+            self.dirty.clear()
+            self.full = True
+
+    def clear(self):
+        with self.lock:
+            self._clear()
+
+    def load(self, state):
+        """Copy a whole state buffer (e.g. Replay.state); shows no path"""
+        with self.lock:
+            self.state[:] = state
+            self.path = []
+            self.dirty.clear()
+            self.full = True
+
+    def show(self, visited, path):
+        """Replace everything with a snapshot, as the old visualizer callback did"""
+        with self.lock:
+            self._clear()
+            for u in visited:
+                self._set(u, EXPANDED)
+            self._finish(path)
+
+    def take_dirty(self):
+        """(full, changed ids) since the last call; resets both"""
+        with self.lock:
+            full, dirty = self.full, self.dirty
+            self.full = False
+            self.dirty = set()
+        return full, dirty
+
+    def cells(self, wanted):
+        """Node ids currently in state wanted"""
+        return [u for u, s in enumerate(self.state) if s == wanted]
+
+
+class CallbackAdapter:
+    """Old visualizer_callback(visited_ids, path_ids) behind the event protocol.
+
+    Every expansion calls back with the whole visited list and sleeps for
+    delay, as the solvers used to do themselves, so a solve still costs
+    O(V^2) this way. Pass a CellStates (or any event sink) as trace instead.
+    """
+    def __init__(self, callback, delay=0):
+        self.callback = callback
+        self.delay = delay
+        self.visited = []
+        self._seen = set()
+
+    def _step(self):
+        self.callback(list(self.visited), [])
+        if self.delay > 0:
+            time.sleep(self.delay)
+
+    def expand(self, u):
+        if u not in self._seen:
+            self._seen.add(u)
+            self.visited.append(u)
+        self._step()
+
+    def push(self, u):
+        pass
+
+    def expand_all(self, nodes):
+        for u in nodes:
+            if u not in self._seen:
+                self._seen.add(u)
+                self.visited.append(u)
+        self._step()
+
+    def finish(self, path):
+        self.callback(list(self.visited), list(path))
+
+
+class _Both:
+    """Forwards every event to two sinks."""
+    def __init__(self, first, second):
+        self.first = first
+        self.second = second
+
+    def expand(self, u):
+        self.first.expand(u)
+        self.second.expand(u)
+
+    def push(self, u):
+        self.first.push(u)
+        self.second.push(u)
+
+    def expand_all(self, nodes):
+        nodes = list(nodes)
+        self.first.expand_all(nodes)
+        self.second.expand_all(nodes)
+
+    def finish(self, path):
+        self.first.finish(path)
+        self.second.finish(path)
+
+
+def with_callback(trace, visualizer_callback, delay=0):
+    """The event sink a solver reports to: trace, an adapter for an old-style callback, or both"""
+    if visualizer_callback is None:
+        return trace
+    adapter = CallbackAdapter(visualizer_callback, delay)
+    return adapter if trace is None else _Both(trace, adapter)
@@ -0,0 +1,49 @@
+"""Zobrist fingerprints of maze layouts.
+
+Every cell has a fixed random 64-bit word. A maze's fingerprint is the XOR
+of the words of its walls, plus a mixed word for every cell whose terrain
+cost is not 1. Flipping one cell XORs one word in or out, so MazeState can
+keep the fingerprint current in O(1) per edit. A cell's word is its index
+hashed with a fixed seed, computed when needed instead of stored, so a
+grid of any size costs nothing up front and the same layout always gets
+the same fingerprint.
+"""
+
+MASK64 = (1 << 64) - 1
+
+
+def _mix(x):
+    """splitmix64 finalizer"""
+    x = (x + 0x9E3779B97F4A7C15) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+
+class Zobrist:
+    """Per-cell random words for an n-cell grid."""
+    def __init__(self, n, seed=0x5EED):
+        self.n = n
+        self.seed = seed
+
+    def wall(self, i):
+        """Word toggled when cell i becomes or stops being a wall"""
+        return _mix(self.seed ^ i)
+
+    def cost(self, i, cost):
+        """Word contributed by cell i having the given terrain cost (0 for cost 1)"""
+        return _mix(_mix(self.seed ^ i) ^ cost) if cost != 1 else 0
+
+    def of_maze(self, maze, costs):
+        """Fingerprint of a whole maze, computed from scratch"""
+        h = 0
+        seed = self.seed
+        cols = len(maze[0]) if maze else 0
+        for r, row in enumerate(maze):
+            for c, cell in enumerate(row):
+                if cell:
+                    h ^= _mix(seed ^ (r * cols + c))
+        for i, cost in enumerate(costs):
+            if cost != 1:
+                h ^= self.cost(i, cost)
+        return h
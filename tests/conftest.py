@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The modules in src/ import each other by bare name
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
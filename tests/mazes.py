@@ -0,0 +1,57 @@
+"""Random test mazes, a plain Dijkstra reference and a path checker."""
+import heapq
+
+
+def random_maze(rows, cols, rng, density=0.3, max_cost=1):
+    """(maze rows, flat costs bytearray) with about density walls"""
+    maze = [[1 if rng.random() < density else 0 for _ in range(cols)] for _ in range(rows)]
+    costs = bytearray(rng.randint(1, max_cost) for _ in range(rows * cols))
+    return maze, costs
+
+
+def neighbors(maze, u):
+    rows, cols = len(maze), len(maze[0])
+    r, c = divmod(u, cols)
+    for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+        if 0 <= nr < rows and 0 <= nc < cols and not maze[nr][nc]:
+            yield nr * cols + nc
+
+
+def reference(maze, costs, src, dst):
+    """Cost of the cheapest src -> dst path (entering a cell costs its cost), or None"""
+    cols = len(maze[0])
+    if maze[src // cols][src % cols] or maze[dst // cols][dst % cols]:
+        return None
+    dist = {src: 0}
+    pq = [(0, src)]
+    while pq:
+        d, u = heapq.heappop(pq)
+        if u == dst:
+            return d
+        if d > dist[u]:
+            continue
+        for v in neighbors(maze, u):
+            nd = d + costs[v]
+            if nd < dist.get(v, nd + 1):
+                dist[v] = nd
+                heapq.heappush(pq, (nd, v))
+    return None
+
+
+def path_cost(maze, costs, path, src, dst):
+    """Cost of path after checking it runs src -> dst through adjacent open cells"""
+    assert path[0] == src and path[-1] == dst
+    for u, v in zip(path, path[1:]):
+        assert v in set(neighbors(maze, u)), f"{u} -> {v} is not a step between open cells"
+    return sum(costs[v] for v in path[1:])
+
+
+def query_pairs(maze, rng, count):
+    """Random (src, dst) node ids, open or walled, plus a walled start and a walled goal"""
+    rows, cols = len(maze), len(maze[0])
+    pairs = [(rng.randrange(rows * cols), rng.randrange(rows * cols)) for _ in range(count)]
+    walls = [r * cols + c for r in range(rows) for c in range(cols) if maze[r][c]]
+    open_ = [r * cols + c for r in range(rows) for c in range(cols) if not maze[r][c]]
+    if walls and open_:
+        pairs += [(rng.choice(walls), rng.choice(open_)), (rng.choice(open_), rng.choice(walls))]
+    return pairs
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from hpa import HPAStar
+from mazes import path_cost, query_pairs, random_maze, reference
+
+
+def ratios(hpa, maze, costs, pairs):
+    """Path cost / optimal cost of every reachable query, checking each path on the way"""
+    out = []
+    for src, dst in pairs:
+        best = reference(maze, costs, src, dst)
+        path, _ = hpa.search(src, dst)
+        if best is None:
+            assert path == [], f"path {src} -> {dst} where there is none"
+            continue
+        assert path, f"no path {src} -> {dst}"
+        cost = path_cost(maze, costs, path, src, dst)
+        assert cost >= best
+        if best:
+            out.append(cost / best)
+    return out
+
+
+@pytest.mark.parametrize("size", [4, 5, 8, 16])
+def test_paths_are_valid_and_near_optimal(size):
+    rng = random.Random(size)
+    found = []
+    for max_cost in (1, 1, 5):
+        for density in (0.1, 0.25, 0.35):
+            maze, costs = random_maze(rng.randint(10, 40), rng.randint(10, 40), rng, density, max_cost)
+            found += ratios(HPAStar.from_maze(maze, costs, size), maze, costs, query_pairs(maze, rng, 20))
+    # Near-optimal, not optimal: on these mazes the mean overhead is 2-11% and the worst
+    # query (a short route detoured through a cluster entrance) costs up to twice the best
+    assert sum(found) / len(found) < 1.15
+    assert max(found) <= 3
+
+
+def test_edits_match_a_fresh_abstraction():
+    rng = random.Random(21)
+    rows, cols = 30, 30
+    maze, costs = random_maze(rows, cols, rng, 0.25, 3)
+    hpa = HPAStar.from_maze(maze, costs, 8)
+    pairs = query_pairs(maze, rng, 10)
+    for _ in range(30):
+        for _ in range(5):
+            u = rng.randrange(rows * cols)
+            r, c = divmod(u, cols)
+            if rng.random() < 0.7:
+                maze[r][c] = 1 - maze[r][c]
+            else:
+                costs[u] = rng.randint(1, 3)
+            hpa.update_cell(u, maze[r][c], costs[u])
+        fresh = HPAStar.from_maze(maze, costs, 8)
+        for src, dst in pairs:
+            path, _ = hpa.search(src, dst)
+            expected, _ = fresh.search(src, dst)
+            assert bool(path) == bool(expected) == (reference(maze, costs, src, dst) is not None)
+            if path:
+                assert path_cost(maze, costs, path, src, dst) == path_cost(maze, costs, expected, src, dst)
+
+
+def test_clusters_are_built_lazily():
+    maze = [[0] * 64 for _ in range(64)]
+    hpa = HPAStar.from_maze(maze, None, 16)
+    path, _ = hpa.search(0, 1)
+    assert path == [0, 1]
+    assert hpa.built < hpa.cluster_rows * hpa.cluster_cols
@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from algorithms import PathFinder
+from lpastar import LPAStar
+from maze import MazeState, MazeVisualizer
+from mazes import path_cost, random_maze, reference
+
+
+def check_plan(planner, maze, costs):
+    best = reference(maze, costs, planner.start, planner.goal)
+    path = planner.path()
+    if best is None:
+        assert path == []
+    else:
+        assert path_cost(maze, costs, path, planner.start, planner.goal) == best
+
+
+@pytest.mark.parametrize("max_cost", [1, 9])
+def test_repair_after_random_edits_matches_fresh_solve(max_cost):
+    rng = random.Random(max_cost)
+    rows, cols = 14, 18
+    for _ in range(5):
+        maze, costs = random_maze(rows, cols, rng, 0.25, max_cost)
+        start, goal = rng.randrange(rows * cols), rng.randrange(rows * cols)
+        planner = LPAStar.from_maze(maze, costs, start, goal)
+        planner.compute()
+        check_plan(planner, maze, costs)
+        for _ in range(40):
+            # Walls and terrain anywhere, the start and goal cells included
+            u = rng.randrange(rows * cols)
+            r, c = divmod(u, cols)
+            if rng.random() < 0.7:
+                maze[r][c] = 1 - maze[r][c]
+            else:
+                costs[u] = rng.randint(1, max_cost)
+            planner.update_cell(u, maze[r][c], costs[u])
+            planner.compute()
+            check_plan(planner, maze, costs)
+            fresh = LPAStar.from_maze(maze, costs, start, goal)
+            fresh.compute()
+            assert planner.g[goal] == fresh.g[goal]
+
+
+def test_repair_expands_less_than_a_fresh_solve():
+    rng = random.Random(3)
+    maze, costs = random_maze(40, 40, rng, 0.2)
+    maze[0][0] = maze[39][39] = 0
+    planner = LPAStar.from_maze(maze, costs, 0, 40 * 40 - 1)
+    first = planner.compute()
+    # A wall far from the route leaves the plan as it is
+    maze[0][39] = 1 - maze[0][39]
+    planner.update_cell(39, maze[0][39], costs[39])
+    assert planner.compute() < first
+    check_plan(planner, maze, costs)
+
+
+def test_live_replan_follows_maze_state_edits():
+    rng = random.Random(8)
+    rows, cols = 12, 12
+    maze, costs = random_maze(rows, cols, rng, 0.25)
+    state = MazeState(rows, cols)
+    state.load(maze, costs)
+    state.set_start(0, 0)
+    state.set_end(rows - 1, cols - 1)
+    finder = PathFinder(MazeVisualizer(rows=rows, cols=cols, maze=state.maze), state)
+    planner = None
+    for _ in range(60):
+        r, c = rng.randrange(rows), rng.randrange(cols)
+        if (r, c) not in (state.start, state.end):
+            state.toggle_wall(r, c)
+        finder.live_replan()
+        assert planner is None or finder.planner is planner  # repaired, not rebuilt
+        planner = finder.planner
+        best = reference(state.maze, state.costs, 0, rows * cols - 1)
+        path = [r * cols + c for r, c in state.shortest_path]
+        if best is None:
+            assert path == []
+        else:
+            assert path_cost(state.maze, state.costs, path, 0, rows * cols - 1) == best
@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from pqueue import DIAL_MAX_SPREAD, QUEUE_BACKENDS, choose_backend, make_queue
+
+
+@pytest.mark.parametrize("backend", sorted(QUEUE_BACKENDS))
+def test_push_decrease_key_pop_order(backend):
+    rng = random.Random(backend)
+    n = 300
+    for spread in (1, 7, DIAL_MAX_SPREAD):
+        queue = make_queue(backend, n)
+        queued = {}  # item -> key, the reference
+        last = 0  # keys stay monotone: nothing below the last popped key, as in Dijkstra
+        for _ in range(5000):
+            if queued and rng.random() < 0.35:
+                key, item = queue.pop()
+                assert key == min(queued.values()) == queued.pop(item)
+                assert key >= last
+                last = key
+            else:
+                item = rng.randrange(n)
+                key = last + rng.randint(0, spread)
+                queue.push(item, key)  # a new item, a decrease-key, or an ignored increase
+                queued[item] = min(key, queued.get(item, key))
+            assert len(queue) == len(queued)
+            if queued:
+                assert queue.min_key() == min(queued.values())
+        while queued:
+            key, item = queue.pop()
+            assert key == min(queued.values()) == queued.pop(item)
+        assert len(queue) == 0
+
+
+@pytest.mark.parametrize("backend", sorted(QUEUE_BACKENDS))
+def test_popped_item_can_be_pushed_again(backend):
+    queue = make_queue(backend, 4)
+    queue.push(2, 5)
+    assert queue.pop() == (5, 2)
+    queue.push(2, 6)
+    queue.push(1, 6)
+    queue.push(2, 7)  # above its queued key: ignored
+    assert sorted([queue.pop(), queue.pop()]) == [(6, 1), (6, 2)]
+
+
+def test_dary_heap_takes_fractional_and_unordered_keys():
+    rng = random.Random(4)
+    queue = make_queue("dary", 100)
+    keys = {}
+    for item in range(100):
+        keys[item] = rng.uniform(-5, 5)
+        queue.push(item, keys[item])
+    for item in rng.sample(range(100), 30):
+        keys[item] -= rng.uniform(0, 3)
+        queue.push(item, keys[item])
+    popped = [queue.pop() for _ in range(100)]
+    assert popped == sorted((key, item) for item, key in keys.items())
+
+
+def test_choose_backend():
+    assert choose_backend(1, 1, True) == "dial"
+    assert choose_backend(1, DIAL_MAX_SPREAD // 2, True, spread=2) == "dial"
+    assert choose_backend(1, DIAL_MAX_SPREAD, True, spread=2) == "radix"
+    assert choose_backend(0.5, 2.5, False) == "dary"
+    assert choose_backend(-1, 3, True) == "dary"
+    with pytest.raises(ValueError):
+        make_queue("fibonacci", 4)
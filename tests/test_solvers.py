@@ -0,0 +1,124 @@
+import random
+
+import pytest
+
+from algorithms import PathFinder, SPFA_Algorithms
+from graph import GridGraph
+from jps import JumpTable
+from maze import MazeState, MazeVisualizer
+from mazes import path_cost, query_pairs, random_maze, reference
+
+EXACT = [name for name in PathFinder.ALGORITHMS if name not in ("HPA*", "DFS")]  # HPA*: see test_hpa
+UNWEIGHTED = ("BFS", "Bi-BFS", "Bit-BFS")  # every step counts as 1, whatever the terrain
+
+
+def make_finder(maze, costs, backend="csr", **settings):
+    rows, cols = len(maze), len(maze[0])
+    state = MazeState(rows, cols)
+    state.load(maze, costs)
+    finder = PathFinder(MazeVisualizer(rows=rows, cols=cols, maze=state.maze), state, backend)
+    finder.timing_warmup, finder.timing_repeats, finder.measure_memory = 0, 1, False
+    for name, value in settings.items():
+        setattr(finder, name, value)
+    return finder
+
+
+def solve(finder, name, src, dst):
+    state = finder.maze_state
+    # Set directly rather than with set_start/set_end, which would open a walled cell
+    state.start, state.end = divmod(src, state.cols), divmod(dst, state.cols)
+    path, _, _ = finder.time_algorithm(name, state.rows * state.cols, finder.get_graph(), src, dst)
+    return path
+
+
+def check_against_reference(finder, name, maze, costs, pairs, shortest=True):
+    measure = bytearray([1]) * len(costs) if name in UNWEIGHTED else costs
+    for src, dst in pairs:
+        best = reference(maze, measure, src, dst)
+        path = solve(finder, name, src, dst)
+        if best is None:
+            assert not path, f"{name}: path {src} -> {dst} where there is none"
+        else:
+            assert path, f"{name}: no path {src} -> {dst}"
+            cost = path_cost(maze, measure, path, src, dst)
+            assert cost == best or not shortest, f"{name}: {src} -> {dst} not shortest"
+
+
+@pytest.mark.parametrize("backend", ["csr", "grid"])
+@pytest.mark.parametrize("name", EXACT)
+def test_unit_cost_solvers_match_dijkstra(name, backend):
+    rng = random.Random(f"{name}-{backend}")
+    for rows, cols, density in ((12, 12, 0.2), (15, 23, 0.35), (1, 9, 0.1)):
+        maze, costs = random_maze(rows, cols, rng, density)
+        finder = make_finder(maze, costs, backend)
+        check_against_reference(finder, name, maze, costs, query_pairs(maze, rng, 25))
+
+
+@pytest.mark.parametrize("backend", ["csr", "grid"])
+@pytest.mark.parametrize("name", [name for name in EXACT if name != "JPS"])
+def test_weighted_solvers_match_dijkstra(name, backend):
+    rng = random.Random(f"{name}-{backend}-weighted")
+    for max_cost in (5, 200):
+        maze, costs = random_maze(14, 17, rng, 0.25, max_cost)
+        finder = make_finder(maze, costs, backend)
+        check_against_reference(finder, name, maze, costs, query_pairs(maze, rng, 25))
+
+
+@pytest.mark.parametrize("settings", [
+    {"use_jps_plus": True},
+    {"vectorized_bellman_ford": False},
+    {"spfa_slf": False, "spfa_lll": True},
+    {"spfa_slf": True, "spfa_lll": True},
+    {"alt_landmarks": 1},
+])
+def test_solver_settings_match_dijkstra(settings):
+    rng = random.Random(7)
+    names = {"use_jps_plus": "JPS", "vectorized_bellman_ford": "Bellman-Ford", "alt_landmarks": "ALT"}
+    name = names.get(next(iter(settings)), "SPFA")
+    maze, costs = random_maze(16, 16, rng, 0.3)
+    check_against_reference(make_finder(maze, costs, **settings), name, maze, costs, query_pairs(maze, rng, 30))
+
+
+@pytest.mark.parametrize("backend", ["csr", "grid"])
+def test_dfs_finds_a_path_when_there_is_one(backend):
+    rng = random.Random(11)
+    for max_cost in (1, 9):
+        maze, costs = random_maze(13, 13, rng, 0.3, max_cost)
+        finder = make_finder(maze, costs, backend)
+        check_against_reference(finder, "DFS", maze, costs, query_pairs(maze, rng, 25), shortest=False)
+
+
+@pytest.mark.parametrize("jump_table", [False, True])
+def test_jps_walled_endpoints_have_no_path(jump_table):
+    rng = random.Random(5)
+    maze, costs = random_maze(12, 12, rng, 0.3)
+    grid = GridGraph.from_maze(maze)
+    table = JumpTable(grid) if jump_table else None
+    for src, dst in query_pairs(maze, rng, 40):
+        path, _ = SPFA_Algorithms.jump_point_search(grid, src, dst, jump_table=table, delay=0)
+        best = reference(maze, costs, src, dst)
+        assert (len(path) - 1 if path else None) == best
+
+
+def test_jps_rejects_terrain():
+    maze, costs = random_maze(6, 6, random.Random(1), 0.0, max_cost=3)
+    costs[0] = 2
+    with pytest.raises(ValueError):
+        solve(make_finder(maze, costs), "JPS", 0, 35)
+
+
+@pytest.mark.parametrize("name", PathFinder.ALGORITHMS)
+def test_counters_are_filled_in(name):
+    maze, costs = random_maze(20, 20, random.Random(7), 0.0)
+    finder = make_finder(maze, costs, count_operations=True)
+    state = finder.maze_state
+    state.start, state.end = (0, 0), (19, 19)
+    path, _, timing = finder.time_algorithm(name, 400, finder.get_graph(), 0, 399)
+    counts = timing["counters"]
+    assert path and counts["peak_frontier"] > 0
+    if name != "Bellman-Ford":  # sweeps every edge each round, no queue
+        assert counts["pushes"] > 0 and counts["pushes"] >= counts["improved"]
+    if name not in ("Bellman-Ford", "Bit-BFS", "DFS"):  # DFS never backtracks on an open grid
+        assert counts["pops"] > 0
+    if name != "Bit-BFS":  # expands whole layers at once
+        assert counts["relaxations"] > 0
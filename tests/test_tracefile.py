@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from tracefile import TraceFile, TraceWriter, write_trace
+from tracing import EXPAND, PUSH, Replay, Trace
+
+
+def random_events(rng, count, n):
+    """Mostly neighbouring cells, with the odd long jump in either direction"""
+    events, u = [], rng.randrange(n)
+    for _ in range(count):
+        if rng.random() < 0.1:
+            u = rng.randrange(n)
+        else:
+            u = min(n - 1, max(0, u + rng.choice((-1, 1, -97, 97))))
+        events.append((rng.choice((EXPAND, PUSH)), u))
+    return events
+
+
+@pytest.mark.parametrize("count,chunk_events", [(0, 16), (1, 16), (16, 16), (17, 16), (5000, 64), (3000, 4096)])
+def test_writer_reader_round_trip(tmp_path, count, chunk_events):
+    rng = random.Random(count)
+    rows, cols = 97, 300  # node ids past 2**14, so deltas take up to three varint bytes
+    n = rows * cols
+    events = random_events(rng, count, n)
+    path = [rng.randrange(n) for _ in range(rng.randint(0, 50))]
+    maze = [[rng.randint(0, 1) for _ in range(cols)] for _ in range(rows)]
+    costs = bytearray(rng.randint(1, 255) for _ in range(n))
+    meta = {"algorithm": "A*", "timing": {"time": 0.5}}
+
+    filename = tmp_path / "case.mztrace"
+    writer = TraceWriter(filename, rows, cols, start=3, end=n - 1, maze=maze, costs=costs, meta=meta,
+                         chunk_events=chunk_events)
+    for kind, u in events:
+        (writer.expand if kind == EXPAND else writer.push)(u)
+    writer.finish(path)
+
+    with TraceFile(filename) as trace:
+        assert (trace.rows, trace.cols, trace.start, trace.end) == (rows, cols, 3, n - 1)
+        assert len(trace) == count
+        assert list(trace.events(0, count)) == events
+        assert list(trace.path) == path
+        assert trace.meta == meta
+        assert trace.maze() == (maze, costs)
+        # Any window decodes only its own chunks, in either order
+        for _ in range(20):
+            lo = rng.randint(0, count)
+            hi = rng.randint(lo, count + 5)
+            assert list(trace.events(lo, hi)) == events[lo:hi]
+
+
+def test_write_trace_copies_a_trace_and_a_trace_file(tmp_path):
+    rng = random.Random(2)
+    trace = Trace()
+    for kind, u in random_events(rng, 2000, 400):
+        (trace.expand if kind == EXPAND else trace.push)(u)
+    trace.finish([1, 2, 3])
+    write_trace(tmp_path / "a.mztrace", trace, 20, 20, chunk_events=100)
+    with TraceFile(tmp_path / "a.mztrace") as first:
+        assert first.maze() is None
+        write_trace(tmp_path / "b.mztrace", first, 20, 20)
+    with TraceFile(tmp_path / "b.mztrace") as second:
+        assert list(second.events(0, len(second))) == list(trace.events(0, len(trace)))
+        assert list(second.path) == [1, 2, 3]
+
+
+def test_replay_from_file_matches_replay_from_memory(tmp_path):
+    rng = random.Random(3)
+    trace = Trace()
+    for kind, u in random_events(rng, 3000, 900):
+        (trace.expand if kind == EXPAND else trace.push)(u)
+    trace.finish([5, 6])
+    write_trace(tmp_path / "r.mztrace", trace, 30, 30, chunk_events=128)
+    with TraceFile(tmp_path / "r.mztrace") as stored:
+        memory, mapped = Replay(trace, 900), Replay(stored, 900)
+        for position in [3000, 17, 2500, 0, 1280, 3000]:
+            assert memory.seek(position) == mapped.seek(position)
+            assert memory.state == mapped.state
+
+
+def test_rejects_other_files(tmp_path):
+    bad = tmp_path / "bad.mztrace"
+    bad.write_bytes(b"not a trace file, just some bytes to fill the header" * 2)
+    with pytest.raises(ValueError):
+        TraceFile(bad)